@@ -0,0 +1,99 @@
+"""Compare the compression codecs on serialized objects: size, throughput and load latency
+
+    python scripts/benchmark_compression.py -n 1000
+    python scripts/benchmark_compression.py --storage-path /dataclay/storage/<backend_id>
+
+With --storage-path, the objects stored by a backend are used instead of synthetic ones.
+"""
+
+import argparse
+import random
+import string
+import time
+
+from dataclay.backend.storage import LogStorage
+from dataclay.utils import pickle as dcpickle
+from dataclay.utils.compression import CODECS, compress, decompress, get_codec
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--number", type=int, default=1000, help="objects of each dataset")
+parser.add_argument("--storage-path", help="read the objects stored by a backend (log engine)")
+args = parser.parse_args()
+
+
+def person():
+    name = "".join(random.choices(string.ascii_letters, k=10))
+    return {"name": name, "age": random.randint(0, 100), "email": f"{name}@example.com"}
+
+
+def synthetic_datasets():
+    words = [
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(2, 9))) for _ in range(500)
+    ]
+    datasets = {
+        "people": [{"people": [person() for _ in range(100)]} for _ in range(args.number)],
+        "lists": [{"values": list(range(i, i + 2000))} for i in range(args.number)],
+        "text": [{"text": " ".join(random.choices(words, k=2000))} for _ in range(args.number)],
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        return datasets
+
+    number = max(args.number // 10, 1)
+    datasets["zeros"] = [{"array": np.zeros(64 * 1024)} for _ in range(number)]
+    datasets["random"] = [{"array": np.random.rand(64 * 1024)} for _ in range(number)]
+    return datasets
+
+
+def stored_datasets():
+    storage = LogStorage(args.storage_path)
+    try:
+        # NOTE: The stored objects may be already compressed
+        objects = []
+        for object_id in list(storage.index)[: args.number]:
+            data, buffers = storage.get_with_buffers(object_id)
+            objects.append(dcpickle.loads(decompress(data), buffers))
+    finally:
+        storage.close()
+    return {"stored": objects}
+
+
+datasets = stored_datasets() if args.storage_path else synthetic_datasets()
+
+print(
+    f"{'dataset':<10}{'codec':<8}{'MiB':>10}{'ratio':>8}{'comp MiB/s':>12}"
+    f"{'load (us)':>12}{'raw load (us)':>15}"
+)
+for dataset, objects in datasets.items():
+    serialized = [dcpickle.dumps(o) for o in objects]
+    size = sum(len(data) for data in serialized)
+
+    start = time.perf_counter()
+    for data in serialized:
+        dcpickle.loads(data)
+    raw_load_time = (time.perf_counter() - start) / len(serialized)
+
+    for name in ["none", *CODECS]:
+        try:
+            codec = get_codec(name)
+        except ImportError as e:
+            print(f"{dataset:<10}{name:<8} skipped: {e}")
+            continue
+
+        start = time.perf_counter()
+        compressed = [compress(data, codec) for data in serialized]
+        compress_time = time.perf_counter() - start
+        compressed_size = sum(len(data) for data in compressed)
+
+        start = time.perf_counter()
+        for data in compressed:
+            dcpickle.loads(decompress(data))
+        load_time = (time.perf_counter() - start) / len(compressed)
+
+        # NOTE: The compressed size is also the bytes sent with TRANSFER_COMPRESSION
+        print(
+            f"{dataset:<10}{name:<8}{compressed_size / 2**20:>10.2f}"
+            f"{size / compressed_size:>8.2f}{size / 2**20 / compress_time:>12.0f}"
+            f"{load_time * 1e6:>12.1f}{raw_load_time * 1e6:>15.1f}"
+        )
@@ -0,0 +1,81 @@
+"""Compare the hit ratio and the overhead of the HeapManager eviction policies
+
+Simulates a heap that holds up to --capacity objects. Like the HeapManager, when the
+heap is full the victims of the policy are unloaded until the heap is at --ease
+fraction of the capacity. The workload mixes accesses to a skewed (zipf-like) hot set
+with sequential scans over cold objects, which is the case where plain LRU suffers.
+
+    python scripts/benchmark_eviction.py --capacity 10000 --objects 100000
+"""
+
+import argparse
+import bisect
+import itertools
+import random
+import time
+import uuid
+
+from dataclay.backend.eviction import EVICTION_POLICIES, new_eviction_policy
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--number", type=int, default=1000000, help="number of accesses")
+parser.add_argument("--objects", type=int, default=100000, help="number of objects")
+parser.add_argument("--capacity", type=int, default=10000, help="max loaded objects")
+parser.add_argument("--ease", type=float, default=0.9, help="fraction to unload down to")
+parser.add_argument("--hot", type=int, default=5000, help="size of the hot set")
+parser.add_argument("--scan", type=float, default=0.2, help="fraction of scan accesses")
+parser.add_argument("--scan-length", type=int, default=20000, help="objects per scan")
+parser.add_argument("--skew", type=float, default=1.0, help="zipf exponent of the hot set")
+parser.add_argument("--seed", type=int, default=0)
+args = parser.parse_args()
+
+
+def workload():
+    rng = random.Random(args.seed)
+    object_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(args.objects)]
+    hot, cold = object_ids[: args.hot], object_ids[args.hot :]
+
+    weights = list(itertools.accumulate(1 / (i + 1) ** args.skew for i in range(len(hot))))
+    total = weights[-1]
+
+    # Each round is a scan followed by hot accesses, in the proportion given by --scan
+    hot_length = int(args.scan_length * (1 - args.scan) / args.scan)
+    accesses = []
+    while len(accesses) < args.number:
+        start = rng.randrange(len(cold) - args.scan_length)
+        accesses.extend(cold[start : start + args.scan_length])
+        for _ in range(hot_length):
+            accesses.append(hot[bisect.bisect(weights, rng.random() * total)])
+    return accesses[: args.number]
+
+
+def simulate(name, accesses):
+    policy = new_eviction_policy(name)
+    loaded = set()
+    low_watermark = int(args.capacity * args.ease)
+    hits = 0
+
+    start = time.perf_counter()
+    for object_id in accesses:
+        if object_id in loaded:
+            hits += 1
+        else:
+            loaded.add(object_id)
+            policy.add(object_id)
+            if len(loaded) > args.capacity:
+                for victim in policy.victims():
+                    loaded.discard(victim)
+                    policy.remove(victim, evicted=True)
+                    if len(loaded) <= low_watermark:
+                        break
+        policy.access(object_id)
+    elapsed = time.perf_counter() - start
+
+    return hits / len(accesses), len(accesses) / elapsed
+
+
+accesses = workload()
+print(f"{'policy':<8}{'hit ratio':>12}{'accesses/s':>14}")
+for name in EVICTION_POLICIES:
+    hit_ratio, throughput = simulate(name, accesses)
+    print(f"{name:<8}{hit_ratio:>12.3f}{throughput:>14.0f}")
@@ -0,0 +1,61 @@
+"""Measure flush_all (as done at shutdown) and checkpoint of a heap with many objects
+
+    python scripts/benchmark_flush.py -n 100000 --workers 1 8
+    STORAGE_COMPRESSION=zstd python scripts/benchmark_flush.py -n 100000
+
+The objects are proxies of the modeltest Person class, not backed by a running backend.
+"""
+
+import argparse
+import shutil
+import time
+
+from dataclay.backend.heapmanager import HeapManager
+from dataclay.backend.storage import new_storage_engine
+from dataclay.conf import settings
+from dataclay.contrib.modeltest.family import Person
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--number", type=int, default=100000, help="number of objects")
+parser.add_argument("--size", type=int, default=1000, help="bytes of the name of each person")
+parser.add_argument("--workers", type=int, nargs="+", default=[1, settings.MEMMGMT_FLUSH_WORKERS])
+parser.add_argument("--path", default="/tmp/dataclay-flush", help="directory to store them")
+args = parser.parse_args()
+
+
+def load_heap(heap_manager):
+    for i in range(args.number):
+        person = Person.new_proxy_object(
+            _dc_property_name=str(i).ljust(args.size, "x"), _dc_property_age=i % 100
+        )
+        person._dc_is_loaded = True
+        heap_manager.retain_in_heap(person)
+    return list(heap_manager.loaded_objects.values())
+
+
+print(f"{'workers':>8}{'checkpoint (s)':>16}{'flush_all (s)':>15}{'objects/s':>12}")
+for workers in args.workers:
+    settings.MEMMGMT_FLUSH_WORKERS = workers
+    shutil.rmtree(args.path, ignore_errors=True)
+    storage = new_storage_engine(settings.STORAGE_ENGINE, args.path)
+    heap_manager = HeapManager(storage)
+    objects = load_heap(heap_manager)
+
+    start = time.perf_counter()
+    heap_manager.checkpoint()
+    checkpoint_time = time.perf_counter() - start
+
+    # NOTE: The checkpoint leaves the objects clean, so they are modified again
+    for person in objects:
+        person._xdc_is_dirty = True
+
+    start = time.perf_counter()
+    heap_manager.flush_all()
+    flush_time = time.perf_counter() - start
+    assert not heap_manager.loaded_objects
+
+    print(
+        f"{workers:>8}{checkpoint_time:>16.2f}{flush_time:>15.2f}{args.number / flush_time:>12.0f}"
+    )
+    storage.close()
+    shutil.rmtree(args.path)
@@ -0,0 +1,80 @@
+"""Compare the JSON and binary encodings of ObjectMetadata
+
+Measures the encode/decode throughput and, if a Redis server is given, the memory
+used per object in Redis.
+
+    python scripts/benchmark_metadata_encoding.py --redis 127.0.0.1:6379
+"""
+
+import argparse
+import json
+import timeit
+import uuid
+
+import redis
+
+from dataclay.metadata.kvdata import ObjectMetadata
+from dataclay.protos.common_messages_pb2 import LANG_PYTHON
+from dataclay.utils.json import UUIDEncoder
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--number", type=int, default=100000, help="number of objects")
+parser.add_argument("--redis", help="host:port of a Redis server to measure the memory")
+args = parser.parse_args()
+
+backend_ids = [uuid.uuid4() for _ in range(3)]
+object_mds = [
+    ObjectMetadata(
+        uuid.uuid4(),
+        None,
+        "testuser",
+        "dataclay.contrib.modeltest.family.Person",
+        backend_ids[i % 3],
+        [],
+        LANG_PYTHON,
+        False,
+    )
+    for i in range(args.number)
+]
+
+encodings = {
+    "json": (
+        lambda object_md: json.dumps(object_md.__dict__, cls=UUIDEncoder),
+        ObjectMetadata.from_json,
+    ),
+    "binary": (lambda object_md: object_md.value, ObjectMetadata.from_value),
+}
+
+print(
+    f"{'encoding':<10}{'bytes/value':>14}{'encode/s':>14}{'decode/s':>14}{'redis bytes/object':>22}"
+)
+for name, (encode, decode) in encodings.items():
+    values = [encode(object_md) for object_md in object_mds]
+    size = sum(map(len, values)) / len(values)
+
+    encode_time = timeit.timeit(lambda: [encode(object_md) for object_md in object_mds], number=1)
+    decode_time = timeit.timeit(lambda: [decode(value) for value in values], number=1)
+
+    memory = ""
+    if args.redis:
+        host, port = args.redis.split(":")
+        r_client = redis.Redis(host=host, port=int(port))
+        prefix = f"/benchmark/{name}/"
+        pipeline = r_client.pipeline(transaction=False)
+        for object_md, value in zip(object_mds, values):
+            pipeline.set(prefix + str(object_md.id), value)
+        pipeline.execute()
+
+        sample = object_mds[:1000]
+        pipeline = r_client.pipeline(transaction=False)
+        for object_md in sample:
+            pipeline.memory_usage(prefix + str(object_md.id))
+        memory = sum(pipeline.execute()) / len(sample)
+
+        for i in range(0, len(object_mds), 1000):
+            r_client.delete(*(prefix + str(object_md.id) for object_md in object_mds[i : i + 1000]))
+
+    print(
+        f"{name:<10}{size:>14.1f}{args.number / encode_time:>14.0f}"
+        f"{args.number / decode_time:>14.0f}{memory:>22}"
+    )
@@ -0,0 +1,48 @@
+"""Measure the memory and the creation time of proxies of remote objects
+
+Proxies are created like the references found when deserializing objects.
+
+    python scripts/benchmark_proxies.py -n 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+
+from dataclay.contrib.modeltest.family import Person
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--number", type=int, default=1000000, help="number of proxies")
+args = parser.parse_args()
+
+object_ids = [uuid.uuid4() for _ in range(args.number)]
+backend_id = uuid.uuid4()
+gc.collect()
+
+tracemalloc.start()
+start = time.perf_counter()
+proxies = [
+    Person.new_proxy_object(
+        _dc_id=object_id,
+        _dc_backend_id=backend_id,
+        _dc_is_local=False,
+        _dc_is_loaded=False,
+        _dc_is_registered=True,
+    )
+    for object_id in object_ids
+]
+create_time = time.perf_counter() - start
+memory, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+start = time.perf_counter()
+for proxy in proxies:
+    proxy._dc_id, proxy._dc_backend_id, proxy._dc_is_local
+access_time = time.perf_counter() - start
+
+print(f"proxies:            {args.number}")
+print(f"bytes per proxy:    {memory / args.number:.0f} (excluding the ids)")
+print(f"creation (us):      {create_time / args.number * 1e6:.2f}")
+print(f"header access (ns): {access_time / args.number * 1e9:.0f}")
@@ -0,0 +1,84 @@
+"""Measure the per-call latency of the session lookup done by the backends
+
+The lookup is measured with and without the session cache, against a Redis server.
+If a dataClay deployment is running, also measures the latency of activemethod calls
+(run it with the backends started with SESSION_CACHE_SIZE=0 to compare).
+
+    python scripts/benchmark_session_cache.py --redis 127.0.0.1:6379 --dataclay 127.0.0.1
+"""
+
+import argparse
+import statistics
+import time
+
+from dataclay.conf import settings
+from dataclay.metadata.api import MetadataAPI
+from dataclay.utils.cache import LRUCache
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--number", type=int, default=10000, help="number of calls")
+parser.add_argument("--redis", default="127.0.0.1:6379", help="host:port of the Redis server")
+parser.add_argument("--dataclay", help="host of the metadata service of a running deployment")
+parser.add_argument("--username", default="testuser")
+parser.add_argument("--password", default="s3cret")
+parser.add_argument("--dataset", default="testuser")
+args = parser.parse_args()
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    print(
+        f"{name:<28}"
+        f"{statistics.mean(latencies) * 1e6:>12.1f}"
+        f"{latencies[len(latencies) // 2] * 1e6:>12.1f}"
+        f"{latencies[int(len(latencies) * 0.99)] * 1e6:>12.1f}"
+    )
+
+
+host, port = args.redis.split(":")
+metadata_api = MetadataAPI(host, int(port))
+session = metadata_api.new_session(args.username, args.password, args.dataset)
+session_cache = LRUCache(settings.SESSION_CACHE_SIZE, settings.SESSION_CACHE_TTL)
+
+
+def cached_get_session(session_id):
+    cached_session = session_cache.get(session_id)
+    if cached_session is None:
+        cached_session = metadata_api.get_session(session_id)
+        session_cache.put(session_id, cached_session)
+    return cached_session
+
+
+print(f"{'latency (us)':<28}{'mean':>12}{'p50':>12}{'p99':>12}")
+for name, get_session in (
+    ("session lookup (no cache)", metadata_api.get_session),
+    ("session lookup (cache)", cached_get_session),
+):
+    latencies = []
+    for _ in range(args.number):
+        ref = time.perf_counter()
+        get_session(session.id)
+        latencies.append(time.perf_counter() - ref)
+    report(name, latencies)
+print("session cache:", session_cache.info())
+metadata_api.close_session(session.id)
+
+if args.dataclay:
+    import dataclay
+    from dataclay.contrib.modeltest.family import Person
+
+    client = dataclay.client(
+        host=args.dataclay, username=args.username, password=args.password, dataset=args.dataset
+    )
+    client.start()
+
+    person = Person("Marc", 24)
+    person.make_persistent()
+    latencies = []
+    for _ in range(args.number):
+        ref = time.perf_counter()
+        person.add_year()
+        latencies.append(time.perf_counter() - ref)
+    report("activemethod call", latencies)
+
+    client.stop()
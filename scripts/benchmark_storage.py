@@ -0,0 +1,54 @@
+"""Compare the storage engines of the backends storing and loading many small objects
+
+    python scripts/benchmark_storage.py --path /tmp/dataclay-storage -n 100000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import time
+import uuid
+
+from dataclay.backend.storage import STORAGE_ENGINES, new_storage_engine
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--number", type=int, default=100000, help="number of objects")
+parser.add_argument("--size", type=int, default=200, help="bytes of each object")
+parser.add_argument("--path", default="/tmp/dataclay-storage", help="directory to store them")
+args = parser.parse_args()
+
+object_ids = [uuid.uuid4() for _ in range(args.number)]
+data = os.urandom(args.size)
+
+print(f"{'engine':<8}{'put/s':>12}{'sync (s)':>10}{'get/s':>12}{'open (s)':>10}{'files':>10}")
+for name in STORAGE_ENGINES:
+    path = os.path.join(args.path, name)
+    shutil.rmtree(path, ignore_errors=True)
+    storage = new_storage_engine(name, path)
+
+    start = time.perf_counter()
+    for object_id in object_ids:
+        storage.put(object_id, data)
+    put_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    storage.sync()
+    sync_time = time.perf_counter() - start
+
+    random.shuffle(object_ids)
+    start = time.perf_counter()
+    for object_id in object_ids:
+        storage.get(object_id)
+    get_time = time.perf_counter() - start
+    storage.close()
+
+    start = time.perf_counter()
+    new_storage_engine(name, path).close()
+    open_time = time.perf_counter() - start
+
+    print(
+        f"{name:<8}{args.number / put_time:>12.0f}{sync_time:>10.3f}"
+        f"{args.number / get_time:>12.0f}{open_time:>10.3f}{len(os.listdir(path)):>10}"
+    )
+    shutil.rmtree(path)
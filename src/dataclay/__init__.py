@@ -1,8 +1,8 @@
 """
 Public dataclay functions exported to use (friendly) "from dataclay import ..."
 """
-from dataclay.client.api import client
-from dataclay.dataclay_object import DataClayObject, activemethod
+from dataclay.client.api import async_client, client
+from dataclay.dataclay_object import DataClayObject, activemethod, batch, map_active
 
 # from dataclay.client import api
 
@@ -8,6 +8,7 @@ import pickle
 import time
 import traceback
 import uuid
+from collections.abc import Generator
 from typing import TYPE_CHECKING
 
 from dataclay import utils
@@ -16,7 +17,11 @@ from dataclay.backend.runtime import BackendRuntime
 from dataclay.conf import settings
 from dataclay.exceptions import *
 from dataclay.runtime import UUIDLock, set_runtime
+from dataclay.utils import pickle as dcpickle
+from dataclay.utils.cache import LRUCache
+from dataclay.utils.compression import decompress
 from dataclay.utils.pickle import RecursiveLocalPickler, RecursiveLocalUnpickler
+from dataclay.utils.streaming import StreamedResult
 from dataclay.utils.tracing import trace
 
 if TYPE_CHECKING:
@@ -29,6 +34,9 @@ logger = utils.LoggerEvent(logging.getLogger(__name__))
 
 
 class BackendAPI:
+    # Maximum number of streamed results waiting to be read
+    MAX_STREAMS = 1000
+
     def __init__(self, name, port, kv_host, kv_port):
         # NOTE: the port is (atm) exclusively for unique identification of an EE
         # (given that the name is shared between all EE that share a SL, which happens in HPC deployments)
@@ -43,6 +51,9 @@ class BackendAPI:
         self.backend_id = settings.DATACLAY_BACKEND_ID
         logger.info(f"Initialized Backend with ID: {self.backend_id}")
 
+        # Results of activemethods waiting to be read from a stream
+        self.streams = LRUCache(self.MAX_STREAMS, settings.ACTIVEMETHOD_STREAM_TTL)
+
     def is_ready(self, timeout=None, pause=0.5):
         ref = time.time()
         now = ref
@@ -94,9 +105,10 @@ class BackendAPI:
     def make_persistent(self, serialized_dicts: list[bytes]):
 
         unserialized_objects = dict()
+        unresolved_objects = list()
         for serial_dict in serialized_dicts:
             object_dict = RecursiveLocalUnpickler(
-                io.BytesIO(serial_dict), unserialized_objects
+                io.BytesIO(decompress(serial_dict)), unserialized_objects, unresolved_objects
             ).load()
             object_id = object_dict["_dc_id"]
 
@@ -107,42 +119,155 @@ class BackendAPI:
                 proxy_object = cls.new_proxy_object()
                 unserialized_objects[object_id] = proxy_object
 
-            vars(proxy_object).update(object_dict)
+            proxy_object.update_dc_dict(object_dict)
             proxy_object._dc_is_local = True
             proxy_object._dc_is_loaded = True
             proxy_object._dc_backend_id = self.backend_id
 
         assert len(serialized_dicts) == len(unserialized_objects)
 
+        # Get the metadata of all the remote references at once
+        self.runtime.resolve_objects(unresolved_objects)
+
         for object_id, proxy_object in unserialized_objects.items():
             self.runtime.inmemory_objects[object_id] = proxy_object
             self.runtime.heap_manager.retain_in_heap(proxy_object)
-
-            self.runtime.metadata_service.register_object(proxy_object.metadata)
             proxy_object._dc_is_registered = True
 
+        # Register all the objects at once
+        self.runtime.metadata_service.register_objects(
+            [proxy_object.metadata for proxy_object in unserialized_objects.values()]
+        )
+
     def call_active_method(self, session_id, object_id, method_name, args, kwargs):
         self.set_local_session(session_id)
+        try:
+            return self._call_active_method(object_id, method_name, args, kwargs)
+        finally:
+            # NOTE: Objects created during the request must be registered before replying
+            self.runtime.registration_batcher.flush()
+
+    def call_active_method_batch(self, session_id, calls):
+        """Calls the activemethods in order
+
+        Args:
+            session_id: ID of session
+            calls: (object_id, method_name, args, kwargs) of each call
+        Returns:
+            the (value, is_exception) of each call. A call that cannot be done
+            returns its exception, but does not stop the following calls. A call
+            to an object that is not local stops the batch, so that the client can
+            send it to the right backend, and then the following calls in order.
+        """
+        self.set_local_session(session_id)
+        results = []
+        try:
+            for object_id, method_name, args, kwargs in calls:
+                try:
+                    instance = self.runtime.get_object_by_id(object_id)
+                    if not instance._dc_is_local:
+                        results.append(self._wrong_backend_id(instance))
+                        break
+                    results.append(self._call_active_method(object_id, method_name, args, kwargs))
+                except Exception as e:
+                    results.append((dcpickle.dumps(e), True))
+            return results
+        finally:
+            self.runtime.registration_batcher.flush()
+
+    def _call_active_method(self, object_id, method_name, args, kwargs):
         instance = self.runtime.get_object_by_id(object_id)
 
         # NOTE: When the object is not local, a custom exception is sent
         # for the client to update the backend_id, and call_active_method again
         if not instance._dc_is_local:
-            logger.warning(
-                f"Object {object_id} with wrong backend_id. Update to {instance._dc_backend_id}"
-            )
-            return pickle.dumps(ObjectWithWrongBackendId(instance._dc_backend_id)), False
+            return self._wrong_backend_id(instance)
 
-        args = pickle.loads(args)
-        kwargs = pickle.loads(kwargs)
+        args = dcpickle.loads(args)
+        kwargs = dcpickle.loads(kwargs)
 
         try:
             value = getattr(instance, method_name)(*args, **kwargs)
-            if value is not None:
-                value = pickle.dumps(value)
+            if value is None:
+                return None, False
+
+            # NOTE: Generators and large values are read by the client from a stream
+            if isinstance(value, Generator):
+                read_only = getattr(getattr(type(instance), method_name, None), "read_only", False)
+                stream = self.new_stream((value, instance, read_only), is_generator=True)
+                return dcpickle.dumps(stream), False
+            value = dcpickle.dumps(value)
+            if len(value) > settings.ACTIVEMETHOD_STREAM_THRESHOLD:
+                return dcpickle.dumps(self.new_stream(value, is_generator=False)), False
             return value, False
         except Exception as e:
-            return pickle.dumps(e), True
+            return dcpickle.dumps(e), True
+
+    def _wrong_backend_id(self, instance):
+        logger.warning(
+            f"Object {instance._dc_id} with wrong backend_id. Update to {instance._dc_backend_id}"
+        )
+        return pickle.dumps(ObjectWithWrongBackendId(instance._dc_backend_id)), False
+
+    def new_stream(self, result, is_generator) -> StreamedResult:
+        stream_id = uuid.uuid4()
+        self.streams.put(stream_id, result)
+        return StreamedResult(stream_id, is_generator)
+
+    def read_active_method_stream(self, session_id, stream_id):
+        """Yields the chunks of a streamed result, as (items, data, exception)
+
+        The items of a generator are serialized one by one, and sent in lists of about
+        ACTIVEMETHOD_STREAM_CHUNK_SIZE bytes. If the generator raises, the exception is
+        sent with the last items. Values are sent in pieces of their serialization.
+
+        The body of a generator runs while the stream is read, so its object is kept
+        as while executing an activemethod: it is not unloaded, stored or flushed.
+        """
+        self.set_local_session(session_id)
+        result = self.streams.pop(stream_id)
+        if result is None:
+            raise DataClayException(f"Stream {stream_id} does not exist or has expired")
+
+        chunk_size = settings.ACTIVEMETHOD_STREAM_CHUNK_SIZE
+        if isinstance(result, bytes):
+            for i in range(0, len(result), chunk_size):
+                yield [], result[i : i + chunk_size], None
+            return
+
+        generator, instance, read_only = result
+        active_counter = instance._xdc_active_counter
+        self.runtime.touch(instance, modified=not read_only)
+        active_counter.add()
+        try:
+            yield from self.iter_generator_chunks(generator, chunk_size)
+        finally:
+            # NOTE: Marked after the generator, since loading the object clears it
+            if not read_only:
+                instance._xdc_is_dirty = True
+            active_counter.sub()
+
+    def iter_generator_chunks(self, generator, chunk_size):
+        # NOTE: Objects created by the generator are registered before sending each chunk,
+        # since the client may get the metadata of the objects referenced by its items
+        items, size = [], 0
+        try:
+            for item in generator:
+                item = dcpickle.dumps(item)
+                items.append(item)
+                size += len(item)
+                if size >= chunk_size:
+                    self.runtime.registration_batcher.flush()
+                    yield items, None, None
+                    items, size = [], 0
+        except Exception as e:
+            self.runtime.registration_batcher.flush()
+            yield items, None, dcpickle.dumps(e)
+            return
+
+        self.runtime.registration_batcher.flush()
+        if items:
+            yield items, None, None
 
     #################
     # Store Methods #
@@ -168,9 +293,9 @@ class BackendAPI:
             # NOTE: The object should be loaded to get the _dc_properties
             # TODO: Maybe send directly the pickled file if not loaded?
             self.runtime.load_object_from_db(instance)
-            serialized_properties = pickle.dumps(instance._dc_properties)
+            serialized_properties = dcpickle.dumps(instance._dc_properties)
 
-        return serialized_properties
+        return self.runtime.transfer_compression.compress(serialized_properties)
 
     def update_object(self, session_id, object_id, serialized_properties):
         # raise ("update_object need to be refactored")
@@ -186,13 +311,20 @@ class BackendAPI:
         self.set_local_session(session_id)
 
         instance = self.runtime.get_object_by_id(object_id)
-        object_properties = pickle.loads(serialized_properties)
+        object_properties = dcpickle.loads(decompress(serialized_properties))
 
         with UUIDLock(object_id):
             self.runtime.load_object_from_db(instance)
             vars(instance).update(object_properties)
+            instance._xdc_is_dirty = True
+            self.runtime.touch(instance, modified=True)
+
+        self.runtime.registration_batcher.flush()
 
     def move_object(self, object_id, backend_id, recursive):
+        # NOTE: Pending registrations would overwrite the ones done by the new backend
+        self.runtime.registration_batcher.flush()
+
         # TODO: check that the object is local to us
         instance = self.runtime.get_object_by_id(object_id)
 
@@ -202,9 +334,7 @@ class BackendAPI:
 
             # Option 1
             # self.runtime.heap_manager.unload_object(object_id)
-            # path = f"{settings.STORAGE_PATH}/{object_id}"
-            # with open(path, "rb") as file:
-            #     serialized_properties = file.read()
+            # serialized_properties = self.runtime.storage.get(object_id)
 
             # Option 2
             self.runtime.load_object_from_db(instance)
@@ -217,13 +347,15 @@ class BackendAPI:
                 instance._dc_dict
             )
             serialized_local_dicts.append(f.getvalue())
+            serialized_local_dicts = [
+                self.runtime.transfer_compression.compress(data) for data in serialized_local_dicts
+            ]
             backend_client = self.runtime.get_backend_client(backend_id)
             backend_client.make_persistent(serialized_local_dicts)
 
-            # TODO: Remove pickle file to reduce space
-
             for dc_object in visited_objects.values():
                 self.runtime.heap_manager.release_from_heap(dc_object)
+                self.runtime.delete_object_from_db(dc_object)
                 dc_object.clean_dc_properties()
                 dc_object._dc_is_local = False
                 dc_object._dc_is_loaded = False
@@ -244,7 +376,7 @@ class BackendAPI:
         Args:
             session_id: The session's UUID.
         """
-        session = self.runtime.metadata_service.get_session(session_id)
+        session = self.runtime.get_session(session_id)
         self.runtime.session = session
 
     # Metadata
@@ -1004,30 +1136,51 @@ class BackendAPI:
     def flush_all(self):
         self.runtime.heap_manager.flush_all()
 
+    def checkpoint(self):
+        """Stores the modified objects without unloading them. Returns the number stored."""
+        return self.runtime.heap_manager.checkpoint()
+
+    def get_heap_stats(self):
+        """Returns the loaded objects and their approximate bytes per class, and the memory
+        used by the backend (RSS) and its limit, for capacity planning. Also the most
+        contended object locks, and the number of object locks in use."""
+        heap_manager = self.runtime.heap_manager
+        return {
+            "classes": heap_manager.get_class_stats(),
+            "memory_rss": heap_manager.process.memory_info().rss,
+            "memory_limit": heap_manager.memory_limit,
+            "lock_contention": dict(UUIDLock.get_contention()),
+            "num_locks": UUIDLock.num_locks(),
+        }
+
     def move_all_objects(self):
-        dc_objects = self.runtime.metadata_service.get_all_objects()
+        metadata_service = self.runtime.metadata_service
+        self.runtime.registration_batcher.flush()
         self.runtime.update_backend_clients()
         backends = self.runtime.backend_clients
 
-        num_objects = len(dc_objects)
+        # NOTE: The number of objects of each backend is read from the index sets
+        backends_count = {
+            backend_id: metadata_service.count_objects(backend_id=backend_id)
+            for backend_id in backends.keys()
+        }
+        num_objects = sum(backends_count.values())
         mean = -(num_objects // -(len(backends) - 1))
 
-        backends_objects = {backend_id: [] for backend_id in backends.keys()}
-        for object_md in dc_objects.values():
-            backends_objects[object_md.backend_id].append(object_md.id)
-
         backends_diff = dict()
-        for backend_id, objects in backends_objects.items():
-            diff = len(objects) - mean
+        for backend_id, count in backends_count.items():
+            diff = count - mean
             backends_diff[backend_id] = diff
 
         # for backend_id, object_ids in backends_objects.items():
         #     if backends_diff[backend_id] <= 0:
         #         continue
 
-        object_ids = backends_objects[self.backend_id]
+        object_ids = [
+            object_md.id for object_md in metadata_service.iter_objects(backend_id=self.backend_id)
+        ]
 
-        for new_backend_id in backends_objects.keys():
+        for new_backend_id in backends_count.keys():
             if new_backend_id == self.backend_id or backends_diff[new_backend_id] >= 0:
                 continue
             while backends_diff[new_backend_id] < 0:
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from dataclay.conf import settings
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from dataclay.metadata.api import MetadataAPI
+    from dataclay.metadata.kvdata import ObjectMetadata
+
+logger = logging.getLogger(__name__)
+
+
+class RegistrationBatcher(threading.Thread):
+    """Write-behind buffer for the registration of new objects in the metadata.
+
+    Registrations are coalesced and written in one round trip when there are
+    METADATA_BATCH_SIZE pending objects, every METADATA_BATCH_INTERVAL seconds,
+    or when "flush" is called (i.e. at the end of each request).
+    Pending object metadata can be read with "get" (read-your-writes).
+    """
+
+    def __init__(self, metadata_service: MetadataAPI):
+        threading.Thread.__init__(self, name="registration-batcher")
+        self.daemon = True
+
+        self.metadata_service = metadata_service
+
+        # Event object to communicate shutdown
+        self._finished = threading.Event()
+
+        # Objects waiting to be registered, and objects being registered by a flush
+        self.pending: dict[UUID, ObjectMetadata] = dict()
+        self.flushing: dict[UUID, ObjectMetadata] = dict()
+
+        # Lock for pending and flushing, and lock to serialize flushes
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+
+    def shutdown(self):
+        """Stop this thread and register all the pending objects"""
+        self._finished.set()
+        self.flush()
+
+    def run(self):
+        while not self._finished.wait(settings.METADATA_BATCH_INTERVAL):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to register pending objects. Retrying later.")
+
+    def register(self, object_md: ObjectMetadata):
+        with self.lock:
+            self.pending[object_md.id] = object_md
+            is_full = len(self.pending) >= settings.METADATA_BATCH_SIZE
+
+        if is_full:
+            self.flush()
+
+    def get(self, object_id: UUID) -> ObjectMetadata | None:
+        """Returns the metadata of the object if its registration is pending, or None"""
+        with self.lock:
+            object_md = self.pending.get(object_id)
+            if object_md is None:
+                object_md = self.flushing.get(object_id)
+            return object_md
+
+    def flush(self):
+        """Register all the pending objects in one round trip"""
+        with self.flush_lock:
+            with self.lock:
+                if not self.pending:
+                    return
+                self.flushing, self.pending = self.pending, dict()
+
+            try:
+                self.metadata_service.register_objects(list(self.flushing.values()))
+            except Exception:
+                with self.lock:
+                    # NOTE: Registrations done during the flush take precedence
+                    self.pending = self.flushing | self.pending
+                raise
+            finally:
+                with self.lock:
+                    self.flushing = dict()
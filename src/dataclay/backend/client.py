@@ -16,7 +16,8 @@ from dataclay.protos import (
     dataservice_pb2,
     dataservice_pb2_grpc,
 )
-from dataclay.utils.decorators import grpc_error_handler
+from dataclay.utils.decorators import aio_grpc_error_handler, grpc_error_handler
+from dataclay.utils.uuid import uuid_from_bytes, uuid_to_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -91,16 +92,23 @@ class BackendClient:
             self.channel = grpc.insecure_channel(self.address, options)
             logger.info("SSL not configured")
 
-        try:
-            grpc.channel_ready_future(self.channel).result(
-                timeout=settings.GRPC_CHECK_ALIVE_TIMEOUT
-            )
-        except Exception as e:
-            sys.exit("Error connecting to server %s" % self.address)
-        else:
-            self.stub = dataservice_pb2_grpc.DataServiceStub(self.channel)
+        # NOTE: The connection health is tracked in background by gRPC, instead of
+        # blocking until the channel is ready. Calls to an unreachable backend will fail.
+        self.connectivity = grpc.ChannelConnectivity.IDLE
+        self.channel.subscribe(self._update_connectivity, try_to_connect=True)
+        self.stub = dataservice_pb2_grpc.DataServiceStub(self.channel)
+
+    def _update_connectivity(self, connectivity):
+        self.connectivity = connectivity
+
+    @property
+    def is_available(self):
+        """False if the last connection attempt to the backend failed"""
+        return self.connectivity not in (
+            grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+            grpc.ChannelConnectivity.SHUTDOWN,
+        )
 
-    # NOTE: It may be not need if the channel_ready_future is check on __init__
     def is_ready(self, timeout=None):
         try:
             grpc.channel_ready_future(self.channel).result(timeout)
@@ -110,6 +118,7 @@ class BackendClient:
 
     def close(self):
         """Closing channel by deleting channel and stub"""
+        self.channel.unsubscribe(self._update_connectivity)
         del self.channel
         del self.stub
         self.channel = None
@@ -123,8 +132,8 @@ class BackendClient:
     @grpc_error_handler
     def call_active_method(self, session_id, object_id, method_name, args, kwargs):
         request = dataservice_pb2.CallActiveMethodRequest(
-            session_id=str(session_id),
-            object_id=str(object_id),
+            session_id=uuid_to_bytes(session_id),
+            object_id=uuid_to_bytes(object_id),
             method_name=method_name,
             args=args,
             kwargs=kwargs,
@@ -133,6 +142,40 @@ class BackendClient:
         response = self.stub.CallActiveMethod(request)
         return response.value, response.is_exception
 
+    @grpc_error_handler
+    def call_active_method_batch(self, session_id, calls):
+        request = dataservice_pb2.CallActiveMethodBatchRequest(
+            session_id=uuid_to_bytes(session_id),
+            calls=[
+                dataservice_pb2.CallActiveMethodRequest(
+                    object_id=uuid_to_bytes(object_id),
+                    method_name=method_name,
+                    args=args,
+                    kwargs=kwargs,
+                )
+                for object_id, method_name, args, kwargs in calls
+            ],
+        )
+
+        response = self.stub.CallActiveMethodBatch(request)
+        return [(result.value, result.is_exception) for result in response.results]
+
+    def read_active_method_stream(self, session_id, stream_id):
+        """Yields the (items, data, exception) chunks of a streamed result"""
+        request = dataservice_pb2.ReadActiveMethodStreamRequest(
+            session_id=uuid_to_bytes(session_id), stream_id=uuid_to_bytes(stream_id)
+        )
+
+        chunks = self.stub.ReadActiveMethodStream(request)
+        try:
+            for chunk in chunks:
+                yield chunk.items, chunk.data, chunk.exception
+        except grpc.RpcError as e:
+            raise DataClayException(e.details()) from None
+        finally:
+            # NOTE: The stream is cancelled if the result is not read to the end
+            chunks.cancel()
+
     #################
     # Store Methods #
     #################
@@ -140,8 +183,8 @@ class BackendClient:
     @grpc_error_handler
     def get_copy_of_object(self, session_id: UUID, object_id: UUID, recursive):
         request = dataservice_pb2.GetCopyOfObjectRequest(
-            session_id=str(session_id),
-            object_id=str(object_id),
+            session_id=uuid_to_bytes(session_id),
+            object_id=uuid_to_bytes(object_id),
             recursive=recursive,
         )
 
@@ -151,8 +194,8 @@ class BackendClient:
     @grpc_error_handler
     def update_object(self, session_id: UUID, object_id: UUID, serialized_properties):
         request = dataservice_pb2.UpdateObjectRequest(
-            session_id=str(session_id),
-            object_id=str(object_id),
+            session_id=uuid_to_bytes(session_id),
+            object_id=uuid_to_bytes(object_id),
             serialized_properties=serialized_properties,
         )
         self.stub.UpdateObject(request)
@@ -161,8 +204,8 @@ class BackendClient:
     def move_object(self, object_id: UUID, backend_id: UUID, recursive):
 
         request = dataservice_pb2.MoveObjectRequest(
-            object_id=str(object_id),
-            backend_id=str(backend_id),
+            object_id=uuid_to_bytes(object_id),
+            backend_id=uuid_to_bytes(backend_id),
             recursive=recursive,
         )
 
@@ -172,6 +215,31 @@ class BackendClient:
     def flush_all(self):
         self.stub.FlushAll(Empty())
 
+    @grpc_error_handler
+    def checkpoint(self) -> int:
+        response = self.stub.Checkpoint(Empty())
+        return response.num_objects
+
+    @grpc_error_handler
+    def get_heap_stats(self):
+        response = self.stub.GetHeapStats(Empty())
+        return {
+            "classes": {
+                class_stats.class_name: {
+                    "num_objects": class_stats.num_objects,
+                    "resident_bytes": class_stats.resident_bytes,
+                }
+                for class_stats in response.classes
+            },
+            "memory_rss": response.memory_rss,
+            "memory_limit": response.memory_limit,
+            "lock_contention": {
+                uuid_from_bytes(contention.object_id): contention.count
+                for contention in response.lock_contention
+            },
+            "num_locks": response.num_locks,
+        }
+
     @grpc_error_handler
     def shutdown(self):
         self.stub.Shutdown(Empty())
@@ -180,9 +248,9 @@ class BackendClient:
     def send_object(self, session_id: UUID, object_id: UUID, serialized_properties):
 
         request = dataservice_pb2.MoveObjectRequest(
-            session_id=str(session_id),
-            object_id=str(object_id),
-            backend_id=str(backend_id),
+            session_id=uuid_to_bytes(session_id),
+            object_id=uuid_to_bytes(object_id),
+            backend_id=uuid_to_bytes(backend_id),
             recursive=recursive,
         )
 
@@ -562,3 +630,62 @@ class BackendClient:
     ################## EXTRAE IGNORED FUNCTIONS ###########################
     deactivate_tracing.do_not_trace = True
     activate_tracing.do_not_trace = True
+
+
+class AsyncBackendClient:
+    """Client of a backend for asyncio, on a grpc.aio channel
+
+    Only the calls used by the async client API are provided. Its channel is bound to
+    the event loop where it is created.
+    """
+
+    def __init__(self, hostname, port):
+        if (
+            settings.SSL_CLIENT_TRUSTED_CERTIFICATES != ""
+            or settings.SSL_CLIENT_CERTIFICATE != ""
+            or settings.SSL_CLIENT_KEY != ""
+        ):
+            raise NotImplementedError("SSL is not supported by the async client")
+
+        self.address = str(hostname) + ":" + str(port)
+        options = [
+            (ChannelArgKey.max_send_message_length, -1),
+            (ChannelArgKey.max_receive_message_length, -1),
+        ]
+        self.channel = grpc.aio.insecure_channel(self.address, options)
+        self.stub = dataservice_pb2_grpc.DataServiceStub(self.channel)
+
+    async def close(self):
+        await self.channel.close()
+
+    @aio_grpc_error_handler
+    async def make_persistent(self, pickled_obj: list[bytes]):
+        request = dataservice_pb2.MakePersistentRequest(pickled_obj=pickled_obj)
+        await self.stub.MakePersistent(request)
+
+    @aio_grpc_error_handler
+    async def call_active_method(self, session_id, object_id, method_name, args, kwargs):
+        request = dataservice_pb2.CallActiveMethodRequest(
+            session_id=uuid_to_bytes(session_id),
+            object_id=uuid_to_bytes(object_id),
+            method_name=method_name,
+            args=args,
+            kwargs=kwargs,
+        )
+
+        response = await self.stub.CallActiveMethod(request)
+        return response.value, response.is_exception
+
+    async def read_active_method_stream(self, session_id, stream_id):
+        request = dataservice_pb2.ReadActiveMethodStreamRequest(
+            session_id=uuid_to_bytes(session_id), stream_id=uuid_to_bytes(stream_id)
+        )
+
+        chunks = self.stub.ReadActiveMethodStream(request)
+        try:
+            async for chunk in chunks:
+                yield chunk.items, chunk.data, chunk.exception
+        except grpc.RpcError as e:
+            raise DataClayException(e.details()) from None
+        finally:
+            chunks.cancel()
@@ -0,0 +1,179 @@
+"""Eviction policies of the HeapManager
+
+A policy tracks the loaded objects and their accesses, and decides the order
+in which they are unloaded when the memory is under pressure.
+"""
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+
+class EvictionPolicy(ABC):
+    @abstractmethod
+    def add(self, object_id: UUID):
+        """Called when the object is loaded"""
+        pass
+
+    @abstractmethod
+    def access(self, object_id: UUID):
+        """Called every time the object is accessed (properties and activemethods)"""
+        pass
+
+    @abstractmethod
+    def remove(self, object_id: UUID, evicted=False):
+        """Called when the object is unloaded (evicted) or released from the heap"""
+        pass
+
+    @abstractmethod
+    def victims(self) -> Iterable[UUID]:
+        """Returns (or yields) the loaded objects in the order they should be evicted"""
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used objects first"""
+
+    def __init__(self):
+        self.order = OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, object_id):
+        with self.lock:
+            self.order[object_id] = None
+            self.order.move_to_end(object_id)
+
+    def access(self, object_id):
+        with self.lock:
+            try:
+                self.order.move_to_end(object_id)
+            except KeyError:
+                pass
+
+    def remove(self, object_id, evicted=False):
+        with self.lock:
+            self.order.pop(object_id, None)
+
+    def victims(self):
+        with self.lock:
+            return list(self.order)
+
+
+class ClockPolicy(EvictionPolicy):
+    """Approximation of LRU with a reference bit (second chance)
+
+    An access only sets the reference bit of the object, so it is cheaper than LRU.
+    The clock hand advances lazily while victims are consumed: objects with the
+    reference bit set get it cleared and a second chance, the others are victims.
+    """
+
+    def __init__(self):
+        # Objects in clock order (the hand is at the front), with their reference bit
+        self.referenced = OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, object_id):
+        with self.lock:
+            self.referenced[object_id] = True
+
+    def access(self, object_id):
+        # NOTE: No lock is needed to set the bit, but the object must not be added
+        # again if it has been removed meanwhile
+        if object_id in self.referenced:
+            self.referenced[object_id] = True
+
+    def remove(self, object_id, evicted=False):
+        with self.lock:
+            self.referenced.pop(object_id, None)
+
+    def victims(self):
+        # At most two turns of the hand, since the first one clears all the bits
+        for _ in range(2 * len(self.referenced)):
+            with self.lock:
+                if not self.referenced:
+                    return
+                object_id, bit = self.referenced.popitem(last=False)
+                self.referenced[object_id] = False
+
+            if not bit:
+                yield object_id
+
+
+class TwoQueuePolicy(EvictionPolicy):
+    """2Q policy (Johnson and Shasha, 1994)
+
+    Objects loaded for the first time go to a FIFO queue (a1in), so objects accessed
+    only in a short period are evicted first. The ids evicted from a1in are remembered
+    in a ghost queue (a1out). Objects loaded again while in a1out go to an LRU queue
+    (am) of frequently used objects.
+    """
+
+    def __init__(self, a1in_fraction=0.25, a1out_size=10000):
+        self.a1in = OrderedDict()
+        self.am = OrderedDict()
+        self.a1out = OrderedDict()
+        self.a1in_fraction = a1in_fraction
+        self.a1out_size = a1out_size
+        self.lock = threading.Lock()
+
+    def add(self, object_id):
+        with self.lock:
+            if object_id in self.am:
+                self.am.move_to_end(object_id)
+            elif object_id in self.a1in:
+                pass
+            elif object_id in self.a1out:
+                del self.a1out[object_id]
+                self.am[object_id] = None
+            else:
+                self.a1in[object_id] = None
+
+    def access(self, object_id):
+        with self.lock:
+            # NOTE: Accesses to objects in a1in are considered correlated, and ignored
+            try:
+                self.am.move_to_end(object_id)
+            except KeyError:
+                pass
+
+    def remove(self, object_id, evicted=False):
+        with self.lock:
+            if object_id in self.am:
+                del self.am[object_id]
+            elif object_id in self.a1in:
+                del self.a1in[object_id]
+                if evicted:
+                    self.a1out[object_id] = None
+                    if len(self.a1out) > self.a1out_size:
+                        self.a1out.popitem(last=False)
+
+    def victims(self):
+        with self.lock:
+            # Evict from a1in while it is over its share, then from am
+            a1in_size = int(self.a1in_fraction * (len(self.a1in) + len(self.am)))
+            a1in = list(self.a1in)
+            num_over = max(len(a1in) - a1in_size, 0)
+            return a1in[:num_over] + list(self.am) + a1in[num_over:]
+
+
+EVICTION_POLICIES = {
+    "lru": LRUPolicy,
+    "clock": ClockPolicy,
+    "2q": TwoQueuePolicy,
+}
+
+
+def new_eviction_policy(name: str) -> EvictionPolicy:
+    try:
+        return EVICTION_POLICIES[name.lower()]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown eviction policy {name}. Choose one of {', '.join(EVICTION_POLICIES)}"
+        ) from None
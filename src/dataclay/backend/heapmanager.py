@@ -1,13 +1,19 @@
 import gc
+import itertools
 import logging
-import pickle
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import psutil
 
+from dataclay.backend.eviction import new_eviction_policy
+from dataclay.backend.storage import StorageEngine, get_property_id
 from dataclay.conf import settings
 from dataclay.runtime import UUIDLock
+from dataclay.utils import pickle as dcpickle
+from dataclay.utils.compression import CompressionPolicy
+from dataclay.utils.size import estimate_size
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -17,13 +23,44 @@ if TYPE_CHECKING:
 # logger: logging.Logger = utils.LoggerEvent(logging.getLogger(__name__))
 logger = logging.getLogger(__name__)
 
+# cgroup v2 and v1 files with the memory limit of the container
+CGROUP_MEMORY_LIMIT_PATHS = (
+    "/sys/fs/cgroup/memory.max",
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+)
+
+
+def get_memory_limit():
+    """Returns the memory available to the process: the cgroup limit or the total memory"""
+    total_memory = psutil.virtual_memory().total
+    for path in CGROUP_MEMORY_LIMIT_PATHS:
+        try:
+            with open(path) as f:
+                limit = f.read().strip()
+        except OSError:
+            continue
+
+        # NOTE: Without limit, cgroup v2 has "max" and cgroup v1 a huge number
+        if limit != "max":
+            return min(int(limit), total_memory)
+        break
+    return total_memory
+
 
 class HeapManager(threading.Thread):
     """This class is intended to manage all dataClay objects in runtime's memory."""
 
-    def __init__(self):
+    def __init__(self, storage: StorageEngine):
         threading.Thread.__init__(self, name="heap-manager")
 
+        # Storage engine where the unloaded objects are stored
+        self.storage = storage
+
+        # Codecs of the stored objects (see STORAGE_COMPRESSION and COMPRESSION_CLASSES)
+        self.compression = CompressionPolicy(
+            settings.STORAGE_COMPRESSION, settings.COMPRESSION_CLASSES
+        )
+
         # Event object to communicate shutdown
         self._finished = threading.Event()
 
@@ -39,9 +76,34 @@ class HeapManager(threading.Thread):
         # During GC,we should know that somehow. It's a hint but improves GC a lot.
         self.loaded_objects: dict[UUID, DataClayObject] = dict()
 
-        # Locks for run_task and flush_all
+        # Tracks the accesses to the loaded objects, and decides the eviction order
+        self.eviction_policy = new_eviction_policy(settings.MEMMGMT_EVICTION_POLICY)
+
+        # Approximate bytes used by the loaded objects (estimated lazily), and bytes
+        # of the stored objects they were loaded from (the cost of reloading them)
+        self.object_sizes: dict[UUID, int] = dict()
+        self.stored_sizes: dict[UUID, int] = dict()
+
+        # Locks for run_task, flush_all and checkpoint
         self.run_task_lock = threading.Lock()
         self.flush_all_lock = threading.Lock()
+        self.checkpoint_lock = threading.Lock()
+
+        # The memory usage is the RSS of the process relative to the memory limit
+        self.process = psutil.Process()
+        self.memory_limit = get_memory_limit()
+        logger.debug(f"Memory limit of the backend: {self.memory_limit} bytes")
+
+        # Number of objects unloaded between calls to gc.collect() under memory pressure
+        self.GC_COLLECT_INTERVAL = 100
+
+        # Number of objects stored by each task of the flush workers
+        self.FLUSH_BATCH_SIZE = 256
+
+        # Number of victims of the eviction policy that are sorted by size, and
+        # fixed cost of reloading any object (in bytes)
+        self.EVICTION_WINDOW = 64
+        self.RELOAD_OVERHEAD = 4096
 
     #####
 
@@ -52,8 +114,6 @@ class HeapManager(threading.Thread):
 
     def run(self):
         """Overrides run function"""
-        # gc_check_time_interval_seconds = settings.MEMMGMT_CHECK_TIME_INTERVAL / 1000.0
-        gc_check_time_interval_seconds = 10
         while True:
             logger.debug("HEAP MANAGER THREAD is awake...")
             if self._finished.is_set():
@@ -62,7 +122,7 @@ class HeapManager(threading.Thread):
 
             # sleep for interval or until shutdown
             logger.debug("HEAP MANAGER THREAD is going to sleep...")
-            self._finished.wait(gc_check_time_interval_seconds)
+            self._finished.wait(self.get_check_interval())
 
         logger.debug("HEAP MANAGER THREAD Finished.")
 
@@ -70,13 +130,27 @@ class HeapManager(threading.Thread):
     # BackendHeapManager specific methods
     #####################################
 
-    def retain_in_heap(self, dc_obj):
+    def retain_in_heap(self, dc_obj, stored_size=None):
         """Add a new Hard reference to the object provided. All code in stubs/exec classes using objects in dataClay heap are
         using weak references. In order to avoid objects to be GC without a flush in DB, HeapManager has hard-references to
         them and is the only one able to release them. This function creates the hard-reference.
+
+        The stored_size is the size of the stored object, if it has been loaded from storage.
         """
         logger.debug("New object retained in heap")
         self.loaded_objects[dc_obj._dc_id] = dc_obj
+        self.eviction_policy.add(dc_obj._dc_id)
+        if stored_size is not None:
+            self.stored_sizes[dc_obj._dc_id] = stored_size
+
+    def touch(self, dc_obj, modified=False):
+        """Registers an access to the object (used by the eviction policy)
+
+        If the object is modified, its cached size is estimated again when needed.
+        """
+        self.eviction_policy.access(dc_obj._dc_id)
+        if modified:
+            self.object_sizes.pop(dc_obj._dc_id, None)
 
     def release_from_heap(self, dc_obj):
         """Release hard reference to object provided.
@@ -86,35 +160,179 @@ class HeapManager(threading.Thread):
         logger.debug("Releasing object with id %s from retained map. ", dc_obj._dc_id)
         try:
             del self.loaded_objects[dc_obj._dc_id]
+            self.eviction_policy.remove(dc_obj._dc_id)
+            self.forget_sizes(dc_obj._dc_id)
         except Exception as e:
             logger.debug("Releasing object with id %s ", dc_obj._dc_id)
 
-    def unload_object(self, object_id):
+    def unload_object(self, object_id, blocking=True):
+        """Stores the object, if modified, and unloads it. Returns True if unloaded.
 
-        instance = self.loaded_objects[object_id]
+        If not blocking, the object is skipped when another thread holds its lock.
+        """
+
+        instance = self.loaded_objects.get(object_id)
+        if instance is None:
+            return False
 
         # NOTE: If the another thread is executing any activemethod,
         # the instance won't be unloaded, and will be kept in memory
         if instance._xdc_active_counter.acquire(timeout=0):
             try:
-                with UUIDLock(object_id):
-
-                    logger.warning(f"Storing and unloading object {object_id}")
+                lock = UUIDLock(object_id)
+                if not lock.acquire(blocking):
+                    return False
+                try:
+                    # NOTE: The object may have been released (e.g. moved) while waiting
+                    if self.loaded_objects.get(object_id) is not instance:
+                        return False
                     assert instance._dc_is_loaded
                     instance._dc_is_loaded = False
 
-                    # NOTE: We do not serialize internal attributes, since these are
+                    # NOTE: Objects not modified since they were loaded are already stored.
+                    # We do not serialize internal attributes, since these are
                     # obtained from etcd, or are stateless
-                    path = f"{settings.STORAGE_PATH}/{object_id}"
-                    pickle.dump(instance._dc_properties, open(path, "wb"))
+                    if instance._xdc_is_dirty:
+                        logger.debug(f"Storing and unloading object {object_id}")
+                        self.store_object(instance)
+                        instance._xdc_is_dirty = False
+                    else:
+                        logger.debug(f"Unloading clean object {object_id}")
 
                     # TODO: update etcd metadata (since is loaded has changed)
                     # and store object in file system
                     instance.clean_dc_properties()
 
                     del self.loaded_objects[object_id]
+                    self.eviction_policy.remove(object_id, evicted=True)
+                    self.forget_sizes(object_id)
+                    return True
+                finally:
+                    lock.release()
             finally:
                 instance._xdc_active_counter.release()
+        return False
+
+    def checkpoint_object(self, object_id):
+        """Stores the object if modified, without unloading it. Returns True if stored."""
+
+        instance = self.loaded_objects.get(object_id)
+        if instance is None or not instance._xdc_is_dirty:
+            return False
+
+        # NOTE: Objects executing activemethods or locked by other threads are skipped,
+        # since they could be modified while being serialized. They are still dirty,
+        # and stored later.
+        if instance._xdc_active_counter.acquire(timeout=0):
+            try:
+                lock = UUIDLock(object_id)
+                if not lock.acquire(blocking=False):
+                    return False
+                try:
+                    if self.loaded_objects.get(object_id) is not instance:
+                        return False
+                    if not instance._xdc_is_dirty:
+                        return False
+                    self.store_object(instance)
+                    instance._xdc_is_dirty = False
+                    return True
+                finally:
+                    lock.release()
+            finally:
+                instance._xdc_active_counter.release()
+        return False
+
+    def store_object(self, instance):
+        """Stores the properties of the object
+
+        Properties of at least STORAGE_PROPERTY_THRESHOLD bytes (approximately) are stored
+        apart, so they are only loaded when accessed. The names of the properties stored
+        apart are stored with the object.
+        """
+        object_id = instance._dc_id
+        properties = instance._dc_properties
+        class_name = instance._dc_class_name
+
+        # NOTE: Properties stored apart and not loaded since are still up to date
+        stored_apart = {name for name in instance._xdc_stored_apart if name not in properties}
+        if settings.STORAGE_PROPERTY_THRESHOLD > 0:
+            for name, value in list(properties.items()):
+                if estimate_size(value) >= settings.STORAGE_PROPERTY_THRESHOLD:
+                    self.store_value(get_property_id(object_id, name), value, class_name)
+                    stored_apart.add(name)
+                    del properties[name]
+
+        for name in instance._xdc_stored_apart:
+            if name not in stored_apart:
+                self.storage.delete(get_property_id(object_id, name))
+
+        if stored_apart:
+            properties["_xdc_stored_apart"] = tuple(stored_apart)
+        self.store_value(object_id, properties, class_name)
+        instance._xdc_stored_apart = tuple(stored_apart)
+
+    def store_value(self, storage_id, value, class_name=None):
+        # NOTE: Buffers stored in blobs are not compressed, so they can be memory-mapped
+        buffers = []
+        data = dcpickle.dumps(value, self.get_buffer_callback(buffers))
+        data = self.compression.compress(data, class_name)
+        self.storage.put(storage_id, data, buffers)
+
+    def get_buffer_callback(self, buffers):
+        """Returns a pickle buffer_callback that keeps large buffers (e.g. numpy arrays)
+        out-of-band, so they are stored apart and memory-mapped when loaded"""
+
+        def buffer_callback(buffer):
+            if buffer.raw().nbytes < settings.STORAGE_BLOB_THRESHOLD:
+                return True
+            buffers.append(buffer)
+            return False
+
+        return buffer_callback
+
+    #####################
+    # Size of the objects
+    #####################
+
+    def get_object_size(self, object_id):
+        """Returns the approximate bytes used by a loaded object
+
+        The estimation is cached until the object is modified (see touch), since it
+        has to visit all the object properties.
+        """
+        size = self.object_sizes.get(object_id)
+        if size is None:
+            try:
+                instance = self.loaded_objects[object_id]
+            except KeyError:
+                return 0
+            size = estimate_size(vars(instance))
+            self.object_sizes[object_id] = size
+        return size
+
+    def forget_sizes(self, object_id):
+        self.object_sizes.pop(object_id, None)
+        self.stored_sizes.pop(object_id, None)
+
+    def get_eviction_score(self, object_id):
+        """Returns the bytes freed by unloading the object, per byte to reload it"""
+        size = self.get_object_size(object_id)
+        reload_cost = self.stored_sizes.get(object_id, size) + self.RELOAD_OVERHEAD
+        return size / reload_cost
+
+    def get_class_stats(self):
+        """Returns the number of loaded objects and their approximate bytes, per class"""
+        stats = dict()
+        for object_id, instance in list(self.loaded_objects.items()):
+            class_name = f"{type(instance).__module__}.{type(instance).__name__}"
+            class_stats = stats.setdefault(class_name, {"num_objects": 0, "resident_bytes": 0})
+            class_stats["num_objects"] += 1
+            class_stats["resident_bytes"] += self.get_object_size(object_id)
+        return stats
+
+    def get_memory_usage(self):
+        """Returns the fraction of the memory limit used by the process (RSS)"""
+        return self.process.memory_info().rss / self.memory_limit
 
     def is_memory_under_pressure(self):
         """Check if memory is under pressure
@@ -127,13 +345,28 @@ class HeapManager(threading.Thread):
         Returns:
             TRUE if memory is under pressure. FALSE otherwise.
         """
-
-        return True
-        return psutil.virtual_memory().percent > (settings.MEMMGMT_PRESSURE_FRACTION * 100)
+        return self.get_memory_usage() > settings.MEMMGMT_PRESSURE_FRACTION
 
     def is_memory_at_ease(self):
-        return False
-        return psutil.virtual_memory().percent < (settings.MEMMGMT_EASE_FRACTION * 100)
+        return self.get_memory_usage() < settings.MEMMGMT_EASE_FRACTION
+
+    def get_check_interval(self):
+        """Returns the seconds until the next check of the memory
+
+        Below the low watermark it is MEMMGMT_CHECK_TIME_INTERVAL. From the low to
+        the high watermark it is shortened linearly, down to a tenth.
+        """
+        interval = settings.MEMMGMT_CHECK_TIME_INTERVAL / 1000.0
+        usage = self.get_memory_usage()
+        if usage <= settings.MEMMGMT_EASE_FRACTION:
+            return interval
+
+        watermarks_gap = settings.MEMMGMT_PRESSURE_FRACTION - settings.MEMMGMT_EASE_FRACTION
+        if watermarks_gap > 0:
+            ratio = min((usage - settings.MEMMGMT_EASE_FRACTION) / watermarks_gap, 1.0)
+        else:
+            ratio = 1.0
+        return interval * (1.0 - 0.9 * ratio)
 
     def run_task(self):
 
@@ -144,29 +377,54 @@ class HeapManager(threading.Thread):
         # Enters if memory is under pressure and the lock is not locked
         if self.is_memory_under_pressure() and self.run_task_lock.acquire(blocking=False):
             try:
-                loaded_objects_keys = list(self.loaded_objects)
-                logger.debug(f"Num loaded objects before: {len(loaded_objects_keys)}")
-
-                while loaded_objects_keys:
-
-                    object_id = loaded_objects_keys.pop()
-                    self.unload_object(object_id)
-
-                    # TODO: ¿Do we need to call every time gc.collect()?
-                    gc.collect()
-
-                    if self.is_memory_at_ease() or self.flush_all_lock.locked():
-                        break
+                logger.debug(f"Num loaded objects before: {len(self.loaded_objects)}")
+                victims = self.iter_loaded_victims()
+
+                # NOTE: The victims are taken in windows, in the order of the eviction
+                # policy. Inside a window, the objects that free more bytes per byte
+                # reloaded are unloaded first, so big objects are not kept in memory
+                # while lots of tiny objects are unloaded.
+                num_unloaded = 0
+                while window := list(itertools.islice(victims, self.EVICTION_WINDOW)):
+                    window.sort(key=self.get_eviction_score, reverse=True)
+                    for object_id in window:
+                        # NOTE: Objects locked by other threads are in use, so skipped
+                        if not self.unload_object(object_id, blocking=False):
+                            continue
+                        num_unloaded += 1
+
+                        # NOTE: Most of the memory is released by reference counting.
+                        # gc.collect() is only needed for reference cycles.
+                        if num_unloaded % self.GC_COLLECT_INTERVAL == 0:
+                            gc.collect()
+
+                        # Stop as soon as the low watermark is reached
+                        if self.is_memory_at_ease() or self.flush_all_lock.locked():
+                            break
+                    else:
+                        continue
+                    break
                 else:
                     logger.warning("All objects cleaned, but memory is not at ease.")
 
                 logger.debug(f"Num loaded objects after: {len(self.loaded_objects)}")
-                del loaded_objects_keys
+                del victims
                 gc.collect()
 
+                # NOTE: The stored objects are synced at once (group commit)
+                self.storage.sync()
+
             finally:
                 self.run_task_lock.release()
 
+    def iter_loaded_victims(self):
+        for object_id in self.eviction_policy.victims():
+            # NOTE: The object may have been released meanwhile
+            if object_id in self.loaded_objects:
+                yield object_id
+            else:
+                self.eviction_policy.remove(object_id)
+
     def flush_all(self):
         """Stores and unloads all loaded objects to disk.
 
@@ -183,8 +441,11 @@ class HeapManager(threading.Thread):
                 if self.run_task_lock.acquire(timeout=self.MAX_TIME_WAIT_FOR_GC_TO_FINISH):
                     self.run_task_lock.release()
 
-                for object_id in list(self.loaded_objects):
-                    self.unload_object(object_id)
+                self.flush_objects(list(self.loaded_objects), self.unload_object)
+                self.storage.sync()
+
+                # NOTE: Only once, since most of the memory is released by reference counting
+                gc.collect()
 
                 logger.debug(f"Num loaded objects not flushed: {len(self.loaded_objects)}")
 
@@ -193,3 +454,42 @@ class HeapManager(threading.Thread):
 
         else:
             logger.debug("Already flushing all objects")
+
+    def checkpoint(self):
+        """Stores all modified objects, without unloading them. Returns the number stored.
+
+        Objects executing activemethods are not stored, since they are being modified.
+        """
+        with self.checkpoint_lock:
+            dirty_ids = [
+                object_id
+                for object_id, instance in list(self.loaded_objects.items())
+                if instance._xdc_is_dirty
+            ]
+            logger.debug(f"Starting checkpoint of {len(dirty_ids)} modified objects")
+            num_stored = self.flush_objects(dirty_ids, self.checkpoint_object)
+            self.storage.sync()
+            logger.debug(f"Checkpoint stored {num_stored} objects")
+            return num_stored
+
+    def flush_objects(self, object_ids, flush_object):
+        """Calls flush_object on the objects, in batches, from MEMMGMT_FLUSH_WORKERS threads
+
+        The records are appended to the storage without syncing it, so the caller syncs
+        all of them at once. Returns the number of objects flushed.
+        """
+
+        def flush_batch(batch):
+            return sum(flush_object(object_id) for object_id in batch)
+
+        batches = [
+            object_ids[i : i + self.FLUSH_BATCH_SIZE]
+            for i in range(0, len(object_ids), self.FLUSH_BATCH_SIZE)
+        ]
+        if len(batches) <= 1 or settings.MEMMGMT_FLUSH_WORKERS <= 1:
+            return sum(map(flush_batch, batches))
+
+        with ThreadPoolExecutor(
+            settings.MEMMGMT_FLUSH_WORKERS, thread_name_prefix="heap-flush"
+        ) as executor:
+            return sum(executor.map(flush_batch, batches))
@@ -2,15 +2,19 @@
 
 import datetime
 import logging
-import pickle
 import threading
 
+from dataclay.backend.batcher import RegistrationBatcher
 from dataclay.backend.heapmanager import HeapManager
+from dataclay.backend.storage import get_property_id, new_storage_engine
 from dataclay.conf import settings
 from dataclay.dataclay_object import DataClayObject
 from dataclay.exceptions import *
 from dataclay.metadata.api import MetadataAPI
 from dataclay.runtime import DataClayRuntime, UUIDLock
+from dataclay.utils import pickle as dcpickle
+from dataclay.utils.cache import LRUCache
+from dataclay.utils.compression import decompress
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +29,23 @@ class BackendRuntime(DataClayRuntime):
         metadata_service = MetadataAPI(kv_host, kv_port)
         super().__init__(metadata_service)
 
-        self.heap_manager = HeapManager()
+        self.storage = new_storage_engine(settings.STORAGE_ENGINE, settings.STORAGE_PATH)
+        self.heap_manager = HeapManager(self.storage)
         # start heap manager. Invokes run() in a separate thread
         self.heap_manager.start()
 
+        # New objects are registered in the metadata in batches
+        self.registration_batcher = RegistrationBatcher(metadata_service)
+        self.registration_batcher.start()
+
+        # Keep the backend clients updated with the registered backends
+        self.start_backends_watcher()
+
+        # Cache of the sessions, invalidated when a session is closed
+        self.session_cache = LRUCache(settings.SESSION_CACHE_SIZE, settings.SESSION_CACHE_TTL)
+        self.sessions_watcher_stop = threading.Event()
+        self.start_sessions_watcher()
+
         # References hold by sessions. Resource note: Maximum size of this map is maximum number of objects allowed in EE x sessions.
         # Also, important to think what happens if one single session is associated to two client threads? use case?
         # should we allow that?
@@ -53,29 +70,103 @@ class BackendRuntime(DataClayRuntime):
     def session(self, value):
         self.thread_local_data.session = value
 
+    ############
+    # Sessions #
+    ############
+
+    def get_session(self, session_id):
+        session = self.session_cache.get(session_id)
+        if session is None:
+            session = self.metadata_service.get_session(session_id)
+            self.session_cache.put(session_id, session)
+        return session
+
+    def start_sessions_watcher(self):
+        """Starts a thread that removes the closed sessions from session_cache"""
+        self.sessions_watcher_stop.clear()
+        thread = threading.Thread(
+            target=self.watch_closed_sessions, name="sessions-watcher", daemon=True
+        )
+        thread.start()
+
+    def watch_closed_sessions(self):
+        while not self.sessions_watcher_stop.is_set():
+            try:
+                for session_id in self.metadata_service.watch_closed_sessions(
+                    self.sessions_watcher_stop
+                ):
+                    self.session_cache.pop(session_id)
+            except Exception as e:
+                if self.sessions_watcher_stop.is_set():
+                    break
+                logger.warning(f"Lost closed sessions watch ({e}). Retrying...")
+
+            # NOTE: Sessions closed while not watching would stay in the cache
+            self.session_cache.clear()
+            self.sessions_watcher_stop.wait(settings.BACKENDS_WATCH_RETRY_INTERVAL)
+
+    def stop_sessions_watcher(self):
+        self.sessions_watcher_stop.set()
+
     def add_to_heap(self, instance: DataClayObject):
         self.inmemory_objects[instance._dc_id] = instance
         if instance._dc_is_loaded:
             self.heap_manager.retain_in_heap(instance)
 
-    def load_object_from_db(self, instance: DataClayObject):
+    def touch(self, instance: DataClayObject, modified=False):
+        self.heap_manager.touch(instance, modified)
+
+    def load_object_from_db(self, instance: DataClayObject, lazy=False):
+        """Loads the object from storage
+
+        With lazy, the properties stored apart (see STORAGE_PROPERTY_THRESHOLD) are not
+        loaded until they are accessed. Otherwise, all of them are loaded.
+        """
         with UUIDLock(instance._dc_id):
-            if instance._dc_is_loaded or not instance._dc_is_local:
-                # The object is already loaded or not local. It may had been loaded
-                # in another thread while waiting for lock
+            if not instance._dc_is_local:
                 return
 
+            # NOTE: The object may had been loaded in another thread while waiting for lock
+            if not instance._dc_is_loaded:
+                try:
+                    data, buffers = self.storage.get_with_buffers(instance._dc_id)
+                    object_properties = dcpickle.loads(decompress(data), buffers)
+                except Exception as e:
+                    raise DataClayException("Object not found in storage") from e
+
+                # NOTE: The object_properties don't contain internal "_dc_" attributes
+                # except "_dc_properties_"
+                instance._xdc_stored_apart = object_properties.pop("_xdc_stored_apart", ())
+                vars(instance).update(object_properties)
+                instance._dc_is_loaded = True
+                instance._xdc_is_dirty = False
+                self.heap_manager.retain_in_heap(instance, len(data))
+
+            if not lazy:
+                for property_name in instance._xdc_stored_apart:
+                    self.load_property_from_db(instance, property_name)
+
+    def load_property_from_db(self, instance: DataClayObject, property_name: str):
+        """Loads a property stored apart from the object, if not loaded yet"""
+        with UUIDLock(instance._dc_id):
+            if not instance._dc_is_loaded:
+                self.load_object_from_db(instance, lazy=True)
+            if property_name in vars(instance):
+                return
+
+            property_id = get_property_id(instance._dc_id, property_name)
             try:
-                path = f"{settings.STORAGE_PATH}/{instance._dc_id}"
-                object_properties = pickle.load(open(path, "rb"))
+                data, buffers = self.storage.get_with_buffers(property_id)
+                vars(instance)[property_name] = dcpickle.loads(decompress(data), buffers)
             except Exception as e:
-                raise DataClayException("Object not found in storage") from e
+                raise DataClayException("Property not found in storage") from e
 
-            # NOTE: The object_properties don't contain internal "_dc_" attributes
-            # except "_dc_properties_"
-            object_properties["_dc_is_loaded"] = True
-            vars(instance).update(object_properties)
-            self.heap_manager.retain_in_heap(instance)
+    def delete_object_from_db(self, instance: DataClayObject):
+        """Deletes the object, and its properties stored apart, from storage"""
+        self.storage.delete(instance._dc_id)
+        for property_name in instance._xdc_stored_apart:
+            self.storage.delete(get_property_id(instance._dc_id, property_name))
+        instance._xdc_stored_apart = ()
 
     def make_persistent(self, instance: DataClayObject, alias, backend_id, recursive):
         """This method creates a new Persistent Object using the provided stub instance and,
@@ -111,11 +202,39 @@ class BackendRuntime(DataClayRuntime):
         # If backend_id is none, we register the object in the current backend (usual path)
         if backend_id is None:
             instance._dc_backend_id = settings.DATACLAY_BACKEND_ID
-            self.metadata_service.register_object(instance.metadata)
+            if alias:
+                # NOTE: The alias is visible right away, so must be the object
+                self.metadata_service.register_object(instance.metadata)
+            else:
+                self.registration_batcher.register(instance.metadata)
             instance._dc_is_registered = True
 
         return instance._dc_backend_id
 
+    ############
+    # Metadata #
+    ############
+
+    def get_object_md_by_id(self, object_id):
+        object_md = self.registration_batcher.get(object_id)
+        if object_md is None:
+            object_md = super().get_object_md_by_id(object_id)
+        return object_md
+
+    def get_object_mds_by_ids(self, object_ids):
+        object_mds = []
+        missing_ids = []
+        for object_id in object_ids:
+            object_md = self.registration_batcher.get(object_id)
+            if object_md is None:
+                missing_ids.append(object_id)
+            else:
+                object_mds.append(object_md)
+
+        if missing_ids:
+            object_mds.extend(super().get_object_mds_by_ids(missing_ids))
+        return object_mds
+
     #########
     # Alias #
     #########
@@ -341,6 +460,13 @@ class BackendRuntime(DataClayRuntime):
     def stop(self):
         # Remove backend entry from metadata
         self.metadata_service.delete_backend(settings.DATACLAY_BACKEND_ID)
+        self.stop_backends_watcher()
+        self.stop_sessions_watcher()
+        self.stop_activemethod_executor()
+
+        # Register the pending objects
+        self.registration_batcher.shutdown()
+        self.registration_batcher.join()
 
         # Stop HeapManager
         logger.debug("Stopping GC. Sending shutdown event.")
@@ -351,3 +477,4 @@ class BackendRuntime(DataClayRuntime):
 
         self.close_backend_clients()
         self.heap_manager.flush_all()
+        self.storage.close()
@@ -4,6 +4,7 @@ import logging
 import pickle
 import signal
 import threading
+import time
 import traceback
 from concurrent import futures
 from uuid import UUID
@@ -22,6 +23,7 @@ from dataclay.protos import (
     dataservice_pb2_grpc,
 )
 from dataclay.runtime import get_runtime
+from dataclay.utils.uuid import uuid_from_bytes, uuid_to_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -73,11 +75,60 @@ def serve():
     server.stop(5)
 
 
+class IdleStreamsWatchdog:
+    """Cancels the streams whose client does not read the sent chunk in time
+
+    A single thread watches all the streams. It is started when first needed.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.deadlines: dict[grpc.ServicerContext, float] = dict()
+        self.cond = threading.Condition()
+        self.thread = None
+
+    def watch(self, context):
+        """Starts waiting for the client to read the chunk sent to the stream"""
+        with self.cond:
+            # NOTE: Deadlines are only added after the existing ones, so the thread is
+            # only woken up when it waits for the first one
+            if not self.deadlines:
+                self.cond.notify()
+            self.deadlines[context] = time.monotonic() + self.timeout
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.run, name="idle-streams-watchdog", daemon=True
+                )
+                self.thread.start()
+
+    def unwatch(self, context):
+        with self.cond:
+            self.deadlines.pop(context, None)
+
+    def run(self):
+        while True:
+            with self.cond:
+                now = time.monotonic()
+                expired = [
+                    context for context, deadline in self.deadlines.items() if deadline <= now
+                ]
+                for context in expired:
+                    del self.deadlines[context]
+                if not expired:
+                    next_deadline = min(self.deadlines.values(), default=None)
+                    self.cond.wait(None if next_deadline is None else next_deadline - now)
+
+            for context in expired:
+                logger.warning(f"Cancelling a stream not read for {self.timeout} seconds")
+                context.cancel()
+
+
 class BackendServicer(dataservice_pb2_grpc.DataServiceServicer):
     def __init__(self, backend: BackendAPI, stop_event: threading.Event):
         """Execution environment being managed"""
         self.backend = backend
         self.stop_event = stop_event
+        self.idle_streams_watchdog = IdleStreamsWatchdog(settings.ACTIVEMETHOD_STREAM_IDLE_TIMEOUT)
 
     def MakePersistent(self, request, context):
         try:
@@ -92,8 +143,8 @@ class BackendServicer(dataservice_pb2_grpc.DataServiceServicer):
     def CallActiveMethod(self, request, context):
         try:
             value, is_exception = self.backend.call_active_method(
-                UUID(request.session_id),
-                UUID(request.object_id),
+                uuid_from_bytes(request.session_id),
+                uuid_from_bytes(request.object_id),
                 request.method_name,
                 request.args,
                 request.kwargs,
@@ -105,6 +156,46 @@ class BackendServicer(dataservice_pb2_grpc.DataServiceServicer):
             traceback.print_exc()
             return dataservice_pb2.CallActiveMethodResponse()
 
+    def CallActiveMethodBatch(self, request, context):
+        try:
+            results = self.backend.call_active_method_batch(
+                uuid_from_bytes(request.session_id),
+                [
+                    (uuid_from_bytes(call.object_id), call.method_name, call.args, call.kwargs)
+                    for call in request.calls
+                ],
+            )
+            return dataservice_pb2.CallActiveMethodBatchResponse(
+                results=[
+                    dataservice_pb2.CallActiveMethodResponse(value=value, is_exception=is_exception)
+                    for value, is_exception in results
+                ]
+            )
+        except Exception as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            traceback.print_exc()
+            return dataservice_pb2.CallActiveMethodBatchResponse()
+
+    def ReadActiveMethodStream(self, request, context):
+        # NOTE: The worker waits while the client does not read the sent chunk, so the
+        # stream is cancelled if the client is idle for ACTIVEMETHOD_STREAM_IDLE_TIMEOUT
+        try:
+            for items, data, exception in self.backend.read_active_method_stream(
+                uuid_from_bytes(request.session_id), uuid_from_bytes(request.stream_id)
+            ):
+                self.idle_streams_watchdog.watch(context)
+                yield dataservice_pb2.ActiveMethodStreamChunk(
+                    items=items, data=data, exception=exception
+                )
+                self.idle_streams_watchdog.unwatch(context)
+        except Exception as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            traceback.print_exc()
+        finally:
+            self.idle_streams_watchdog.unwatch(context)
+
     #################
     # Store Methods #
     #################
@@ -112,7 +203,9 @@ class BackendServicer(dataservice_pb2_grpc.DataServiceServicer):
     def GetCopyOfObject(self, request, context):
         try:
             result = self.backend.get_copy_of_object(
-                UUID(request.session_id), UUID(request.object_id), request.recursive
+                uuid_from_bytes(request.session_id),
+                uuid_from_bytes(request.object_id),
+                request.recursive,
             )
             return BytesValue(value=result)
         except Exception as e:
@@ -124,7 +217,9 @@ class BackendServicer(dataservice_pb2_grpc.DataServiceServicer):
     def UpdateObject(self, request, context):
         try:
             self.backend.update_object(
-                UUID(request.session_id), UUID(request.object_id), request.serialized_properties
+                uuid_from_bytes(request.session_id),
+                uuid_from_bytes(request.object_id),
+                request.serialized_properties,
             )
             return Empty()
         except Exception as e:
@@ -136,8 +231,8 @@ class BackendServicer(dataservice_pb2_grpc.DataServiceServicer):
     def MoveObject(self, request, context):
         try:
             self.backend.move_object(
-                UUID(request.object_id),
-                UUID(request.backend_id),
+                uuid_from_bytes(request.object_id),
+                uuid_from_bytes(request.backend_id),
                 request.recursive,
             )
             return Empty()
@@ -157,6 +252,38 @@ class BackendServicer(dataservice_pb2_grpc.DataServiceServicer):
             traceback.print_exc()
             return Empty()
 
+    def Checkpoint(self, request, context):
+        try:
+            num_objects = self.backend.checkpoint()
+            return dataservice_pb2.CheckpointResponse(num_objects=num_objects)
+        except Exception as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            traceback.print_exc()
+            return dataservice_pb2.CheckpointResponse()
+
+    def GetHeapStats(self, request, context):
+        try:
+            heap_stats = self.backend.get_heap_stats()
+            return dataservice_pb2.GetHeapStatsResponse(
+                classes=[
+                    dataservice_pb2.HeapClassStats(class_name=class_name, **class_stats)
+                    for class_name, class_stats in heap_stats["classes"].items()
+                ],
+                memory_rss=heap_stats["memory_rss"],
+                memory_limit=heap_stats["memory_limit"],
+                lock_contention=[
+                    dataservice_pb2.LockContention(object_id=uuid_to_bytes(object_id), count=count)
+                    for object_id, count in heap_stats["lock_contention"].items()
+                ],
+                num_locks=heap_stats["num_locks"],
+            )
+        except Exception as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            traceback.print_exc()
+            return dataservice_pb2.GetHeapStatsResponse()
+
     def Shutdown(self, request, context):
         try:
             self.stop_event.set()
@@ -0,0 +1,680 @@
+"""Storage engines of the backends
+
+An engine stores the serialized properties of the objects unloaded from memory,
+and returns them when the objects are loaded again.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import mmap
+import os
+import pickle
+import re
+import struct
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from uuid import UUID, uuid5
+
+from dataclay.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Blob file: magic number and number of buffers, followed by the offset and length of
+# each buffer. Buffers are aligned to pages, so they can be memory-mapped.
+BLOB_HEADER = struct.Struct("<4sI")
+BLOB_ENTRY = struct.Struct("<QQ")
+BLOB_MAGIC = b"DCBL"
+
+# Stored data: magic number and version of the blob file of the object (NO_BLOB if it
+# has none), followed by the serialized object. Data stored without it is legacy.
+BLOB_REF = struct.Struct("<4sQ")
+BLOB_REF_MAGIC = b"DCBR"
+NO_BLOB = 0
+
+# Blob files are named after the object id and the version. Legacy blob files have
+# no version (None), and belong to legacy data.
+BLOB_NAME = re.compile(r"^([0-9a-f-]{36})(?:\.(\d+))?\.blob$")
+
+
+def align(offset, alignment=mmap.PAGESIZE):
+    return -(-offset // alignment) * alignment
+
+
+def fsync_dir(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class StorageEngine(ABC):
+    """Storage of the serialized objects
+
+    Besides the serialized object, each object may have large buffers (the out-of-band
+    buffers of pickle protocol 5). These are written to a blob file of the object, and
+    memory-mapped (copy-on-write) when the object is loaded, so they are not read in advance
+    and their residency is managed by the page cache.
+
+    Every version of the buffers is written to a new blob file, which is durable before
+    the data referring to it is stored. The previous blob files of the object are removed
+    once the new data is durable (in sync), so after a crash the stored data always
+    matches its blob file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.blobs_path = os.path.join(path, "blobs")
+        os.makedirs(self.blobs_path, exist_ok=True)
+
+        # Versions of the blob files of each object, and blob files to remove on sync
+        self.blob_versions: dict[UUID, set[int | None]] = dict()
+        for name in os.listdir(self.blobs_path):
+            if match := BLOB_NAME.match(name):
+                version = None if match[2] is None else int(match[2])
+                self.blob_versions.setdefault(UUID(match[1]), set()).add(version)
+            elif name.endswith(".tmp"):
+                os.remove(os.path.join(self.blobs_path, name))
+        self.obsolete_blobs: list[str] = []
+        self.blob_counter = itertools.count(time.time_ns())
+        self.blobs_lock = threading.Lock()
+
+    @abstractmethod
+    def write(self, object_id: UUID, data: bytes):
+        """Stores the data of the object, replacing the previous one. Durable on sync_data."""
+        pass
+
+    @abstractmethod
+    def read(self, object_id: UUID) -> bytes:
+        """Returns the data of the object. Raises KeyError if it is not stored"""
+        pass
+
+    @abstractmethod
+    def remove(self, object_id: UUID):
+        """Removes the data of the object, if it is stored"""
+        pass
+
+    @abstractmethod
+    def sync_data(self):
+        """Makes the written data durable"""
+        pass
+
+    def put(self, object_id: UUID, data: bytes, buffers: list[pickle.PickleBuffer] = ()):
+        """Stores the serialized object and its buffers, replacing the previous version"""
+        version = self.put_buffers(object_id, buffers) if buffers else NO_BLOB
+        self.write(object_id, BLOB_REF.pack(BLOB_REF_MAGIC, version) + data)
+        self.retire_blobs(object_id, keep=version)
+
+    def get(self, object_id: UUID) -> bytes:
+        """Returns the serialized object. Raises KeyError if it is not stored"""
+        return self.split_blob_ref(object_id, self.read(object_id))[1]
+
+    def get_with_buffers(self, object_id: UUID) -> tuple[bytes, list[memoryview]]:
+        """Returns the serialized object and its buffers. Raises KeyError if it is not stored"""
+        version, data = self.split_blob_ref(object_id, self.read(object_id))
+        return data, self.get_buffers(object_id, version)
+
+    def delete(self, object_id: UUID):
+        """Removes the object, if it is stored"""
+        self.remove(object_id)
+        self.retire_blobs(object_id)
+
+    def sync(self):
+        """Makes the stored objects durable, and removes the blob files replaced before"""
+        with self.blobs_lock:
+            obsolete_blobs, self.obsolete_blobs = self.obsolete_blobs, []
+        self.sync_data()
+        for path in obsolete_blobs:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        pass
+
+    def split_blob_ref(self, object_id, data) -> tuple[int | None, bytes]:
+        """Returns the version of the blob file of the data, and the serialized object"""
+        magic, version = BLOB_REF.unpack_from(data) if len(data) >= BLOB_REF.size else (b"", 0)
+        if magic == BLOB_REF_MAGIC:
+            return version, data[BLOB_REF.size :]
+
+        # NOTE: Legacy data uses the legacy blob file of the object, if any
+        if None in self.blob_versions.get(object_id, ()):
+            return None, data
+        return NO_BLOB, data
+
+    def get_blob_path(self, object_id, version=None):
+        if version is None:
+            return os.path.join(self.blobs_path, f"{object_id}.blob")
+        return os.path.join(self.blobs_path, f"{object_id}.{version}.blob")
+
+    def put_buffers(self, object_id: UUID, buffers: list[pickle.PickleBuffer]) -> int:
+        """Writes the buffers to a new blob file, and returns its version once durable"""
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        entries = []
+        offset = align(BLOB_HEADER.size + len(raw_buffers) * BLOB_ENTRY.size)
+        for raw_buffer in raw_buffers:
+            entries.append(BLOB_ENTRY.pack(offset, raw_buffer.nbytes))
+            offset = align(offset + raw_buffer.nbytes)
+
+        # NOTE: A new file is written, not overwritten, since the previous
+        # version may be still mapped by arrays of the object
+        with self.blobs_lock:
+            version = next(self.blob_counter)
+        path = self.get_blob_path(object_id, version)
+        with open(path + ".tmp", "wb") as f:
+            f.write(BLOB_HEADER.pack(BLOB_MAGIC, len(raw_buffers)) + b"".join(entries))
+            for entry, raw_buffer in zip(entries, raw_buffers):
+                f.seek(BLOB_ENTRY.unpack(entry)[0])
+                f.write(raw_buffer)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(path + ".tmp", path)
+        fsync_dir(self.blobs_path)
+
+        with self.blobs_lock:
+            self.blob_versions.setdefault(object_id, set()).add(version)
+        return version
+
+    def get_buffers(self, object_id: UUID, version: int | None) -> list[memoryview]:
+        """Returns the buffers of the blob file, memory-mapped copy-on-write"""
+        if version == NO_BLOB:
+            return []
+
+        with open(self.get_blob_path(object_id, version), "rb") as f:
+            blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, count = BLOB_HEADER.unpack_from(blob)
+        if magic != BLOB_MAGIC:
+            raise ValueError(f"Invalid blob file for object {object_id}")
+
+        view = memoryview(blob)
+        return [
+            view[offset : offset + length]
+            for offset, length in BLOB_ENTRY.iter_unpack(
+                view[BLOB_HEADER.size : BLOB_HEADER.size + count * BLOB_ENTRY.size]
+            )
+        ]
+
+    def retire_blobs(self, object_id: UUID, keep=NO_BLOB):
+        """Schedules the blob files of the object, except the kept version, to be removed"""
+        with self.blobs_lock:
+            versions = self.blob_versions.get(object_id)
+            if not versions:
+                return
+            for version in versions - {keep}:
+                self.obsolete_blobs.append(self.get_blob_path(object_id, version))
+            versions &= {keep}
+            if not versions:
+                del self.blob_versions[object_id]
+
+
+class FileStorage(StorageEngine):
+    """One file per object, named after the object id"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.unsynced = set()
+        self.unsynced_lock = threading.Lock()
+
+    def get_path(self, object_id):
+        return os.path.join(self.path, str(object_id))
+
+    def write(self, object_id, data):
+        path = self.get_path(object_id)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        with self.unsynced_lock:
+            self.unsynced.add(object_id)
+
+    def read(self, object_id):
+        try:
+            with open(self.get_path(object_id), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise KeyError(object_id) from None
+
+    def remove(self, object_id):
+        try:
+            os.remove(self.get_path(object_id))
+        except FileNotFoundError:
+            pass
+
+    def sync_data(self):
+        with self.unsynced_lock:
+            unsynced, self.unsynced = self.unsynced, set()
+        for object_id in unsynced:
+            try:
+                fd = os.open(self.get_path(object_id), os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        fsync_dir(self.path)
+
+
+# Record: object id, kind, length and CRC32 of the data, followed by the data
+RECORD_HEADER = struct.Struct("<16sBII")
+# Footer entry: object id, kind, offset and length of the data
+FOOTER_ENTRY = struct.Struct("<16sBQI")
+# Footer trailer (at the end of sealed segments): offset and number of entries
+FOOTER_TRAILER = struct.Struct("<QI4s")
+FOOTER_MAGIC = b"DCSF"
+
+PUT = 1
+DELETE = 2
+
+SEGMENT_NAME = re.compile(r"^segment-(\d{8})\.log$")
+
+
+class LogStorage(StorageEngine):
+    """Log-structured storage
+
+    Objects are appended to segment files. When the active segment reaches
+    STORAGE_SEGMENT_SIZE, it is sealed with a footer listing its records, so the
+    in-memory index (object id -> segment, offset and length) is rebuilt at start
+    reading only the footers, and scanning the active segment.
+
+    Overwritten and deleted objects leave garbage in the segments. A background
+    thread rewrites the live objects of the segments with more garbage than
+    STORAGE_COMPACTION_THRESHOLD, and removes them.
+
+    Objects stored by FileStorage (one file per object) in the same path are read
+    as well, and their files are removed once they are stored again.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+
+        # Location of the data of each object: segment, offset and length
+        self.index: dict[UUID, tuple[int, int, int]] = dict()
+
+        # Bytes of records of each segment, and bytes of overwritten or deleted records
+        self.segment_sizes: dict[int, int] = dict()
+        self.garbage: dict[int, int] = dict()
+
+        # File descriptors to read the segments, and number of readers using each one.
+        # The ones of compacted segments are closed when their last reader ends.
+        self.fds: dict[int, int] = dict()
+        self.fd_readers: Counter[int] = Counter()
+        self.retired_fds: set[int] = set()
+
+        # Lock for the index and the appends to the active segment
+        self.lock = threading.Lock()
+
+        # Appended and synced records, for group commit
+        self.sync_cond = threading.Condition()
+        self.written = 0
+        self.synced = 0
+        self.syncing = False
+
+        self.legacy_ids = set()
+        self.load()
+
+        # Event object to communicate shutdown
+        self._finished = threading.Event()
+        self.compactor = threading.Thread(
+            target=self.run_compactor, name="storage-compactor", daemon=True
+        )
+        self.compactor.start()
+
+    def get_segment_path(self, number):
+        return os.path.join(self.path, f"segment-{number:08d}.log")
+
+    ###########
+    # Loading #
+    ###########
+
+    def load(self):
+        numbers = []
+        for name in os.listdir(self.path):
+            if match := SEGMENT_NAME.match(name):
+                numbers.append(int(match[1]))
+            else:
+                try:
+                    self.legacy_ids.add(UUID(name))
+                except ValueError:
+                    pass
+        numbers.sort()
+
+        unsealed = []
+        for number in numbers:
+            self.fds[number] = os.open(self.get_segment_path(number), os.O_RDONLY)
+            self.garbage[number] = 0
+            entries = self.read_footer(number)
+            if entries is None:
+                entries = self.scan_segment(number)
+                unsealed.append((number, entries))
+            for object_id, kind, offset, length in entries:
+                self.apply(number, object_id, kind, offset, length)
+
+        # NOTE: Only the last segment can be unsealed, unless a crash happened
+        # while sealing. In that case the segment is sealed now.
+        if unsealed and unsealed[-1][0] == numbers[-1]:
+            number, entries = unsealed.pop()
+            self.open_active(number, entries)
+        else:
+            self.open_active(numbers[-1] + 1 if numbers else 0, [])
+        for number, entries in unsealed:
+            fd = os.open(self.get_segment_path(number), os.O_WRONLY | os.O_APPEND)
+            try:
+                self.write_footer(fd, self.segment_sizes[number], entries)
+            finally:
+                os.close(fd)
+
+        logger.info(
+            f"Loaded {len(self.index)} objects from {len(self.segment_sizes)} storage segments"
+        )
+
+    def read_footer(self, number):
+        """Returns the entries of the footer of a sealed segment, or None if not sealed"""
+        fd = self.fds[number]
+        size = os.fstat(fd).st_size
+        if size < FOOTER_TRAILER.size:
+            return None
+        offset, count, magic = FOOTER_TRAILER.unpack(
+            os.pread(fd, FOOTER_TRAILER.size, size - FOOTER_TRAILER.size)
+        )
+        if (
+            magic != FOOTER_MAGIC
+            or offset + count * FOOTER_ENTRY.size + FOOTER_TRAILER.size != size
+        ):
+            return None
+
+        self.segment_sizes[number] = offset
+        footer = os.pread(fd, count * FOOTER_ENTRY.size, offset)
+        return [
+            (UUID(bytes=object_id), kind, data_offset, length)
+            for object_id, kind, data_offset, length in FOOTER_ENTRY.iter_unpack(footer)
+        ]
+
+    def scan_segment(self, number):
+        """Returns the records of an unsealed segment, truncating any incomplete record"""
+        path = self.get_segment_path(number)
+        entries = []
+        offset = 0
+        with open(path, "rb") as f:
+            while header := f.read(RECORD_HEADER.size):
+                if len(header) < RECORD_HEADER.size:
+                    break
+                object_id, kind, length, crc = RECORD_HEADER.unpack(header)
+                if kind not in (PUT, DELETE):
+                    break
+                data = f.read(length)
+                if len(data) < length or zlib.crc32(data) != crc:
+                    break
+                entries.append((UUID(bytes=object_id), kind, offset + RECORD_HEADER.size, length))
+                offset += RECORD_HEADER.size + length
+
+        if offset < os.path.getsize(path):
+            logger.warning(f"Truncating incomplete records at the end of {path}")
+            os.truncate(path, offset)
+        self.segment_sizes[number] = offset
+        return entries
+
+    def apply(self, number, object_id, kind, offset, length):
+        """Updates the index and the garbage of the segments with a new record"""
+        old_location = self.index.pop(object_id, None)
+        if old_location is not None:
+            old_number, _, old_length = old_location
+            self.garbage[old_number] += RECORD_HEADER.size + old_length
+
+        if kind == PUT:
+            self.index[object_id] = (number, offset, length)
+        else:
+            # NOTE: Tombstones are garbage, but needed until older segments are compacted
+            self.garbage[number] += RECORD_HEADER.size + length
+
+    ##################
+    # Active segment #
+    ##################
+
+    def open_active(self, number, entries):
+        path = self.get_segment_path(number)
+        self.active = number
+        self.active_fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.active_entries = entries
+        self.segment_sizes.setdefault(number, 0)
+        self.garbage.setdefault(number, 0)
+        if number not in self.fds:
+            self.fds[number] = os.open(path, os.O_RDONLY)
+
+    def write_footer(self, fd, offset, entries):
+        footer = b"".join(
+            FOOTER_ENTRY.pack(object_id.bytes, kind, data_offset, length)
+            for object_id, kind, data_offset, length in entries
+        )
+        footer += FOOTER_TRAILER.pack(offset, len(entries), FOOTER_MAGIC)
+        os.write(fd, footer)
+        os.fsync(fd)
+
+    def roll(self):
+        """Seals the active segment and opens a new one"""
+        self.write_footer(self.active_fd, self.segment_sizes[self.active], self.active_entries)
+        os.close(self.active_fd)
+        self.open_active(self.active + 1, [])
+
+    def append(self, object_id, kind, data):
+        """Appends a record to the active segment and returns the offset of its data"""
+        if (
+            self.active_entries
+            and self.segment_sizes[self.active] + RECORD_HEADER.size + len(data)
+            > settings.STORAGE_SEGMENT_SIZE
+        ):
+            self.roll()
+
+        record = RECORD_HEADER.pack(object_id.bytes, kind, len(data), zlib.crc32(data)) + data
+        view = memoryview(record)
+        while view:
+            view = view[os.write(self.active_fd, view) :]
+
+        offset = self.segment_sizes[self.active] + RECORD_HEADER.size
+        self.segment_sizes[self.active] += len(record)
+        self.active_entries.append((object_id, kind, offset, len(data)))
+        self.apply(self.active, object_id, kind, offset, len(data))
+        self.written += 1
+        return offset
+
+    ##############
+    # Operations #
+    ##############
+
+    def write(self, object_id, data):
+        with self.lock:
+            self.append(object_id, PUT, data)
+            self.remove_legacy(object_id)
+
+    def read(self, object_id):
+        with self.lock:
+            location = self.index.get(object_id)
+            if location is not None:
+                fd = self.fds[location[0]]
+                self.fd_readers[fd] += 1
+            elif object_id not in self.legacy_ids:
+                raise KeyError(object_id)
+
+        if location is None:
+            with open(os.path.join(self.path, str(object_id)), "rb") as f:
+                return f.read()
+
+        _, offset, length = location
+        try:
+            data = os.pread(fd, length, offset)
+        finally:
+            self.release_fd(fd)
+        if len(data) < length:
+            raise KeyError(object_id)
+        return data
+
+    def release_fd(self, fd):
+        with self.lock:
+            self.fd_readers[fd] -= 1
+            if self.fd_readers[fd] == 0:
+                del self.fd_readers[fd]
+                if fd in self.retired_fds:
+                    self.retired_fds.remove(fd)
+                    os.close(fd)
+
+    def remove(self, object_id):
+        with self.lock:
+            if object_id in self.index:
+                self.append(object_id, DELETE, b"")
+            self.remove_legacy(object_id)
+
+    def remove_legacy(self, object_id):
+        if object_id in self.legacy_ids:
+            self.legacy_ids.discard(object_id)
+            try:
+                os.remove(os.path.join(self.path, str(object_id)))
+            except FileNotFoundError:
+                pass
+
+    def sync_data(self):
+        """Makes the appended records durable
+
+        Concurrent calls are served by the same fsync (group commit): callers arriving
+        while a fsync is in progress wait for it, and the next one syncs for all of them.
+        """
+        target = self.written
+        with self.sync_cond:
+            while self.syncing and self.synced < target:
+                self.sync_cond.wait()
+            if self.synced >= target:
+                return
+            self.syncing = True
+
+        synced = self.synced
+        try:
+            # NOTE: Sealed segments are already synced
+            with self.lock:
+                written = self.written
+                fd = os.dup(self.active_fd)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            synced = written
+        finally:
+            with self.sync_cond:
+                self.syncing = False
+                self.synced = max(self.synced, synced)
+                self.sync_cond.notify_all()
+
+    def close(self):
+        self._finished.set()
+        self.compactor.join()
+        self.sync()
+        with self.lock:
+            os.close(self.active_fd)
+            for fd in list(self.fds.values()) + list(self.retired_fds):
+                os.close(fd)
+            self.fds.clear()
+            self.retired_fds.clear()
+
+    ##############
+    # Compaction #
+    ##############
+
+    def run_compactor(self):
+        while not self._finished.wait(settings.STORAGE_COMPACTION_INTERVAL):
+            try:
+                self.compact()
+            except Exception:
+                logger.exception("Failed to compact the storage segments")
+
+    def compact(self):
+        """Rewrites the live objects of the sealed segments with too much garbage"""
+        with self.lock:
+            candidates = [
+                number
+                for number, size in self.segment_sizes.items()
+                if number != self.active
+                and self.garbage[number] >= size * settings.STORAGE_COMPACTION_THRESHOLD
+            ]
+
+        for number in sorted(candidates):
+            if self._finished.is_set():
+                break
+            self.compact_segment(number)
+
+    def compact_segment(self, number):
+        logger.debug(f"Compacting storage segment {number}")
+        fd = self.fds[number]
+        entries = self.read_footer(number)
+
+        # NOTE: Tombstones are only needed while an older segment has a record of the
+        # object, since it would be loaded again otherwise
+        deleted_ids = {
+            object_id
+            for object_id, kind, _, _ in entries
+            if kind == DELETE and object_id not in self.index
+        }
+        if deleted_ids:
+            deleted_ids &= self.get_stored_ids(before=number)
+
+        for object_id, kind, offset, length in entries:
+            if kind == PUT:
+                if self.index.get(object_id) != (number, offset, length):
+                    continue
+                data = os.pread(fd, length, offset)
+                with self.lock:
+                    # NOTE: The object may have been overwritten while reading it
+                    if self.index.get(object_id) == (number, offset, length):
+                        self.append(object_id, PUT, data)
+            elif object_id in deleted_ids:
+                with self.lock:
+                    if object_id not in self.index:
+                        self.append(object_id, DELETE, b"")
+
+        # NOTE: The rewritten objects must be durable before removing the segment
+        self.sync()
+        with self.lock:
+            del self.segment_sizes[number]
+            del self.garbage[number]
+            fd = self.fds.pop(number)
+            if self.fd_readers[fd]:
+                self.retired_fds.add(fd)
+            else:
+                os.close(fd)
+        os.remove(self.get_segment_path(number))
+
+    def get_stored_ids(self, before):
+        """Returns the ids of the objects stored in the segments before the given one"""
+        with self.lock:
+            numbers = [number for number in self.segment_sizes if number < before]
+        stored_ids = set()
+        for number in numbers:
+            stored_ids.update(
+                object_id for object_id, kind, _, _ in self.read_footer(number) if kind == PUT
+            )
+        return stored_ids
+
+
+def get_property_id(object_id: UUID, property_name: str) -> UUID:
+    """Returns the id used to store a property apart from its object"""
+    return uuid5(object_id, property_name)
+
+
+STORAGE_ENGINES = {
+    "file": FileStorage,
+    "log": LogStorage,
+}
+
+
+def new_storage_engine(name: str, path: str) -> StorageEngine:
+    try:
+        engine_class = STORAGE_ENGINES[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage engine {name}. Choose one of {', '.join(STORAGE_ENGINES)}"
+        ) from None
+    return engine_class(path)
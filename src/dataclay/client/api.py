@@ -5,7 +5,7 @@ Note that importing this module has a basic semantic: it prepares the dataClay
 core and sets the "client" mode for the library.
 """
 
-__all__ = ["init", "finish", "DataClayObject"]
+__all__ = ["init", "finish", "DataClayObject", "async_client"]
 
 import logging
 import logging.config
@@ -35,6 +35,31 @@ def client(host=None, port=None, username=None, password=None, dataset=None, loc
     )
 
 
+async def async_client(
+    host=None, port=None, username=None, password=None, dataset=None, local_backend=None
+):
+    """Returns a started client for asyncio applications
+
+    Objects can then be used without blocking the event loop:
+
+        client = await dataclay.async_client(...)
+        await obj.a_make_persistent()
+        result = await obj.method.aio(*args)
+        obj = await MyClass.a_get_by_alias("alias")
+        await client.stop()
+    """
+    client_api = AsyncClientAPI(
+        host=host,
+        port=port,
+        username=username,
+        password=password,
+        dataset=dataset,
+        local_backend=local_backend,
+    )
+    await client_api.start()
+    return client_api
+
+
 def init():
     client_api = ClientAPI()
     client_api.start()
@@ -101,8 +126,9 @@ class ClientAPI:
         self.runtime.session = self.session
         self.runtime.metadata_service.session = self.session
 
-        # Cache the backends clients
+        # Cache the backends clients, and keep them updated
         self.runtime.update_backend_clients()
+        self.runtime.start_backends_watcher()
 
         # Cache the dataclay_id, to avoid later request
         # self.runtime.dataclay_id
@@ -136,6 +162,75 @@ class ClientAPI:
         return self.runtime.backend_clients
 
 
+class AsyncClientAPI(ClientAPI):
+    """ClientAPI with grpc.aio channels, started and stopped with await (see async_client)
+
+    The synchronous API is still available, but it blocks the event loop.
+    """
+
+    async def start(self):
+        if self.is_initialized:
+            logger.warning("Already initialized. Ignoring")
+            return
+
+        logger.info("Initializing async client")
+
+        self.old_settings_dict = settings.__dict__.copy()
+        settings.load_client_properties(
+            self.host, self.port, self.username, self.password, self.dataset, self.local_backend
+        )
+
+        self.old_runtime = get_runtime()
+        self.runtime = ClientRuntime(
+            settings.DATACLAY_METADATA_HOSTNAME, settings.DATACLAY_METADATA_PORT
+        )
+        self.runtime.start_aio(settings.DATACLAY_METADATA_HOSTNAME, settings.DATACLAY_METADATA_PORT)
+        set_runtime(self.runtime)
+
+        # Create a new session
+        self.session = await self.runtime.aio_metadata_service.new_session(
+            settings.DC_USERNAME, settings.DC_PASSWORD, settings.DC_DATASET
+        )
+        self.runtime.session = self.session
+        self.runtime.metadata_service.session = self.session
+        self.runtime.aio_metadata_service.session = self.session
+
+        # Cache the backends clients, and keep them updated
+        await self.runtime.a_update_backend_clients()
+        self.runtime.start_backends_watcher()
+
+        logger.debug(f"Started session {self.session.id}")
+        self.is_initialized = True
+
+    async def stop(self):
+        if not self.is_initialized:
+            logger.warning("Already finished. Ignoring")
+            return
+
+        logger.info("Finishing async client API")
+        await self.runtime.a_stop()
+        settings.__dict__.update(self.old_settings_dict)
+        self.is_initialized = False
+
+    def __del__(self):
+        # NOTE: It cannot be stopped without an event loop
+        if self.is_initialized:
+            logger.warning("Async client not stopped")
+
+    async def __aenter__(self):
+        # NOTE: The client returned by async_client is already started
+        if not self.is_initialized:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def get_backends(self):
+        await self.runtime.a_update_backend_clients()
+        return self.runtime.backend_clients
+
+
 ##########
 # Dataclay
 ##########
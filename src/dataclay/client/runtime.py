@@ -4,11 +4,18 @@ import io
 import logging
 import random
 import traceback
+from uuid import UUID
 
+from dataclay.backend.client import AsyncBackendClient
+from dataclay.conf import settings
 from dataclay.dataclay_object import DataClayObject
-from dataclay.metadata.client import MetadataClient
+from dataclay.exceptions import *
+from dataclay.metadata.client import AsyncMetadataClient, MetadataClient
 from dataclay.runtime import DataClayRuntime
+from dataclay.utils import pickle as dcpickle
+from dataclay.utils.cache import LRUCache
 from dataclay.utils.pickle import RecursiveLocalPickler
+from dataclay.utils.streaming import StreamedResult
 from dataclay.utils.tracing import trace
 
 UNDEFINED_LOCAL = object()
@@ -27,6 +34,14 @@ class ClientRuntime(DataClayRuntime):
         metadata_service = MetadataClient(metadata_service_host, metadata_service_port)
         super().__init__(metadata_service)
 
+        # Caches to avoid calling the metadata service for hot objects and aliases
+        self.object_md_cache = LRUCache(settings.METADATA_CACHE_SIZE, settings.METADATA_CACHE_TTL)
+        self.alias_cache = LRUCache(settings.METADATA_CACHE_SIZE, settings.METADATA_CACHE_TTL)
+
+        # Clients on grpc.aio channels, created by start_aio (see dataclay.async_client)
+        self.aio_metadata_service: AsyncMetadataClient = None
+        self.aio_backend_clients: dict[UUID, AsyncBackendClient] = dict()
+
     def add_to_heap(self, instance: DataClayObject):
         self.inmemory_objects[instance._dc_id] = instance
 
@@ -52,23 +67,35 @@ class ClientRuntime(DataClayRuntime):
         instance._dc_dataset_name = self.session.dataset_name
         if alias:
             self.metadata_service.new_alias(alias, self.session.dataset_name, instance._dc_id)
+            self.alias_cache.put((self.session.dataset_name, alias), instance._dc_id)
             # instance._dc_alias = alias
 
         if backend_id is None:
+            backend_id = self.choose_backend_id()
+        backend_client = self.get_backend_client(backend_id)
+
+        serialized_local_dicts, visited_objects = self.serialize_local_dicts(instance)
+        backend_client.make_persistent(serialized_local_dicts)
+        self.set_persisted(visited_objects, backend_id)
+
+        return instance._dc_backend_id
+
+    def choose_backend_id(self):
+        """Returns a random backend, among the available ones if any"""
+        # NOTE: backend_clients is kept up to date by the backends watcher.
+        # It is only updated inline if no backend is known yet.
+        if not self.backend_clients:
             self.update_backend_clients()
-            backend_id, backend_client = random.choice(list(self.backend_clients.items()))
+        backend_ids = [
+            id for id, backend_client in self.backend_clients.items() if backend_client.is_available
+        ] or list(self.backend_clients)
+        return random.choice(backend_ids)
 
-            # NOTE: Maybe use a quick update to avoid overhead.
-            # Quiack_update only updates ee_infos, but don't check clients readiness
-            # self.quick_update_backend_clients()
-            # backend_id = random.choice(list(self.ee_infos.keys()))
-            # backend_client = self.backend_clients[backend_id]
-        else:
-            backend_client = self.get_backend_client(backend_id)
+    def serialize_local_dicts(self, instance):
+        """Serializes the instance and the local objects it references, for make_persistent
 
-        ######################################
-        # Serialize instance with Pickle
-        ######################################
+        Returns the serialized objects and the visited objects.
+        """
 
         # TODO: Avoid some race-conditions in communication
         # (make persistent + execute where execute arrives before).
@@ -81,8 +108,13 @@ class ClientRuntime(DataClayRuntime):
 
         RecursiveLocalPickler(f, visited_objects, serialized_local_dicts).dump(instance._dc_dict)
         serialized_local_dicts.append(f.getvalue())
-        backend_client.make_persistent(serialized_local_dicts)
+        serialized_local_dicts = [
+            self.transfer_compression.compress(data) for data in serialized_local_dicts
+        ]
+        return serialized_local_dicts, visited_objects
 
+    def set_persisted(self, visited_objects, backend_id):
+        """Turns the objects sent to the backend into proxies"""
         for dc_object in visited_objects.values():
             dc_object.clean_dc_properties()
             dc_object._dc_is_registered = True
@@ -90,8 +122,6 @@ class ClientRuntime(DataClayRuntime):
             dc_object._dc_is_loaded = False
             dc_object._dc_backend_id = backend_id
 
-        return instance._dc_backend_id
-
     def move_object(self, instance, backend_id, recursive):
         assert instance._dc_is_registered
 
@@ -101,10 +131,48 @@ class ClientRuntime(DataClayRuntime):
         backend_client.move_object(object_id, backend_id, recursive)
         instance._dc_backend_id = backend_id
 
+        # NOTE: With recursive, other objects may have been moved. Their cached
+        # metadata is invalidated when the old backend redirects the calls.
+        self.invalidate_object_metadata(object_id)
+
+    ##################
+    # Metadata cache #
+    ##################
+
+    def get_object_md_by_id(self, object_id):
+        object_md = self.object_md_cache.get(object_id)
+        if object_md is None:
+            object_md = super().get_object_md_by_id(object_id)
+            self.object_md_cache.put(object_id, object_md)
+        return object_md
+
+    def get_object_by_alias(self, alias, dataset_name=None):
+        if dataset_name is None:
+            dataset_name = self.session.dataset_name
+
+        object_id = self.alias_cache.get((dataset_name, alias))
+        if object_id is not None:
+            return self.get_object_by_id(object_id)
+
+        object_md = self.metadata_service.get_object_md_by_alias(alias, dataset_name)
+        self.alias_cache.put((dataset_name, alias), object_md.id)
+        self.object_md_cache.put(object_md.id, object_md)
+        return self.get_object_by_id(object_md.id, object_md)
+
+    def invalidate_object_metadata(self, object_id):
+        self.object_md_cache.pop(object_id)
+
     #########
     # Alias #
     #########
 
+    def delete_alias_in_dataclay(self, alias, dataset_name):
+        if dataset_name is None:
+            dataset_name = self.session.dataset_name
+
+        self.alias_cache.pop((dataset_name, alias))
+        super().delete_alias_in_dataclay(alias, dataset_name)
+
     # NOTE: This function may be removed.
     # When an alias is removed without having the instance, the persistent object
     # has to know it if we consult its alias, therefore, in all cases, the alias
@@ -113,6 +181,8 @@ class ClientRuntime(DataClayRuntime):
         backend_client = self.get_backend_client(instance._dc_backend_id)
         backend_client.delete_alias(self.session.id, instance._dc_id)
         instance._dc_alias = None
+        # NOTE: The alias of the instance is not known, so all cached aliases are dropped
+        self.alias_cache.clear()
 
     ############
     # Replicas #
@@ -194,11 +264,176 @@ class ClientRuntime(DataClayRuntime):
             self.session.id, instance._dc_id, external_execution_environment_id, recursive
         )
 
+    ###########
+    # Asyncio #
+    ###########
+
+    # NOTE: The clients on grpc.aio channels are bound to the event loop where they are
+    # created. Serialization, and the metadata of references found while deserializing
+    # a result, are still done synchronously.
+
+    def start_aio(self, metadata_service_host, metadata_service_port):
+        self.aio_metadata_service = AsyncMetadataClient(
+            metadata_service_host, metadata_service_port
+        )
+
+    async def a_update_backend_clients(self):
+        """Updates backend_clients, and aio_backend_clients, with all the backends"""
+        backend_infos = await self.aio_metadata_service.get_all_backends()
+        self.update_backend_clients(backend_infos)
+        await self.a_sync_backend_clients()
+
+    async def a_sync_backend_clients(self):
+        """Updates aio_backend_clients with the backends of backend_clients
+
+        The backends watcher only updates backend_clients, so the clients of the
+        removed backends are closed here, and the new ones are created.
+        """
+        new_backend_clients = {}
+        for id, backend_client in self.backend_clients.items():
+            try:
+                new_backend_clients[id] = self.aio_backend_clients[id]
+            except KeyError:
+                hostname, port = backend_client.address.rsplit(":", 1)
+                new_backend_clients[id] = AsyncBackendClient(hostname, port)
+
+        old_backend_clients = self.aio_backend_clients
+        self.aio_backend_clients = new_backend_clients
+
+        for id, backend_client in old_backend_clients.items():
+            if id not in new_backend_clients:
+                await backend_client.close()
+
+    async def a_get_backend_client(self, backend_id: UUID) -> AsyncBackendClient:
+        """Raises KeyError if the backend is not registered, as get_backend_client"""
+        if backend_id not in self.backend_clients:
+            await self.a_update_backend_clients()
+        elif self.aio_backend_clients.keys() != self.backend_clients.keys():
+            await self.a_sync_backend_clients()
+        return self.aio_backend_clients[backend_id]
+
+    async def a_update_object_metadata(self, instance: DataClayObject):
+        object_md = self.object_md_cache.get(instance._dc_id)
+        if object_md is None:
+            object_md = await self.aio_metadata_service.get_object_md_by_id(instance._dc_id)
+            self.object_md_cache.put(instance._dc_id, object_md)
+        instance.metadata = object_md
+
+    async def a_call_active_method(self, instance, method_name, args: tuple, kwargs: dict):
+        if instance._dc_backend_id is None:
+            await self.a_update_object_metadata(instance)
+
+        serialized_args = dcpickle.dumps(args)
+        serialized_kwargs = dcpickle.dumps(kwargs)
+
+        # NOTE: Loop to update the backend_id when we have the wrong one, and call again
+        # the active method
+        while True:
+            try:
+                backend_client = await self.a_get_backend_client(instance._dc_backend_id)
+            except KeyError:
+                # NOTE: The backend hint of the object may be stale
+                self.invalidate_object_metadata(instance._dc_id)
+                await self.a_update_object_metadata(instance)
+                backend_client = await self.a_get_backend_client(instance._dc_backend_id)
+
+            serialized_response, is_exception = await backend_client.call_active_method(
+                self.session.id, instance._dc_id, method_name, serialized_args, serialized_kwargs
+            )
+
+            if not serialized_response:
+                return None
+
+            response = dcpickle.loads(serialized_response)
+
+            if isinstance(response, ObjectWithWrongBackendId):
+                self.invalidate_object_metadata(instance._dc_id)
+                instance._dc_backend_id = response.backend_id
+                continue
+
+            if isinstance(response, StreamedResult):
+                return await self.a_read_streamed_result(backend_client, response)
+
+            if is_exception:
+                raise response
+
+            return response
+
+    async def a_read_streamed_result(self, backend_client, result: StreamedResult):
+        """Returns the streamed value, or an async iterator of the items of a streamed generator"""
+        chunks = backend_client.read_active_method_stream(self.session.id, result.stream_id)
+        if result.is_generator:
+            return self.a_iter_streamed_items(chunks)
+        return dcpickle.loads(b"".join([data async for _, data, _ in chunks]))
+
+    @staticmethod
+    async def a_iter_streamed_items(chunks):
+        async for items, _, exception in chunks:
+            for item in items:
+                yield dcpickle.loads(item)
+            if exception:
+                raise dcpickle.loads(exception)
+
+    async def a_make_persistent(self, instance: DataClayObject, alias, backend_id, recursive):
+        logger.debug(f"Starting async make persistent for object {instance._dc_id}")
+
+        if instance._dc_is_registered:
+            raise RuntimeError("Instance is already persistent")
+
+        instance._dc_dataset_name = self.session.dataset_name
+        if alias:
+            await self.aio_metadata_service.new_alias(
+                alias, self.session.dataset_name, instance._dc_id
+            )
+            self.alias_cache.put((self.session.dataset_name, alias), instance._dc_id)
+
+        if backend_id is None:
+            backend_id = self.choose_backend_id()
+        backend_client = await self.a_get_backend_client(backend_id)
+
+        serialized_local_dicts, visited_objects = self.serialize_local_dicts(instance)
+        await backend_client.make_persistent(serialized_local_dicts)
+        self.set_persisted(visited_objects, backend_id)
+
+        return instance._dc_backend_id
+
+    async def a_get_object_by_alias(self, alias, dataset_name=None):
+        if dataset_name is None:
+            dataset_name = self.session.dataset_name
+
+        object_id = self.alias_cache.get((dataset_name, alias))
+        if object_id is None:
+            object_md = await self.aio_metadata_service.get_object_md_by_alias(alias, dataset_name)
+            self.alias_cache.put((dataset_name, alias), object_md.id)
+            self.object_md_cache.put(object_md.id, object_md)
+            object_id = object_md.id
+        else:
+            object_md = self.object_md_cache.get(object_id)
+            if object_md is None and object_id not in self.inmemory_objects:
+                object_md = await self.aio_metadata_service.get_object_md_by_id(object_id)
+                self.object_md_cache.put(object_id, object_md)
+
+        # NOTE: With the metadata, the proxy object is created without blocking
+        return self.get_object_by_id(object_id, object_md)
+
+    async def a_stop(self):
+        self.stop_backends_watcher()
+        self.stop_activemethod_executor()
+        await self.aio_metadata_service.close_session(self.session.id)
+        for backend_client in self.aio_backend_clients.values():
+            await backend_client.close()
+        self.aio_backend_clients = {}
+        await self.aio_metadata_service.close()
+        self.close_backend_clients()
+        self.metadata_service.close()
+
     ############
     # Shutdown #
     ############
 
     def stop(self):
+        self.stop_backends_watcher()
+        self.stop_activemethod_executor()
         self.metadata_service.close_session(self.session.id)
         self.close_backend_clients()
         self.metadata_service.close()
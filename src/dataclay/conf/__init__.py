@@ -17,18 +17,101 @@ class Settings:
 
     CHECK_SESSION = False
 
-    # Percentage to start flushing objects
+    # Fraction of the memory limit (cgroup limit or total memory) used by the
+    # backend process (RSS) to start flushing objects (high watermark)
     MEMMGMT_PRESSURE_FRACTION = float(os.getenv("MEMMGMT_PRESSURE_FRACTION", default=0.75))
 
-    # Percentage to stop flushing objects
-    MEMMGMT_EASE_FRACTION = float(os.getenv("MEMMGMT_PRESSURE_FRACTION", default=0.50))
+    # Fraction of the memory limit to stop flushing objects (low watermark)
+    MEMMGMT_EASE_FRACTION = float(os.getenv("MEMMGMT_EASE_FRACTION", default=0.50))
 
-    # Number of milliseconds to check if Heap needs to be cleaned.
+    # Number of milliseconds to check if Heap needs to be cleaned. The interval is
+    # shortened (down to a tenth) as the memory usage approaches the high watermark.
     MEMMGMT_CHECK_TIME_INTERVAL = int(os.getenv("MEMMGMT_CHECK_TIME_INTERVAL", default=5000))
 
+    # Policy to choose the objects to unload under memory pressure: lru, clock or 2q
+    MEMMGMT_EVICTION_POLICY = os.getenv("MEMMGMT_EVICTION_POLICY", default="lru")
+
+    # Number of threads serializing and storing the objects in flush_all and checkpoint
+    MEMMGMT_FLUSH_WORKERS = int(
+        os.getenv("MEMMGMT_FLUSH_WORKERS", default=min(8, os.cpu_count() or 1))
+    )
+
     # Global GC collection interval
     NOCHECK_SESSION_EXPIRATION = datetime.strptime("2120-09-10T20:00:04", DATE_FORMAT)
 
+    ###########
+    # Storage #
+    ###########
+
+    # Engine to store the unloaded objects: log (log-structured segments) or file (one per object)
+    STORAGE_ENGINE = os.getenv("STORAGE_ENGINE", default="log")
+
+    # Bytes of the log segments. Full segments are sealed and a new one is started.
+    STORAGE_SEGMENT_SIZE = int(os.getenv("STORAGE_SEGMENT_SIZE", default=64 * 1024 * 1024))
+
+    # Minimum bytes of a buffer (e.g. a numpy array) to store it in a blob file, which is
+    # memory-mapped when the object is loaded
+    STORAGE_BLOB_THRESHOLD = int(os.getenv("STORAGE_BLOB_THRESHOLD", default=1024 * 1024))
+
+    # Minimum bytes (estimated) of a property to store it apart from its object, so it is
+    # only loaded when accessed. Disabled with 0.
+    STORAGE_PROPERTY_THRESHOLD = int(os.getenv("STORAGE_PROPERTY_THRESHOLD", default=0))
+
+    # Fraction of garbage (overwritten or deleted objects) to compact a segment
+    STORAGE_COMPACTION_THRESHOLD = float(os.getenv("STORAGE_COMPACTION_THRESHOLD", default=0.5))
+
+    # Number of seconds between checks for segments to compact
+    STORAGE_COMPACTION_INTERVAL = float(os.getenv("STORAGE_COMPACTION_INTERVAL", default=60))
+
+    ###############
+    # Compression #
+    ###############
+
+    # Codec of the stored objects: none, zlib, lz4 or zstd. Blobs are never compressed.
+    STORAGE_COMPRESSION = os.getenv("STORAGE_COMPRESSION", default="none")
+
+    # Codec of the objects sent between clients and backends: none, zlib, lz4 or zstd
+    TRANSFER_COMPRESSION = os.getenv("TRANSFER_COMPRESSION", default="none")
+
+    # Codecs of the stored objects of some classes, as "module.Class=codec,..."
+    COMPRESSION_CLASSES = os.getenv("COMPRESSION_CLASSES", default="")
+
+    # Minimum bytes of a serialized object to compress it
+    COMPRESSION_THRESHOLD = int(os.getenv("COMPRESSION_THRESHOLD", default=4096))
+
+    ##########################
+    # Concurrent activemethods #
+    ##########################
+
+    # Number of threads calling the activemethods submitted with submit or map_active
+    ACTIVEMETHOD_WORKERS = int(os.getenv("ACTIVEMETHOD_WORKERS", default=64))
+
+    # Maximum number of calls of a map_active in flight to the same backend
+    ACTIVEMETHOD_MAX_IN_FLIGHT = int(os.getenv("ACTIVEMETHOD_MAX_IN_FLIGHT", default=8))
+
+    # Maximum number of calls queued by a batch. When reached, the calls are sent.
+    ACTIVEMETHOD_BATCH_SIZE = int(os.getenv("ACTIVEMETHOD_BATCH_SIZE", default=1000))
+
+    # Minimum bytes of a serialized result to send it in chunks. Generators are always sent
+    # in chunks, since they are iterated lazily.
+    ACTIVEMETHOD_STREAM_THRESHOLD = int(
+        os.getenv("ACTIVEMETHOD_STREAM_THRESHOLD", default=16 * 1024 * 1024)
+    )
+
+    # Bytes of the chunks of a streamed result
+    ACTIVEMETHOD_STREAM_CHUNK_SIZE = int(
+        os.getenv("ACTIVEMETHOD_STREAM_CHUNK_SIZE", default=1024 * 1024)
+    )
+
+    # Number of seconds a backend keeps a streamed result until the client starts reading it
+    ACTIVEMETHOD_STREAM_TTL = float(os.getenv("ACTIVEMETHOD_STREAM_TTL", default=300))
+
+    # Number of seconds a backend waits for the client to read the next chunk of a stream.
+    # The stream holds a backend worker while it is read, so idle streams are cancelled.
+    ACTIVEMETHOD_STREAM_IDLE_TIMEOUT = float(
+        os.getenv("ACTIVEMETHOD_STREAM_IDLE_TIMEOUT", default=60)
+    )
+
     #########################
     # Time outs and retries #
     #########################
@@ -36,6 +119,9 @@ class Settings:
     # Number of seconds to wait for grpc channel to be ready
     TIMEOUT_CHANNEL_READY = 5
 
+    # Number of seconds to wait before reconnecting to the backends watch of the metadata service
+    BACKENDS_WATCH_RETRY_INTERVAL = float(os.getenv("BACKENDS_WATCH_RETRY_INTERVAL", default=5))
+
     # MAX_RETRY_AUTOREGISTER = int(os.getenv("MAX_RETRY_AUTOREGISTER", default=80))
 
     # RETRY_AUTOREGISTER_TIME = int(os.getenv("RETRY_AUTOREGISTER_TIME", default=5000))
@@ -49,6 +135,36 @@ class Settings:
     # Waiting milliseconds to check if object to be registered.
     # SLEEP_WAIT_REGISTERED = 50
 
+    #########################
+    # Metadata registration #
+    #########################
+
+    # Maximum number of new objects in a backend pending to be registered in the metadata
+    METADATA_BATCH_SIZE = int(os.getenv("METADATA_BATCH_SIZE", default=1000))
+
+    # Maximum number of seconds a new object in a backend is pending to be registered
+    METADATA_BATCH_INTERVAL = float(os.getenv("METADATA_BATCH_INTERVAL", default=0.1))
+
+    #################
+    # Session cache #
+    #################
+
+    # Maximum number of sessions cached in a backend. 0 disables the cache
+    SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", default=1000))
+
+    # Number of seconds a cached session is considered valid
+    SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", default=300))
+
+    ################
+    # Client cache #
+    ################
+
+    # Maximum number of object metadata (and aliases) cached in the client. 0 disables the cache
+    METADATA_CACHE_SIZE = int(os.getenv("METADATA_CACHE_SIZE", default=10000))
+
+    # Number of seconds a cached object metadata (or alias) is considered valid
+    METADATA_CACHE_TTL = float(os.getenv("METADATA_CACHE_TTL", default=60))
+
     ########
     # gRPC #
     ########
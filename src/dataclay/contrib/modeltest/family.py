@@ -21,6 +21,10 @@ class Person(DataClayObject):
     def add_year(self):
         self.age += 1
 
+    @activemethod(read_only=True)
+    def get_age(self):
+        return self.age
+
 
 class Dog(DataClayObject):
 
@@ -67,6 +71,19 @@ class Family(DataClayObject):
     def add(self, new_member: Person):
         self.members.append(new_member)
 
+    @activemethod(read_only=True)
+    def iter_ages(self):
+        for member in self.members:
+            yield member.age
+
+    @activemethod
+    def iter_new_members(self, names, padding=0):
+        """Adds and yields new members, with a padding string of the given length"""
+        for name in names:
+            person = Person(name, 0)
+            self.members.append(person)
+            yield person, "x" * padding
+
     @activemethod
     def __str__(self) -> str:
         result = ["Members:"]
@@ -103,3 +120,87 @@ class Family(DataClayObject):
         members.append(dog)
         assert members is not self.members
         assert members != self.members
+
+    @activemethod
+    def test_clean_object_is_not_stored(self):
+        """Testing that an object that has only been read since it was loaded
+        is not stored again when unloaded, and that modified objects are.
+        """
+        from dataclay.runtime import get_runtime
+
+        heap_manager = get_runtime().heap_manager
+        person = Person("Marc", 24)
+
+        heap_manager.unload_object(person._dc_id)
+        stored = heap_manager.storage.get(person._dc_id)
+
+        assert person.get_age() == 24
+        assert not person._xdc_is_dirty
+
+        # If the clean object was stored again, it would be found after deleting it
+        heap_manager.storage.delete(person._dc_id)
+        heap_manager.unload_object(person._dc_id)
+        try:
+            heap_manager.storage.get(person._dc_id)
+            stored_again = True
+        except KeyError:
+            stored_again = False
+        heap_manager.storage.put(person._dc_id, stored)
+        assert not stored_again
+
+        person.add_year()
+        assert person._xdc_is_dirty
+        heap_manager.unload_object(person._dc_id)
+        assert person.get_age() == 25
+
+    @activemethod
+    def test_failed_activemethod_is_unloaded(self):
+        """Testing that an object can be unloaded after one of its activemethods raises"""
+        from dataclay.runtime import get_runtime
+
+        heap_manager = get_runtime().heap_manager
+        person = Person("Marc", 24)
+        try:
+            person.get_age("unexpected")
+        except TypeError:
+            pass
+        assert heap_manager.unload_object(person._dc_id, blocking=False)
+        assert person.get_age() == 24
+
+    @activemethod
+    def test_object_size_is_cached(self):
+        """Testing that the size of an object is estimated again only when it is modified"""
+        from dataclay.runtime import get_runtime
+
+        heap_manager = get_runtime().heap_manager
+        person = Person("Marc", 24)
+        size = heap_manager.get_object_size(person._dc_id)
+        heap_manager.get_eviction_score(person._dc_id)
+
+        assert person.get_age() == 24
+        assert heap_manager.object_sizes[person._dc_id] == size
+
+        person.name = "Marc" * 1000
+        assert person._dc_id not in heap_manager.object_sizes
+        assert heap_manager.get_object_size(person._dc_id) > size
+
+    @activemethod
+    def test_checkpoint_does_not_unload(self):
+        """Testing that a checkpoint stores the modified objects and keeps them loaded,
+        and skips the objects executing activemethods.
+        """
+        from dataclay.runtime import get_runtime
+
+        heap_manager = get_runtime().heap_manager
+        person = Person("Marc", 24)
+        person.add_year()
+        self.members.append(person)
+
+        assert heap_manager.checkpoint() >= 1
+        assert person._dc_is_loaded
+        assert not person._xdc_is_dirty
+        assert self._dc_id in heap_manager.loaded_objects
+
+        # The clean object is not stored again, so it must have been stored by the checkpoint
+        heap_manager.unload_object(person._dc_id)
+        assert person.get_age() == 25
@@ -46,3 +46,65 @@ class Matrix(DataClayObject):
         else:
             self.mtx += other
         return self
+
+    @activemethod
+    def test_large_buffers_are_memory_mapped(self):
+        """Testing that large arrays are stored apart from the object, memory-mapped
+        when the object is loaded, and still writable (copy-on-write).
+        """
+        import mmap
+
+        from dataclay.runtime import get_runtime
+
+        heap_manager = get_runtime().heap_manager
+        matrix = Matrix()
+        matrix.init_random((512, 512))
+        expected = matrix.mtx.copy()
+
+        heap_manager.unload_object(matrix._dc_id)
+        mtx = matrix.mtx
+        assert (mtx == expected).all()
+
+        base = mtx
+        while base is not None and not isinstance(base, mmap.mmap):
+            base = base.base if isinstance(base, np.ndarray) else getattr(base, "obj", None)
+        assert isinstance(base, mmap.mmap)
+
+        matrix.mtx += 1
+        heap_manager.unload_object(matrix._dc_id)
+        assert (matrix.mtx == expected + 1).all()
+
+    @activemethod
+    def test_properties_are_loaded_lazily(self):
+        """Testing that large properties are stored apart from the object, and
+        only loaded when accessed.
+        """
+        from dataclay.backend.storage import get_property_id
+        from dataclay.conf import settings
+        from dataclay.runtime import get_runtime
+
+        heap_manager = get_runtime().heap_manager
+        property_threshold = settings.STORAGE_PROPERTY_THRESHOLD
+        settings.STORAGE_PROPERTY_THRESHOLD = 1024
+        try:
+            matrix = Matrix()
+            matrix.init_random((64, 64))
+            expected = matrix.mtx.copy()
+            heap_manager.unload_object(matrix._dc_id)
+
+            assert matrix.shape == (64, 64)
+            assert "_dc_property_mtx" not in vars(matrix)
+            assert (matrix.mtx == expected).all()
+
+            # Properties that are not large anymore are stored with the object
+            matrix.mtx = np.zeros((2, 2))
+            heap_manager.unload_object(matrix._dc_id)
+            assert matrix.mtx.shape == (2, 2)
+            try:
+                heap_manager.storage.get(get_property_id(matrix._dc_id, "_dc_property_mtx"))
+                stored_apart = True
+            except KeyError:
+                stored_apart = False
+            assert not stored_apart
+        finally:
+            settings.STORAGE_PROPERTY_THRESHOLD = property_threshold
@@ -15,6 +15,7 @@ import threading
 import traceback
 import uuid
 from collections import ChainMap
+from concurrent.futures import Future
 from inspect import get_annotations
 from uuid import UUID
 
@@ -26,10 +27,26 @@ from dataclay.utils.tracing import trace
 
 DC_PROPERTY_PREFIX = "_dc_property_"
 
+# Metadata of the objects, stored in slots instead of the __dict__ (see DataClayObject)
+DC_HEADER_FIELDS = (
+    "_dc_id",
+    "_dc_dataset_name",
+    "_dc_backend_id",
+    "_dc_replica_backend_ids",
+    "_dc_is_read_only",
+    "_dc_is_local",
+    "_dc_is_registered",
+    "_dc_is_loaded",
+)
+XDC_HEADER_FIELDS = ("_xdc_counter", "_xdc_is_dirty", "_xdc_stored_apart")
+
 
 tracer = trace.get_tracer(__name__)
 logger = logging.getLogger(__name__)
 
+# Lock to create the ReadWriteLock of the objects lazily
+active_counter_lock = threading.Lock()
+
 
 class ReadWriteLock:
     """Atomic Counter lock that can only be acquired when the internal counter is zero.
@@ -70,8 +87,73 @@ class ReadWriteLock:
             self.cv.notify_all()
 
 
-def activemethod(func):
-    """Decorator for DataClayObject active methods"""
+class ActiveMethod:
+    """Descriptor of the activemethods, so they can also be awaited with the async client,
+    or submitted to a thread:
+
+        result = await obj.method.aio(*args, **kwargs)
+        future = obj.method.submit(*args, **kwargs)
+
+    Accessed from the class, it returns the decorated function.
+    """
+
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self.func = func
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.func
+        return BoundActiveMethod(self.func, instance)
+
+
+class BoundActiveMethod:
+    __slots__ = ("func", "instance")
+
+    def __init__(self, func, instance):
+        self.func = func
+        self.instance = instance
+
+    def __call__(self, *args, **kwargs):
+        return self.func(self.instance, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.func, name)
+
+    def submit(self, *args, **kwargs) -> Future:
+        """Calls the activemethod in a thread, without waiting for it"""
+        return get_runtime().submit_active_method(self.instance, self.func.__name__, args, kwargs)
+
+    async def aio(self, *args, **kwargs):
+        """Calls the activemethod without blocking the event loop if the object is remote"""
+        if self.instance._dc_is_local:
+            return self.func(self.instance, *args, **kwargs)
+        return await get_runtime().a_call_active_method(
+            self.instance, self.func.__name__, args, kwargs
+        )
+
+
+def map_active(objects, method_name, *args, **kwargs) -> list:
+    """Calls the activemethod of all the objects concurrently (see DataClayRuntime.map_active)"""
+    return get_runtime().map_active(objects, method_name, *args, **kwargs)
+
+
+def batch(max_size=None):
+    """Sends the remote calls of the block in one request per backend (see ActiveMethodBatch)"""
+    return get_runtime().batch(max_size)
+
+
+def activemethod(func=None, *, read_only=False):
+    """Decorator for DataClayObject active methods
+
+    Active methods declared read_only (i.e. @activemethod(read_only=True)) do not
+    mark the object as modified, so it is not stored again when unloaded.
+
+    With the async client, they can be awaited with obj.method.aio(...). They can also be
+    called without waiting for them with obj.method.submit(...), which returns a Future.
+    """
+    if func is None:
+        return functools.partial(activemethod, read_only=read_only)
 
     @functools.wraps(func)
     def wrapper_activemethod(self: DataClayObject, *args, **kwargs):
@@ -81,10 +163,16 @@ def activemethod(func):
             # else, executes the method in the backend
             if self._dc_is_local:
                 # TODO: Use active_counter only if inside backend
-                self._xdc_active_counter.add()
-                result = func(self, *args, **kwargs)
-                self._xdc_active_counter.sub()
-                return result
+                active_counter = self._xdc_active_counter
+                get_runtime().touch(self, modified=not read_only)
+                active_counter.add()
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    # NOTE: Marked after the call, since loading the object clears it
+                    if not read_only:
+                        self._xdc_is_dirty = True
+                    active_counter.sub()
             else:
                 return get_runtime().call_active_method(self, func.__name__, args, kwargs)
         except Exception:
@@ -92,7 +180,8 @@ def activemethod(func):
             raise
 
     # wrapper_activemethod.is_activemethod = True
-    return wrapper_activemethod
+    wrapper_activemethod.read_only = read_only
+    return ActiveMethod(wrapper_activemethod)
 
 
 class DataClayProperty:
@@ -117,10 +206,15 @@ class DataClayProperty:
         if instance._dc_is_local:
             try:
                 if not instance._dc_is_loaded:
-                    get_runtime().load_object_from_db(instance)
+                    get_runtime().load_object_from_db(instance, lazy=True)
 
+                get_runtime().touch(instance)
                 return getattr(instance, self.dc_property_name)
             except AttributeError as e:
+                # NOTE: Properties stored apart are loaded when accessed
+                if self.dc_property_name in instance._xdc_stored_apart:
+                    get_runtime().load_property_from_db(instance, self.dc_property_name)
+                    return getattr(instance, self.dc_property_name)
                 e.args = (e.args[0].replace(self.dc_property_name, self.property_name),)
                 raise e
         else:
@@ -139,8 +233,10 @@ class DataClayProperty:
 
         if instance._dc_is_local:
             if not instance._dc_is_loaded:
-                get_runtime().load_object_from_db(instance)
+                get_runtime().load_object_from_db(instance, lazy=True)
 
+            get_runtime().touch(instance, modified=True)
+            instance._xdc_is_dirty = True
             setattr(instance, self.dc_property_name, value)
         else:
             get_runtime().call_active_method(
@@ -153,8 +249,14 @@ class DataClayObject:
 
     Objects that has to be made persistent should derive this class (either
     directly, through the StorageObject alias, or through a derived class).
+
+    The metadata of the objects is kept in slots (DC_HEADER_FIELDS), and the
+    __dict__ only holds the properties, so proxies of remote objects are small.
+    The class and class name are attributes of the class.
     """
 
+    __slots__ = DC_HEADER_FIELDS + XDC_HEADER_FIELDS + ("__dict__", "__weakref__")
+
     _dc_id: UUID
     _dc_dataset_name: str
     _dc_class: type
@@ -165,10 +267,11 @@ class DataClayObject:
     _dc_is_read_only: bool
     _dc_is_loaded: bool
     _dc_is_local: bool
-    # _xdc_active_counter: ReadWriteLock # Commented to not break Pickle...
 
     def __init_subclass__(cls) -> None:
         """Defines a @property for each annotatted attribute"""
+        cls._dc_class = cls
+        cls._dc_class_name = cls.__module__ + "." + cls.__name__
         for property_name in ChainMap(*(get_annotations(c) for c in cls.__mro__)):
             if not property_name.startswith("_dc_"):
                 setattr(cls, property_name, DataClayProperty(property_name))
@@ -186,26 +289,48 @@ class DataClayObject:
 
     @classmethod
     def new_proxy_object(cls, **kwargs):
+        """Returns an object without calling __init__, with the _dc_ attributes in kwargs
+
+        The proxy gets no new _dc_id, since the caller always sets it.
+        """
         obj = super().__new__(cls)
-        obj.set_default_fields()
-        obj.__dict__.update(kwargs)
+        obj.set_default_fields(new_id=False)
+        obj.update_dc_dict(kwargs)
         return obj
 
-    def set_default_fields(self):
+    def set_default_fields(self, new_id=True):
         # Metadata fields
-        self._dc_id = uuid.uuid4()
+        self._dc_id = uuid.uuid4() if new_id else None
         self._dc_dataset_name = None
-        self._dc_class_name = self.__class__.__module__ + "." + self.__class__.__name__
         self._dc_backend_id = None
-        self._dc_replica_backend_ids = []
+        self._dc_replica_backend_ids = ()
         self._dc_is_read_only = False  # Remove it?
         self._dc_is_local = True
 
         # Extra fields
-        self._dc_class = self.__class__
         self._dc_is_registered = False  # cannot be unset (unregistered)
         self._dc_is_loaded = True
-        self._xdc_active_counter = ReadWriteLock()
+
+        # NOTE: The ReadWriteLock is created when first used (see _xdc_active_counter),
+        # since most proxies never execute activemethods locally
+        self._xdc_counter = None
+
+        # Modified since it was loaded from storage (or never stored)
+        self._xdc_is_dirty = True
+
+        # Properties stored apart from the object, which are loaded when accessed
+        self._xdc_stored_apart = ()
+
+    @property
+    def _xdc_active_counter(self) -> ReadWriteLock:
+        """ReadWriteLock that prevents unloading the object while executing activemethods"""
+        counter = self._xdc_counter
+        if counter is None:
+            with active_counter_lock:
+                counter = self._xdc_counter
+                if counter is None:
+                    counter = self._xdc_counter = ReadWriteLock()
+        return counter
 
     @property
     def dataclay_id(self):
@@ -224,8 +349,20 @@ class DataClayObject:
 
     @property
     def _dc_dict(self):
-        """Returns __dict__ with only _dc_ attributes"""
-        return {k: v for k, v in vars(self).items() if k.startswith("_dc_")}
+        """Returns the _dc_ attributes: the metadata, the class and the properties"""
+        dc_dict = {name: getattr(self, name) for name in DC_HEADER_FIELDS}
+        dc_dict["_dc_class"] = self._dc_class
+        dc_dict["_dc_class_name"] = self._dc_class_name
+        dc_dict.update(self._dc_properties)
+        return dc_dict
+
+    def update_dc_dict(self, dc_dict):
+        """Sets the attributes in dc_dict (as returned by _dc_dict)"""
+        for name, value in dc_dict.items():
+            if name.startswith(DC_PROPERTY_PREFIX):
+                vars(self)[name] = value
+            elif name not in ("_dc_class", "_dc_class_name"):
+                setattr(self, name, value)
 
     @property
     def _dc_properties(self):
@@ -272,10 +409,22 @@ class DataClayObject:
             raise AttributeError("Alias cannot be empty")
         get_runtime().make_persistent(self, alias=alias, backend_id=backend_id, recursive=recursive)
 
+    async def a_make_persistent(self, alias=None, backend_id=None, recursive=True):
+        """make_persistent that does not block the event loop (see dataclay.async_client)"""
+        if alias == "":
+            raise AttributeError("Alias cannot be empty")
+        await get_runtime().a_make_persistent(
+            self, alias=alias, backend_id=backend_id, recursive=recursive
+        )
+
     @classmethod
     def get_by_id(cls, object_id: UUID):
         return get_runtime().get_object_by_id(object_id)
 
+    @classmethod
+    def get_by_ids(cls, object_ids: list[UUID]):
+        return get_runtime().get_objects_by_ids(object_ids)
+
     @classmethod
     def get_by_alias(cls, alias, dataset_name=None):
         # NOTE: "safe" was removed. The object_id cannot be obtained from alias string.
@@ -283,6 +432,11 @@ class DataClayObject:
         #       the default_dataset is used.
         return get_runtime().get_object_by_alias(alias, dataset_name)
 
+    @classmethod
+    async def a_get_by_alias(cls, alias, dataset_name=None):
+        """get_by_alias that does not block the event loop (see dataclay.async_client)"""
+        return await get_runtime().a_get_object_by_alias(alias, dataset_name)
+
     @classmethod
     def delete_alias(cls, alias, dataset_name=None):
         get_runtime().delete_alias_in_dataclay(alias, dataset_name=dataset_name)
@@ -427,20 +581,18 @@ class DataClayObject:
         pass
 
     def add_replica_location(self, new_replica_location):
-        replica_locations = self._dc_replica_backend_ids
-        if replica_locations is None:
-            replica_locations = list()
-            self._dc_replica_backend_ids = replica_locations
+        # NOTE: The default is an empty tuple, shared by all the objects
+        replica_locations = list(self._dc_replica_backend_ids or ())
         replica_locations.append(new_replica_location)
+        self._dc_replica_backend_ids = replica_locations
 
     def remove_replica_location(self, old_replica_location):
-        replica_locations = self._dc_replica_backend_ids
+        replica_locations = list(self._dc_replica_backend_ids)
         replica_locations.remove(old_replica_location)
+        self._dc_replica_backend_ids = replica_locations
 
     def clear_replica_locations(self):
-        replica_locations = self._dc_replica_backend_ids
-        if replica_locations is not None:
-            replica_locations.clear()
+        self._dc_replica_backend_ids = ()
 
     ##############
     # Federation #
@@ -1,6 +1,6 @@
+import asyncio
 import logging
 import signal
-import threading
 from concurrent import futures
 
 import grpc
@@ -15,9 +15,7 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
-def serve():
-
-    stop_event = threading.Event()
+async def serve():
 
     metadata_service = MetadataAPI(settings.DATACLAY_KV_HOST, settings.DATACLAY_KV_PORT)
     if not metadata_service.is_ready(timeout=10):
@@ -34,6 +32,7 @@ def serve():
         )
     except AlreadyExistError:
         settings.DATACLAY_ID = metadata_service.get_dataclay("this").id
+        metadata_service.build_indexes()
     else:
         metadata_service.new_superuser(
             settings.DATACLAY_USERNAME, settings.DATACLAY_PASSWORD, settings.DATACLAY_DATASET
@@ -41,24 +40,30 @@ def serve():
 
     logger.info("Metadata service has been registered")
 
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=settings.THREAD_POOL_WORKERS))
-    metadata_service_pb2_grpc.add_MetadataServiceServicer_to_server(
-        MetadataServicer(metadata_service), server
+    # NOTE: The unary RPCs are executed in the thread pool, and the streaming RPCs
+    # (WatchBackends) in the event loop, so connected watchers don't hold threads
+    server = grpc.aio.server(
+        migration_thread_pool=futures.ThreadPoolExecutor(max_workers=settings.THREAD_POOL_WORKERS)
     )
+    servicer = MetadataServicer(metadata_service)
+    metadata_service_pb2_grpc.add_MetadataServiceServicer_to_server(servicer, server)
 
     address = f"{settings.DATACLAY_METADATA_LISTEN_ADDRESS}:{settings.DATACLAY_METADATA_PORT}"
     server.add_insecure_port(address)
-    server.start()
+    await server.start()
 
     # Set signal hook for SIGINT and SIGTERM
-    signal.signal(signal.SIGINT, lambda sig, frame: stop_event.set())
-    signal.signal(signal.SIGTERM, lambda sig, frame: stop_event.set())
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, stop_event.set)
+    loop.add_signal_handler(signal.SIGTERM, stop_event.set)
 
     # Wait until stop_event is set. Then, gracefully stop dataclay backend.
-    stop_event.wait()
+    await stop_event.wait()
 
-    server.stop(5)
+    servicer.backends_broadcaster.stop()
+    await server.stop(5)
 
 
 settings.load_metadata_properties()
-serve()
+asyncio.run(serve())
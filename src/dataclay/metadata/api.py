@@ -80,18 +80,22 @@ class MetadataAPI:
     def close_session(self, session_id: UUID):
         # TODO: decide if close session remove the entry from etcd
         #       or just set the flag is_active to false
+        session = self.kv_manager.get_kv(Session, session_id)
 
-        # session = self.session_mgr.get_session(session_id)
-        # if not session.is_active:
-        #     raise SessionIsNotActiveError(session_id)
+        # NOTE: Closing a closed session is a no-op, since the client may retry the call
+        if not session.is_active:
+            return
 
-        # session.is_active = False
-        # self.session_mgr.put_session(session)
+        session.is_active = False
+        self.kv_manager.update(session)
 
-        # if not self.session_mgr.exists_session(session_id):
-        #     raise SessionDoesNotExistError(session_id)
-        # self.session_mgr.delete_session(session_id)
-        pass
+        # Notify the backends caching the session
+        self.kv_manager.publish("/closed" + Session.path, str(session_id))
+
+    def watch_closed_sessions(self, stop_event=None):
+        """Yields the id of every session closed from now on, until stop_event is set"""
+        for message in self.kv_manager.listen("/closed" + Session.path, stop_event):
+            yield UUID(message.decode())
 
     ###########
     # Account #
@@ -190,28 +194,64 @@ class MetadataAPI:
     @tracer.start_as_current_span("get_all_backends")
     def get_all_backends(self, from_backend=False) -> dict:
         """Get all backends"""
-        result = self.kv_manager.getprefix(Backend, "/backend/")
-        return {UUID(k): v for k, v in result.items()}
+        backends = self.kv_manager.iter_index(Backend, Backend.index())
+        return {backend.id: backend for backend in backends}
+
+    def watch_backends(self, from_backend=False, stop_event=None):
+        """Yields all backends every time a backend is registered or deleted
+
+        The current backends are yielded right away. The generator runs
+        until stop_event is set.
+        """
+        for _ in self.kv_manager.watch_version(Backend.path, stop_event):
+            yield self.get_all_backends(from_backend)
 
     @tracer.start_as_current_span("register_backend")
     def register_backend(self, id: UUID, hostname: str, port: int, dataclay_id: UUID):
         """Register backend"""
         backend = Backend(id, hostname, port, dataclay_id)
         self.kv_manager.set_new(backend)
+        self.kv_manager.bump_version(Backend.path)
         logger.info(f"Registered new backend with id={id}, hostname={hostname}, port={port}")
 
-    @tracer.start_as_current_span("register_backend")
+    @tracer.start_as_current_span("delete_backend")
     def delete_backend(self, id: UUID):
-        """Register backend"""
-        self.kv_manager.delete_kv(Backend.path + str(id))
+        """Delete backend"""
+        self.kv_manager.delete_kv(Backend, id)
+        self.kv_manager.bump_version(Backend.path)
 
     ###################
     # Dataclay Object #
     ###################
 
     def get_all_objects(self):
-        result = self.kv_manager.getprefix(ObjectMetadata, "/object/")
-        return result
+        objects = self.kv_manager.iter_index(ObjectMetadata, ObjectMetadata.index())
+        return {object_md.id: object_md for object_md in objects}
+
+    def scan_objects(
+        self, cursor=0, count=1000, backend_id=None, dataset_name=None, class_name=None
+    ) -> tuple[int, list[ObjectMetadata]]:
+        """Get a page of the objects metadata of a backend, dataset or class (or all of them)
+
+        Returns the cursor of the next page (0 when there are no more pages), and the
+        objects metadata. Only one of backend_id, dataset_name or class_name is used.
+        """
+        index = ObjectMetadata.index(backend_id, dataset_name, class_name)
+        return self.kv_manager.scan_index(ObjectMetadata, index, cursor, count)
+
+    def iter_objects(self, count=1000, backend_id=None, dataset_name=None, class_name=None):
+        """Iterate over the objects metadata of a backend, dataset or class (or all of them)"""
+        index = ObjectMetadata.index(backend_id, dataset_name, class_name)
+        return self.kv_manager.iter_index(ObjectMetadata, index, count)
+
+    def count_objects(self, backend_id=None, dataset_name=None, class_name=None) -> int:
+        """Number of objects of a backend, dataset or class (or all of them)"""
+        index = ObjectMetadata.index(backend_id, dataset_name, class_name)
+        return self.kv_manager.count_index(index)
+
+    def build_indexes(self):
+        """Build the index sets of backends and objects registered by older versions"""
+        self.kv_manager.build_indexes(Backend, ObjectMetadata)
 
     @tracer.start_as_current_span("register_object")
     def register_object(self, object_md: ObjectMetadata, session_id: UUID = None):
@@ -227,6 +267,11 @@ class MetadataAPI:
 
         self.kv_manager.set(object_md)
 
+    @tracer.start_as_current_span("register_objects")
+    def register_objects(self, object_mds: list[ObjectMetadata], session_id: UUID = None):
+        # NOTE: Same as "register_object", but all the objects are set in one round trip
+        self.kv_manager.set_many(object_mds)
+
     @tracer.start_as_current_span("get_object_md_by_id")
     def get_object_md_by_id(self, object_id: UUID, session_id=None, check_session=False):
         if check_session:
@@ -237,6 +282,15 @@ class MetadataAPI:
         object_md = self.kv_manager.get_kv(ObjectMetadata, object_id)
         return object_md
 
+    @tracer.start_as_current_span("get_object_mds_by_ids")
+    def get_object_mds_by_ids(self, object_ids, session_id=None, check_session=False):
+        if check_session:
+            session = self.kv_manager.get_kv(Session, session_id)
+            if not session.is_active:
+                raise SessionIsNotActiveError(session_id)
+
+        return self.kv_manager.get_kv_many(ObjectMetadata, object_ids)
+
     @tracer.start_as_current_span("get_object_md_by_alias")
     def get_object_md_by_alias(
         self, alias_name: str, dataset_name: str, session_id: UUID = None, check_session=False
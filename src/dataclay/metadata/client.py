@@ -11,7 +11,8 @@ from dataclay.protos import (
     metadata_service_pb2,
     metadata_service_pb2_grpc,
 )
-from dataclay.utils.decorators import grpc_error_handler
+from dataclay.utils.decorators import aio_grpc_error_handler, grpc_error_handler
+from dataclay.utils.uuid import uuid_to_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,7 @@ class MetadataClient:
 
     @grpc_error_handler
     def close_session(self, session_id: UUID):
-        request = metadata_service_pb2.CloseSessionRequest(id=str(session_id))
+        request = metadata_service_pb2.CloseSessionRequest(id=uuid_to_bytes(session_id))
         self.stub.CloseSession(request)
 
     ###################
@@ -97,28 +98,54 @@ class MetadataClient:
             result[UUID(id)] = Backend.from_proto(proto)
         return result
 
+    def watch_backends(self, from_backend=False, stop_event=None):
+        """Yields all backends every time a backend is registered or deleted
+
+        The stream is cancelled when the client is closed.
+        """
+        request = metadata_service_pb2.GetAllBackendsRequest(from_backend=from_backend)
+        for response in self.stub.WatchBackends(request):
+            if stop_event is not None and stop_event.is_set():
+                break
+
+            result = dict()
+            for id, proto in response.backends.items():
+                result[UUID(id)] = Backend.from_proto(proto)
+            yield result
+
     ###################
     # Object Metadata #
     ###################
 
     def register_object(self, object_md: ObjectMetadata, session_id: UUID):
         request = metadata_service_pb2.RegisterObjectRequest(
-            session_id=str(session_id), object_md=object_md.get_proto()
+            session_id=uuid_to_bytes(session_id), object_md=object_md.get_proto()
         )
         self.stub.RegisterObject(request)
 
     @grpc_error_handler
     def get_object_md_by_id(self, object_id: UUID) -> ObjectMetadata:
         request = metadata_service_pb2.GetObjectMDByIdRequest(
-            session_id=str(self.session.id), object_id=str(object_id)
+            session_id=uuid_to_bytes(self.session.id), object_id=uuid_to_bytes(object_id)
         )
         object_md_proto = self.stub.GetObjectMDById(request)
         return ObjectMetadata.from_proto(object_md_proto)
 
+    @grpc_error_handler
+    def get_object_mds_by_ids(self, object_ids) -> list[ObjectMetadata]:
+        request = metadata_service_pb2.GetObjectMDsByIdsRequest(
+            session_id=uuid_to_bytes(self.session.id),
+            object_ids=list(map(uuid_to_bytes, object_ids)),
+        )
+        response = self.stub.GetObjectMDsByIds(request)
+        return [ObjectMetadata.from_proto(proto) for proto in response.object_mds]
+
     @grpc_error_handler
     def get_object_md_by_alias(self, alias_name: str, dataset_name: str) -> ObjectMetadata:
         request = metadata_service_pb2.GetObjectMDByAliasRequest(
-            session_id=str(self.session.id), alias_name=alias_name, dataset_name=dataset_name
+            session_id=uuid_to_bytes(self.session.id),
+            alias_name=alias_name,
+            dataset_name=dataset_name,
         )
         object_md_proto = self.stub.GetObjectMDByAlias(request)
         return ObjectMetadata.from_proto(object_md_proto)
@@ -130,16 +157,85 @@ class MetadataClient:
     @grpc_error_handler
     def new_alias(self, alias_name: str, dataset_name: str, object_id: UUID):
         request = metadata_service_pb2.NewAliasRequest(
-            session_id=str(self.session.id),
+            session_id=uuid_to_bytes(self.session.id),
             alias_name=alias_name,
             dataset_name=dataset_name,
-            object_id=str(object_id),
+            object_id=uuid_to_bytes(object_id),
         )
         self.stub.NewAlias(request)
 
     @grpc_error_handler
     def delete_alias(self, alias_name: str, dataset_name: str, session_id: UUID):
         request = metadata_service_pb2.DeleteAliasRequest(
-            session_id=str(session_id), alias_name=alias_name, dataset_name=dataset_name
+            session_id=uuid_to_bytes(session_id), alias_name=alias_name, dataset_name=dataset_name
         )
         self.stub.DeleteAlias(request)
+
+
+class AsyncMetadataClient:
+    """Client of the metadata service for asyncio, on a grpc.aio channel
+
+    Only the calls used by the async client API are provided. Its channel is bound to
+    the event loop where it is created.
+    """
+
+    session: Session
+
+    def __init__(self, hostname, port):
+        self.address = f"{hostname}:{port}"
+        self.channel = grpc.aio.insecure_channel(self.address)
+        self.stub = metadata_service_pb2_grpc.MetadataServiceStub(self.channel)
+
+    async def close(self):
+        await self.channel.close()
+
+    @aio_grpc_error_handler
+    async def new_session(self, username: str, password: str, dataset_name: str) -> Session:
+        request = metadata_service_pb2.NewSessionRequest(
+            username=username, password=password, dataset_name=dataset_name
+        )
+        response = await self.stub.NewSession(request)
+        return Session.from_proto(response)
+
+    @aio_grpc_error_handler
+    async def close_session(self, session_id: UUID):
+        request = metadata_service_pb2.CloseSessionRequest(id=uuid_to_bytes(session_id))
+        await self.stub.CloseSession(request)
+
+    @aio_grpc_error_handler
+    async def get_all_backends(self, from_backend=False) -> dict:
+        request = metadata_service_pb2.GetAllBackendsRequest(from_backend=from_backend)
+        response = await self.stub.GetAllBackends(request)
+
+        result = dict()
+        for id, proto in response.backends.items():
+            result[UUID(id)] = Backend.from_proto(proto)
+        return result
+
+    @aio_grpc_error_handler
+    async def get_object_md_by_id(self, object_id: UUID) -> ObjectMetadata:
+        request = metadata_service_pb2.GetObjectMDByIdRequest(
+            session_id=uuid_to_bytes(self.session.id), object_id=uuid_to_bytes(object_id)
+        )
+        object_md_proto = await self.stub.GetObjectMDById(request)
+        return ObjectMetadata.from_proto(object_md_proto)
+
+    @aio_grpc_error_handler
+    async def get_object_md_by_alias(self, alias_name: str, dataset_name: str) -> ObjectMetadata:
+        request = metadata_service_pb2.GetObjectMDByAliasRequest(
+            session_id=uuid_to_bytes(self.session.id),
+            alias_name=alias_name,
+            dataset_name=dataset_name,
+        )
+        object_md_proto = await self.stub.GetObjectMDByAlias(request)
+        return ObjectMetadata.from_proto(object_md_proto)
+
+    @aio_grpc_error_handler
+    async def new_alias(self, alias_name: str, dataset_name: str, object_id: UUID):
+        request = metadata_service_pb2.NewAliasRequest(
+            session_id=uuid_to_bytes(self.session.id),
+            alias_name=alias_name,
+            dataset_name=dataset_name,
+            object_id=uuid_to_bytes(object_id),
+        )
+        await self.stub.NewAlias(request)
@@ -1,4 +1,5 @@
 import json
+import struct
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from uuid import UUID
@@ -8,6 +9,7 @@ import bcrypt
 from dataclay.exceptions import *
 from dataclay.protos import common_messages_pb2
 from dataclay.utils.json import UUIDEncoder, uuid_parser
+from dataclay.utils.uuid import uuid_from_bytes, uuid_to_bytes
 
 
 class KeyValue(ABC):
@@ -25,10 +27,23 @@ class KeyValue(ABC):
     def path(self):
         pass
 
+    # NOTE: Indexed classes must override "indexes", the names of the index sets
+    # where the key is added. The index sets are maintained by the kv manager.
+    indexed = False
+
+    @property
+    def indexes(self):
+        return ()
+
     @classmethod
     def from_json(cls, s):
         return cls(**json.loads(s, object_hook=uuid_parser))
 
+    @classmethod
+    def from_value(cls, value):
+        """Decode a value read from the kv store"""
+        return cls.from_json(value)
+
     # NOTE: This is an alternative of "RedisManager.get_kv(...)"
     # @classmethod
     # def from_kv(cls, kv_manager, id):
@@ -57,7 +72,7 @@ class Dataclay(KeyValue):
     @classmethod
     def from_proto(cls, proto):
         return cls(
-            UUID(proto.id),
+            uuid_from_bytes(proto.id),
             proto.hostname,
             proto.port,
             proto.is_this,
@@ -65,7 +80,7 @@ class Dataclay(KeyValue):
 
     def get_proto(self):
         return common_messages_pb2.Dataclay(
-            id=str(self.id),
+            id=uuid_to_bytes(self.id),
             hostname=self.hostname,
             port=self.port,
             is_this=self.is_this,
@@ -76,6 +91,7 @@ class Dataclay(KeyValue):
 class Backend(KeyValue):
 
     path = "/backend/"
+    indexed = True
 
     id: UUID
     hostname: str
@@ -86,29 +102,56 @@ class Backend(KeyValue):
     def key(self):
         return self.path + str(self.id)
 
+    @property
+    def indexes(self):
+        return (self.index(),)
+
+    @classmethod
+    def index(cls):
+        """Name of the index set of all backends"""
+        return "/index/backend/"
+
     @classmethod
     def from_proto(cls, proto):
         return cls(
-            UUID(proto.id),
+            uuid_from_bytes(proto.id),
             proto.hostname,
             proto.port,
-            UUID(proto.dataclay_id),
+            uuid_from_bytes(proto.dataclay_id),
         )
 
     # TODO: Improve it with __getattributes__ and interface
     def get_proto(self):
         return common_messages_pb2.Backend(
-            id=str(self.id),
+            id=uuid_to_bytes(self.id),
             hostname=self.hostname,
             port=self.port,
-            dataclay_id=str(self.dataclay_id),
+            dataclay_id=uuid_to_bytes(self.dataclay_id),
         )
 
 
+# ObjectMetadata binary encoding: a header with the version, the flags, the language
+# and the number of replicas; followed by the UUIDs (16 bytes each) and the strings
+# (prefixed by their length). The flags indicate which of the optional fields are present.
+OBJECT_MD_VERSION = 1
+OBJECT_MD_HEADER = struct.Struct("<BBBH")
+STR_LENGTH = struct.Struct("<H")
+STR_MAX_LENGTH = 2 ** (8 * STR_LENGTH.size) - 1
+
+FLAG_READ_ONLY = 1 << 0
+FLAG_ID = 1 << 1
+FLAG_BACKEND_ID = 1 << 2
+FLAG_ALIAS_NAME = 1 << 3
+FLAG_DATASET_NAME = 1 << 4
+FLAG_CLASS_NAME = 1 << 5
+FLAG_LANGUAGE = 1 << 6
+
+
 @dataclass
 class ObjectMetadata(KeyValue):
 
     path = "/object/"
+    indexed = True
 
     id: UUID = None
     alias_name: str = None
@@ -123,27 +166,129 @@ class ObjectMetadata(KeyValue):
     def key(self):
         return self.path + str(self.id)
 
+    @property
+    def value(self):
+        flags = FLAG_READ_ONLY if self.is_read_only else 0
+        uuids = []
+        for flag, uuid in ((FLAG_ID, self.id), (FLAG_BACKEND_ID, self.backend_id)):
+            if uuid is not None:
+                flags |= flag
+                uuids.append(uuid.bytes)
+
+        replica_backend_ids = self.replica_backend_ids or []
+        uuids.extend(replica_id.bytes for replica_id in replica_backend_ids)
+
+        strings = []
+        for flag, string in (
+            (FLAG_ALIAS_NAME, self.alias_name),
+            (FLAG_DATASET_NAME, self.dataset_name),
+            (FLAG_CLASS_NAME, self.class_name),
+        ):
+            if string is not None:
+                flags |= flag
+                encoded = string.encode()
+                if len(encoded) > STR_MAX_LENGTH:
+                    raise ValueError(
+                        f"Object {self.id} has a string of {len(encoded)} bytes, "
+                        f"longer than the maximum of {STR_MAX_LENGTH}: {string[:64]}..."
+                    )
+                strings.append(STR_LENGTH.pack(len(encoded)))
+                strings.append(encoded)
+
+        language = 0
+        if self.language is not None:
+            flags |= FLAG_LANGUAGE
+            language = self.language
+
+        header = OBJECT_MD_HEADER.pack(OBJECT_MD_VERSION, flags, language, len(replica_backend_ids))
+        return b"".join((header, *uuids, *strings))
+
+    @classmethod
+    def from_value(cls, value):
+        # NOTE: Values written by older versions are JSON, which always start with "{"
+        if value[0] != OBJECT_MD_VERSION:
+            return cls.from_json(value)
+
+        _, flags, language, num_replicas = OBJECT_MD_HEADER.unpack_from(value)
+        offset = OBJECT_MD_HEADER.size
+
+        object_id = backend_id = None
+        if flags & FLAG_ID:
+            object_id = UUID(bytes=value[offset : offset + 16])
+            offset += 16
+        if flags & FLAG_BACKEND_ID:
+            backend_id = UUID(bytes=value[offset : offset + 16])
+            offset += 16
+
+        replica_backend_ids = []
+        for _ in range(num_replicas):
+            replica_backend_ids.append(UUID(bytes=value[offset : offset + 16]))
+            offset += 16
+
+        strings = []
+        for flag in (FLAG_ALIAS_NAME, FLAG_DATASET_NAME, FLAG_CLASS_NAME):
+            if flags & flag:
+                (length,) = STR_LENGTH.unpack_from(value, offset)
+                offset += STR_LENGTH.size
+                strings.append(value[offset : offset + length].decode())
+                offset += length
+            else:
+                strings.append(None)
+        alias_name, dataset_name, class_name = strings
+
+        return cls(
+            object_id,
+            alias_name,
+            dataset_name,
+            class_name,
+            backend_id,
+            replica_backend_ids,
+            language if flags & FLAG_LANGUAGE else None,
+            bool(flags & FLAG_READ_ONLY),
+        )
+
+    @property
+    def indexes(self):
+        return (
+            self.index(),
+            self.index(backend_id=self.backend_id),
+            self.index(dataset_name=self.dataset_name),
+            self.index(class_name=self.class_name),
+        )
+
+    @classmethod
+    def index(cls, backend_id=None, dataset_name=None, class_name=None):
+        """Name of the index set of all objects, or the objects of a backend, dataset or class"""
+        if backend_id is not None:
+            return f"/index/object/backend/{backend_id}"
+        elif dataset_name is not None:
+            return f"/index/object/dataset/{dataset_name}"
+        elif class_name is not None:
+            return f"/index/object/class/{class_name}"
+        else:
+            return "/index/object/"
+
     @classmethod
     def from_proto(cls, proto):
         return cls(
-            UUID(proto.id),
+            uuid_from_bytes(proto.id),
             proto.alias_name if proto.alias_name != "" else None,
             proto.dataset_name,
             proto.class_name,
-            UUID(proto.backend_id),
-            list(map(UUID, proto.replica_backend_ids)),
+            uuid_from_bytes(proto.backend_id),
+            list(map(uuid_from_bytes, proto.replica_backend_ids)),
             proto.language,
             proto.is_read_only,
         )
 
     def get_proto(self):
         return common_messages_pb2.ObjectMetadata(
-            id=str(self.id),
+            id=uuid_to_bytes(self.id),
             alias_name=self.alias_name,
             dataset_name=self.dataset_name,
             class_name=self.class_name,
-            backend_id=str(self.backend_id),
-            replica_backend_ids=list(map(str, self.replica_backend_ids)),
+            backend_id=uuid_to_bytes(self.backend_id),
+            replica_backend_ids=list(map(uuid_to_bytes, self.replica_backend_ids)),
             language=self.language,
             is_read_only=self.is_read_only,
         )
@@ -179,11 +324,11 @@ class Session(KeyValue):
 
     @classmethod
     def from_proto(cls, proto):
-        return cls(UUID(proto.id), proto.username, proto.dataset_name, proto.is_active)
+        return cls(uuid_from_bytes(proto.id), proto.username, proto.dataset_name, proto.is_active)
 
     def get_proto(self):
         return common_messages_pb2.Session(
-            id=str(self.id),
+            id=uuid_to_bytes(self.id),
             username=self.username,
             dataset_name=self.dataset_name,
             is_active=self.is_active,
@@ -13,7 +13,8 @@ if TYPE_CHECKING:
 
 class RedisManager:
     def __init__(self, host, port=6379):
-        self.r_client = redis.Redis(host=host, port=port, decode_responses=True)
+        # NOTE: Responses are not decoded, since some values are binary encoded
+        self.r_client = redis.Redis(host=host, port=port)
 
     def is_ready(self, timeout=None, pause=0.5):
         ref = time.time()
@@ -32,20 +33,91 @@ class RedisManager:
         Use "set" if the kew is using a UUID, in order to optimize for etcd (if used)
         """
 
-        if not self.r_client.set(kv_object.key, kv_object.value, nx=True):
+        if kv_object.indexed:
+            self.set_indexed([kv_object], nx=True)
+        elif not self.r_client.set(kv_object.key, kv_object.value, nx=True):
             raise AlreadyExistError(kv_object.key)
 
     def set(self, kv_object):
-        self.r_client.set(kv_object.key, kv_object.value)
+        if kv_object.indexed:
+            self.set_indexed([kv_object])
+        else:
+            self.r_client.set(kv_object.key, kv_object.value)
+
+    def set_many(self, kv_objects, batch_size=1000):
+        """Set many kv_objects
+
+        Keys are set with MSET in batches of batch_size, all sent in one pipeline.
+        Indexed kv_objects are set in one transaction per batch.
+        """
+        if kv_objects and kv_objects[0].indexed:
+            for i in range(0, len(kv_objects), batch_size):
+                self.set_indexed(kv_objects[i : i + batch_size])
+            return
+
+        pipeline = self.r_client.pipeline(transaction=False)
+        for i in range(0, len(kv_objects), batch_size):
+            pipeline.mset({kv.key: kv.value for kv in kv_objects[i : i + batch_size]})
+        pipeline.execute()
 
     def update(self, kv_object):
         """Updates a key that already exists.
 
         It could be used "set(..)" instead, but "update" makes sure the key was not deleted
         """
-        if not self.r_client.set(kv_object.key, kv_object.value, xx=True):
+        if kv_object.indexed:
+            self.set_indexed([kv_object], xx=True)
+        elif not self.r_client.set(kv_object.key, kv_object.value, xx=True):
             raise DoesNotExistError(kv_object.key)
 
+    def set_indexed(self, kv_objects, nx=False, xx=False):
+        """Set kv_objects (of the same class) and update their index sets
+
+        The old values are read to remove the keys from the index sets they no longer
+        belong to. The keys are watched, so the transaction is retried if any of them
+        is modified in the meantime.
+        """
+        kv_class = type(kv_objects[0])
+        names = [kv.key for kv in kv_objects]
+
+        def set_transaction(pipe):
+            old_values = pipe.mget(names)
+            for name, old_value in zip(names, old_values):
+                if nx and old_value is not None:
+                    raise AlreadyExistError(name)
+                if xx and old_value is None:
+                    raise DoesNotExistError(name)
+
+            pipe.multi()
+            for kv, old_value in zip(kv_objects, old_values):
+                pipe.set(kv.key, kv.value)
+                new_indexes = set(kv.indexes)
+                if old_value is not None:
+                    for index in set(kv_class.from_value(old_value).indexes) - new_indexes:
+                        pipe.srem(index, kv.key)
+                for index in new_indexes:
+                    pipe.sadd(index, kv.key)
+
+        self.r_client.transaction(set_transaction, *names)
+
+    def delete_indexed(self, kv_class: KeyValue, names):
+        """Delete keys of an indexed kv_class and remove them from their index sets
+
+        Returns the old values
+        """
+
+        def delete_transaction(pipe):
+            old_values = pipe.mget(names)
+            pipe.multi()
+            pipe.delete(*names)
+            for name, old_value in zip(names, old_values):
+                if old_value is not None:
+                    for index in kv_class.from_value(old_value).indexes:
+                        pipe.srem(index, name)
+            return old_values
+
+        return self.r_client.transaction(delete_transaction, *names, value_from_callable=True)
+
     def get_kv(self, kv_class: KeyValue, id):
         """Get kv_class"""
 
@@ -54,30 +126,146 @@ class RedisManager:
         if value is None:
             raise DoesNotExistError(name)
 
-        return kv_class.from_json(value)
+        return kv_class.from_value(value)
+
+    def get_kv_many(self, kv_class: KeyValue, ids, batch_size=1000):
+        """Get a list of kv_class, in the same order as ids
+
+        Keys are fetched with MGET in batches of batch_size, all sent in one pipeline.
+        """
+        names = [kv_class.path + str(id) for id in ids]
+
+        pipeline = self.r_client.pipeline(transaction=False)
+        for i in range(0, len(names), batch_size):
+            pipeline.mget(names[i : i + batch_size])
+
+        result = []
+        for values in pipeline.execute():
+            for value in values:
+                if value is None:
+                    raise DoesNotExistError(names[len(result)])
+                result.append(kv_class.from_value(value))
+        return result
 
     def getdel_kv(self, kv_class: KeyValue, id):
         """Get kv_class and delete key"""
 
         name = kv_class.path + str(id)
-        value = self.r_client.getdel(name)
+        if kv_class.indexed:
+            (value,) = self.delete_indexed(kv_class, [name])
+        else:
+            value = self.r_client.getdel(name)
         if value is None:
             raise DoesNotExistError(name)
 
-        return kv_class.from_json(value)
+        return kv_class.from_value(value)
 
-    def delete_kv(self, *names):
-        """Delete one or more keys"""
-        self.r_client.delete(*names)
+    def delete_kv(self, kv_class: KeyValue, *ids):
+        """Delete one or more kv_class"""
+        names = [kv_class.path + str(id) for id in ids]
+        if kv_class.indexed:
+            self.delete_indexed(kv_class, names)
+        else:
+            self.r_client.delete(*names)
 
-    def getprefix(self, kv_class: KeyValue, prefix):
-        """Get a dict for all kv with prefix"""
-        result = dict()
-        for key in self.r_client.scan_iter(prefix + "*"):
-            value = self.r_client.get(key)
-            value = kv_class.from_json(value)
-            result[key.removeprefix(prefix)] = value
-        return result
+    ###########
+    # Indexes #
+    ###########
+
+    def scan_index(self, kv_class: KeyValue, index, cursor=0, count=1000):
+        """Get a page of the kv_class in the index set
+
+        Returns the cursor of the next page (0 when there are no more pages)
+        and the list of kv_class. As in SSCAN, a kv_class may be returned more than once.
+        """
+        cursor, names = self.r_client.sscan(index, cursor, count=count)
+        if not names:
+            return cursor, []
+
+        values = self.r_client.mget(names)
+        return cursor, [kv_class.from_value(value) for value in values if value is not None]
+
+    def iter_index(self, kv_class: KeyValue, index, count=1000):
+        """Iterate over all the kv_class in the index set, fetched in pages of count"""
+        seen = set()
+        cursor = 0
+        while True:
+            cursor, kv_objects = self.scan_index(kv_class, index, cursor, count)
+            for kv in kv_objects:
+                if kv.key not in seen:
+                    seen.add(kv.key)
+                    yield kv
+            if cursor == 0:
+                break
+
+    def count_index(self, index):
+        """Number of keys in the index set"""
+        return self.r_client.scard(index)
+
+    def build_indexes(self, *kv_classes, batch_size=1000):
+        """Build the index sets of the kv_classes from the existing keys
+
+        Used to index keys set before the index sets were maintained.
+        The index sets are only built once.
+        """
+        if self.r_client.exists("/index/built"):
+            return
+
+        for kv_class in kv_classes:
+            names = list(self.r_client.scan_iter(kv_class.path + "*", count=batch_size))
+            for i in range(0, len(names), batch_size):
+                batch = names[i : i + batch_size]
+                pipeline = self.r_client.pipeline(transaction=False)
+                for name, value in zip(batch, self.r_client.mget(batch)):
+                    if value is not None:
+                        for index in kv_class.from_value(value).indexes:
+                            pipeline.sadd(index, name)
+                pipeline.execute()
+
+        self.r_client.set("/index/built", 1)
 
     def lock(self, name):
         return self.r_client.lock("/lock" + name)
+
+    def bump_version(self, name):
+        """Increments the version counter of name and notifies its watchers"""
+        version = self.r_client.incr("/version" + name)
+        self.r_client.publish("/version" + name, version)
+        return version
+
+    def publish(self, channel, message):
+        self.r_client.publish(channel, message)
+
+    def listen(self, channel, stop_event=None, poll_interval=1.0):
+        """Yields the messages published in the channel until stop_event is set"""
+        pubsub = self.r_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+        try:
+            while stop_event is None or not stop_event.is_set():
+                message = pubsub.get_message(timeout=poll_interval)
+                if message is not None:
+                    yield message["data"]
+        finally:
+            pubsub.close()
+
+    def watch_version(self, name, stop_event=None, poll_interval=1.0):
+        """Yields the version counter of name every time it changes
+
+        The first version is yielded right away. Changes are pushed by "bump_version",
+        but the counter is also polled every poll_interval seconds, so notifications
+        lost during a reconnection are not missed.
+        """
+        pubsub = self.r_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe("/version" + name)
+        try:
+            last_version = self.r_client.get("/version" + name)
+            yield last_version
+
+            while stop_event is None or not stop_event.is_set():
+                pubsub.get_message(timeout=poll_interval)
+                version = self.r_client.get("/version" + name)
+                if version != last_version:
+                    last_version = version
+                    yield version
+        finally:
+            pubsub.close()
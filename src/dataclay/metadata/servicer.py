@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import traceback
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -8,12 +10,14 @@ from uuid import UUID
 import grpc
 from google.protobuf.empty_pb2 import Empty
 
+from dataclay.conf import settings
 from dataclay.metadata.kvdata import ObjectMetadata
 from dataclay.protos import (
     common_messages_pb2,
     metadata_service_pb2,
     metadata_service_pb2_grpc,
 )
+from dataclay.utils.uuid import uuid_from_bytes
 
 if TYPE_CHECKING:
     from dataclay.metadata.api import MetadataAPI
@@ -22,11 +26,71 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class BackendsBroadcaster:
+    """Watches the backends in one thread, and pushes them to the queues of the watchers
+
+    The queues are asyncio queues of the event loop of the server, so the WatchBackends
+    streams don't hold worker threads. Each queue only keeps the latest backends, since
+    a slow watcher doesn't need the previous ones. The thread starts with the first watcher.
+    """
+
+    def __init__(self, metadata_service: MetadataAPI):
+        self.metadata_service = metadata_service
+        self.watchers: set[asyncio.Queue] = set()
+        self.backends = None
+        self.lock = threading.Lock()
+        self.loop = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def add_watcher(self) -> asyncio.Queue:
+        """Must be called from the event loop of the server"""
+        queue = asyncio.Queue(maxsize=1)
+        with self.lock:
+            if self.thread is None:
+                self.loop = asyncio.get_running_loop()
+                self.thread = threading.Thread(
+                    target=self.watch_backends, name="backends-broadcaster", daemon=True
+                )
+                self.thread.start()
+            self.watchers.add(queue)
+            if self.backends is not None:
+                queue.put_nowait(self.backends)
+        return queue
+
+    def remove_watcher(self, queue: asyncio.Queue):
+        with self.lock:
+            self.watchers.discard(queue)
+
+    def stop(self):
+        self.stop_event.set()
+
+    def watch_backends(self):
+        while not self.stop_event.is_set():
+            try:
+                for backends in self.metadata_service.watch_backends(stop_event=self.stop_event):
+                    with self.lock:
+                        self.backends = backends
+                        watchers = list(self.watchers)
+                    for queue in watchers:
+                        self.loop.call_soon_threadsafe(self.push, queue, backends)
+            except Exception as e:
+                logger.warning(f"Lost backends watch ({e}). Retrying...")
+            self.stop_event.wait(settings.BACKENDS_WATCH_RETRY_INTERVAL)
+
+    @staticmethod
+    def push(queue: asyncio.Queue, backends):
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(backends)
+
+
 class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
     """Provides methods that implement functionality of metadata server"""
 
     def __init__(self, metadata_service: MetadataAPI):
         self.metadata_service = metadata_service
+        self.backends_broadcaster = BackendsBroadcaster(metadata_service)
         logger.debug("Initialized MetadataServiceServicer")
 
     # TODO: define get_exception_info(..) to serialize excpetions
@@ -65,7 +129,7 @@ class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
 
     def CloseSession(self, request, context):
         try:
-            self.metadata_service.close_session(UUID(request.id))
+            self.metadata_service.close_session(uuid_from_bytes(request.id))
         except Exception as e:
             context.set_details(str(e))
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -96,6 +160,23 @@ class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
             return metadata_service_pb2.GetAllBackendsResponse()
         return metadata_service_pb2.GetAllBackendsResponse(backends=response)
 
+    async def WatchBackends(self, request, context):
+        # NOTE: The watchers wait in the event loop of the server, not in worker threads
+        queue = self.backends_broadcaster.add_watcher()
+        try:
+            while True:
+                backends = await queue.get()
+                response = dict()
+                for id, backend in backends.items():
+                    response[str(id)] = backend.get_proto()
+                yield metadata_service_pb2.GetAllBackendsResponse(backends=response)
+        except Exception as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            traceback.print_exc()
+        finally:
+            self.backends_broadcaster.remove_watcher(queue)
+
     ###################
     # Object Metadata #
     ###################
@@ -104,7 +185,7 @@ class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
     def RegisterObject(self, request, context):
         try:
             object_md = ObjectMetadata.from_proto(request.object_md)
-            self.metadata_service.register_object(object_md, UUID(request.session_id))
+            self.metadata_service.register_object(object_md, uuid_from_bytes(request.session_id))
         except Exception as e:
             context.set_details(str(e))
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -115,8 +196,8 @@ class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
     def GetObjectMDById(self, request, context):
         try:
             object_md = self.metadata_service.get_object_md_by_id(
-                UUID(request.object_id),
-                UUID(request.session_id),
+                uuid_from_bytes(request.object_id),
+                uuid_from_bytes(request.session_id),
                 check_session=True,
             )
         except Exception as e:
@@ -126,12 +207,28 @@ class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
             return common_messages_pb2.ObjectMetadata()
         return object_md.get_proto()
 
+    def GetObjectMDsByIds(self, request, context):
+        try:
+            object_mds = self.metadata_service.get_object_mds_by_ids(
+                list(map(uuid_from_bytes, request.object_ids)),
+                uuid_from_bytes(request.session_id),
+                check_session=True,
+            )
+        except Exception as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.INTERNAL)
+            traceback.print_exc()
+            return metadata_service_pb2.GetObjectMDsByIdsResponse()
+        return metadata_service_pb2.GetObjectMDsByIdsResponse(
+            object_mds=[object_md.get_proto() for object_md in object_mds]
+        )
+
     def GetObjectMDByAlias(self, request, context):
         try:
             object_md = self.metadata_service.get_object_md_by_alias(
                 request.alias_name,
                 request.dataset_name,
-                UUID(request.session_id),
+                uuid_from_bytes(request.session_id),
                 check_session=True,
             )
         except Exception as e:
@@ -148,8 +245,8 @@ class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
             self.metadata_service.new_alias(
                 request.alias_name,
                 request.dataset_name,
-                UUID(request.object_id),
-                UUID(request.session_id),
+                uuid_from_bytes(request.object_id),
+                uuid_from_bytes(request.session_id),
                 check_session=True,
             )
         except Exception as e:
@@ -164,7 +261,7 @@ class MetadataServicer(metadata_service_pb2_grpc.MetadataServiceServicer):
             self.metadata_service.delete_alias(
                 request.alias_name,
                 request.dataset_name,
-                UUID(request.session_id),
+                uuid_from_bytes(request.session_id),
                 check_session=True,
             )
         except Exception as e:
@@ -17,7 +17,7 @@ from . import dataservice_messages_pb2 as protos_dot_dataservice__messages__pb2
 from . import common_messages_pb2 as protos_dot_common__messages__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18protos/dataservice.proto\x12\x12protos.dataservice\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a!protos/dataservice_messages.proto\x1a\x1cprotos/common_messages.proto\",\n\x15MakePersistentRequest\x12\x13\n\x0bpickled_obj\x18\x01 \x03(\x0c\"s\n\x17\x43\x61llActiveMethodRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tobject_id\x18\x02 \x01(\t\x12\x13\n\x0bmethod_name\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x01(\x0c\x12\x0e\n\x06kwargs\x18\x05 \x01(\x0c\"?\n\x18\x43\x61llActiveMethodResponse\x12\r\n\x05value\x18\x01 \x01(\x0c\x12\x14\n\x0cis_exception\x18\x02 \x01(\x08\"R\n\x16GetCopyOfObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tobject_id\x18\x02 \x01(\t\x12\x11\n\trecursive\x18\x03 \x01(\x08\"[\n\x13UpdateObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tobject_id\x18\x02 \x01(\t\x12\x1d\n\x15serialized_properties\x18\x03 \x01(\x0c\"M\n\x11MoveObjectRequest\x12\x11\n\tobject_id\x18\x01 \x01(\t\x12\x12\n\nbackend_id\x18\x02 \x01(\t\x12\x11\n\trecursive\x18\x03 \x01(\x08\"Y\n\x11SendObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tobject_id\x18\x02 \x01(\t\x12\x1d\n\x15serialized_properties\x18\x03 \x01(\x0c\x32\xa3%\n\x0b\x44\x61taService\x12Y\n\rinitBackendID\x12(.protos.dataservice.InitBackendIDRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12y\n\x1d\x61ssociateExecutionEnvironment\x12\x38.protos.dataservice.AssociateExecutionEnvironmentRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12\x61\n\x11\x64\x65ployMetaClasses\x12,.protos.dataservice.DeployMetaClassesRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Y\n\rdeployClasses\x12(.protos.dataservice.DeployClassesRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12U\n\x0b\x65nrichClass\x12&.protos.dataservice.EnrichClassRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12~\n\x15newPersistentInstance\x12\x30.protos.dataservice.NewPersistentInstanceRequest\x1a\x31.protos.dataservice.NewPersistentInstanceResponse\"\x00\x12W\n\x0cstoreObjects\x12\'.protos.dataservice.StoreObjectsRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\ngetObjects\x12%.protos.dataservice.GetObjectsRequest\x1a&.protos.dataservice.GetObjectsResponse\"\x00\x12]\n\nnewVersion\x12%.protos.dataservice.NewVersionRequest\x1a&.protos.dataservice.NewVersionResponse\"\x00\x12\x63\n\x12\x63onsolidateVersion\x12-.protos.dataservice.ConsolidateVersionRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Y\n\rupsertObjects\x12(.protos.dataservice.UpsertObjectsRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\nnewReplica\x12%.protos.dataservice.NewReplicaRequest\x1a&.protos.dataservice.NewReplicaResponse\"\x00\x12\x66\n\rremoveObjects\x12(.protos.dataservice.RemoveObjectsRequest\x1a).protos.dataservice.RemoveObjectsResponse\"\x00\x12s\n\x18migrateObjectsToBackends\x12).protos.dataservice.MigrateObjectsRequest\x1a*.protos.dataservice.MigrateObjectsResponse\"\x00\x12\x93\x01\n\x1cgetClassIDFromObjectInMemory\x12\x37.protos.dataservice.GetClassIDFromObjectInMemoryRequest\x1a\x38.protos.dataservice.GetClassIDFromObjectInMemoryResponse\"\x00\x12~\n\x15\x65xecuteImplementation\x12\x30.protos.dataservice.ExecuteImplementationRequest\x1a\x31.protos.dataservice.ExecuteImplementationResponse\"\x00\x12O\n\x08\x66\x65\x64\x65rate\x12#.protos.dataservice.FederateRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12S\n\nunfederate\x12%.protos.dataservice.UnfederateRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12_\n\x10notifyFederation\x12+.protos.dataservice.NotifyFederationRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12\x63\n\x12notifyUnfederation\x12-.protos.dataservice.NotifyUnfederationRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Q\n\x06\x65xists\x12!.protos.dataservice.ExistsRequest\x1a\".protos.dataservice.ExistsResponse\"\x00\x12U\n\x0bsynchronize\x12&.protos.dataservice.SynchronizeRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Q\n\tstoreToDB\x12$.protos.dataservice.StoreToDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Z\n\tgetFromDB\x12$.protos.dataservice.GetFromDBRequest\x1a%.protos.dataservice.GetFromDBResponse\"\x00\x12S\n\nupdateToDB\x12%.protos.dataservice.UpdateToDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12S\n\ndeleteToDB\x12%.protos.dataservice.DeleteToDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\x0f\x64\x65leteSetFromDB\x12*.protos.dataservice.DeleteSetFromDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\nexistsInDB\x12%.protos.dataservice.ExistsInDBRequest\x1a&.protos.dataservice.ExistsInDBResponse\"\x00\x12[\n\x1c\x63leanExecutionClassDirectory\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12M\n\x0e\x63loseDbHandler\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12S\n\x14\x64isconnectFromOthers\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12U\n\x16registerPendingObjects\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12J\n\x0b\x63leanCaches\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\x0f\x61\x63tivateTracing\x12*.protos.dataservice.ActivateTracingRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12P\n\x11\x64\x65\x61\x63tivateTracing\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12L\n\tgetTraces\x12\x1b.protos.common.EmptyMessage\x1a .protos.common.GetTracesResponse\"\x00\x12U\n\x0b\x64\x65leteAlias\x12&.protos.dataservice.DeleteAliasRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12m\n\x17\x64\x65tachObjectFromSession\x12\x32.protos.dataservice.DetachObjectFromSessionRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12_\n\x10\x63loseSessionInDS\x12+.protos.dataservice.CloseSessionInDSRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12i\n\x15getRetainedReferences\x12\x1b.protos.common.EmptyMessage\x1a\x31.protos.dataservice.GetRetainedReferencesResponse\"\x00\x12T\n\rgetNumObjects\x12\x1b.protos.common.EmptyMessage\x1a$.protos.common.GetNumObjectsResponse\"\x00\x12X\n\x11getNumObjectsInEE\x12\x1b.protos.common.EmptyMessage\x1a$.protos.common.GetNumObjectsResponse\"\x00\x12[\n\x0egetObjectGraph\x12\x1b.protos.common.EmptyMessage\x1a*.protos.dataservice.GetObjectGraphResponse\"\x00\x12U\n\x0eMakePersistent\x12).protos.dataservice.MakePersistentRequest\x1a\x16.google.protobuf.Empty\"\x00\x12o\n\x10\x43\x61llActiveMethod\x12+.protos.dataservice.CallActiveMethodRequest\x1a,.protos.dataservice.CallActiveMethodResponse\"\x00\x12\\\n\x0fGetCopyOfObject\x12*.protos.dataservice.GetCopyOfObjectRequest\x1a\x1b.google.protobuf.BytesValue\"\x00\x12Q\n\x0cUpdateObject\x12\'.protos.dataservice.UpdateObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\nMoveObject\x12%.protos.dataservice.MoveObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\nSendObject\x12%.protos.dataservice.SendObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12<\n\x08\x46lushAll\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12<\n\x08Shutdown\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x42R\n8es.bsc.dataclay.communication.grpc.generated.dataserviceB\x16\x44\x61taServiceGrpcServiceb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18protos/dataservice.proto\x12\x12protos.dataservice\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a!protos/dataservice_messages.proto\x1a\x1cprotos/common_messages.proto\",\n\x15MakePersistentRequest\x12\x13\n\x0bpickled_obj\x18\x01 \x03(\x0c\"s\n\x17\x43\x61llActiveMethodRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x11\n\tobject_id\x18\x02 \x01(\x0c\x12\x13\n\x0bmethod_name\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x01(\x0c\x12\x0e\n\x06kwargs\x18\x05 \x01(\x0c\"?\n\x18\x43\x61llActiveMethodResponse\x12\r\n\x05value\x18\x01 \x01(\x0c\x12\x14\n\x0cis_exception\x18\x02 \x01(\x08\"\x80\x01\n\x1c\x43\x61llActiveMethodBatchRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\x0cR\tsessionId\x12\x41\n\x05\x63\x61lls\x18\x02 \x03(\x0b\x32+.protos.dataservice.CallActiveMethodRequestR\x05\x63\x61lls\"g\n\x1d\x43\x61llActiveMethodBatchResponse\x12\x46\n\x07results\x18\x01 \x03(\x0b\x32,.protos.dataservice.CallActiveMethodResponseR\x07results\"[\n\x1dReadActiveMethodStreamRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\x0cR\tsessionId\x12\x1b\n\tstream_id\x18\x02 \x01(\x0cR\x08streamId\"a\n\x17\x41\x63tiveMethodStreamChunk\x12\x14\n\x05items\x18\x01 \x03(\x0cR\x05items\x12\x12\n\x04\x64\x61ta\x18\x02 \x01(\x0cR\x04\x64\x61ta\x12\x1c\n\texception\x18\x03 \x01(\x0cR\texception\"R\n\x16GetCopyOfObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x11\n\tobject_id\x18\x02 \x01(\x0c\x12\x11\n\trecursive\x18\x03 \x01(\x08\"[\n\x13UpdateObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x11\n\tobject_id\x18\x02 \x01(\x0c\x12\x1d\n\x15serialized_properties\x18\x03 \x01(\x0c\"M\n\x11MoveObjectRequest\x12\x11\n\tobject_id\x18\x01 \x01(\x0c\x12\x12\n\nbackend_id\x18\x02 \x01(\x0c\x12\x11\n\trecursive\x18\x03 \x01(\x08\"Y\n\x11SendObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x11\n\tobject_id\x18\x02 \x01(\x0c\x12\x1d\n\x15serialized_properties\x18\x03 \x01(\x0c\"w\n\x0eHeapClassStats\x12\x1d\n\nclass_name\x18\x01 \x01(\tR\tclassName\x12\x1f\n\x0bnum_objects\x18\x02 \x01(\x03R\nnumObjects\x12%\n\x0eresident_bytes\x18\x03 \x01(\x03R\rresidentBytes\"C\n\x0eLockContention\x12\x1b\n\tobject_id\x18\x01 \x01(\x0cR\x08objectId\x12\x14\n\x05\x63ount\x18\x02 \x01(\x03R\x05\x63ount\"\x80\x02\n\x14GetHeapStatsResponse\x12<\n\x07\x63lasses\x18\x01 \x03(\x0b\x32\".protos.dataservice.HeapClassStatsR\x07\x63lasses\x12\x1d\n\nmemory_rss\x18\x02 \x01(\x03R\tmemoryRss\x12!\n\x0cmemory_limit\x18\x03 \x01(\x03R\x0bmemoryLimit\x12K\n\x0flock_contention\x18\x04 \x03(\x0b\x32\".protos.dataservice.LockContentionR\x0elockContention\x12\x1b\n\tnum_locks\x18\x05 \x01(\x03R\x08numLocks\"5\n\x12\x43heckpointResponse\x12\x1f\n\x0bnum_objects\x18\x01 \x01(\x03R\nnumObjects2\xc5(\n\x0b\x44\x61taService\x12Y\n\rinitBackendID\x12(.protos.dataservice.InitBackendIDRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12y\n\x1d\x61ssociateExecutionEnvironment\x12\x38.protos.dataservice.AssociateExecutionEnvironmentRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12\x61\n\x11\x64\x65ployMetaClasses\x12,.protos.dataservice.DeployMetaClassesRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Y\n\rdeployClasses\x12(.protos.dataservice.DeployClassesRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12U\n\x0b\x65nrichClass\x12&.protos.dataservice.EnrichClassRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12~\n\x15newPersistentInstance\x12\x30.protos.dataservice.NewPersistentInstanceRequest\x1a\x31.protos.dataservice.NewPersistentInstanceResponse\"\x00\x12W\n\x0cstoreObjects\x12\'.protos.dataservice.StoreObjectsRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\ngetObjects\x12%.protos.dataservice.GetObjectsRequest\x1a&.protos.dataservice.GetObjectsResponse\"\x00\x12]\n\nnewVersion\x12%.protos.dataservice.NewVersionRequest\x1a&.protos.dataservice.NewVersionResponse\"\x00\x12\x63\n\x12\x63onsolidateVersion\x12-.protos.dataservice.ConsolidateVersionRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Y\n\rupsertObjects\x12(.protos.dataservice.UpsertObjectsRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\nnewReplica\x12%.protos.dataservice.NewReplicaRequest\x1a&.protos.dataservice.NewReplicaResponse\"\x00\x12\x66\n\rremoveObjects\x12(.protos.dataservice.RemoveObjectsRequest\x1a).protos.dataservice.RemoveObjectsResponse\"\x00\x12s\n\x18migrateObjectsToBackends\x12).protos.dataservice.MigrateObjectsRequest\x1a*.protos.dataservice.MigrateObjectsResponse\"\x00\x12\x93\x01\n\x1cgetClassIDFromObjectInMemory\x12\x37.protos.dataservice.GetClassIDFromObjectInMemoryRequest\x1a\x38.protos.dataservice.GetClassIDFromObjectInMemoryResponse\"\x00\x12~\n\x15\x65xecuteImplementation\x12\x30.protos.dataservice.ExecuteImplementationRequest\x1a\x31.protos.dataservice.ExecuteImplementationResponse\"\x00\x12O\n\x08\x66\x65\x64\x65rate\x12#.protos.dataservice.FederateRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12S\n\nunfederate\x12%.protos.dataservice.UnfederateRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12_\n\x10notifyFederation\x12+.protos.dataservice.NotifyFederationRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12\x63\n\x12notifyUnfederation\x12-.protos.dataservice.NotifyUnfederationRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Q\n\x06\x65xists\x12!.protos.dataservice.ExistsRequest\x1a\".protos.dataservice.ExistsResponse\"\x00\x12U\n\x0bsynchronize\x12&.protos.dataservice.SynchronizeRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Q\n\tstoreToDB\x12$.protos.dataservice.StoreToDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12Z\n\tgetFromDB\x12$.protos.dataservice.GetFromDBRequest\x1a%.protos.dataservice.GetFromDBResponse\"\x00\x12S\n\nupdateToDB\x12%.protos.dataservice.UpdateToDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12S\n\ndeleteToDB\x12%.protos.dataservice.DeleteToDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\x0f\x64\x65leteSetFromDB\x12*.protos.dataservice.DeleteSetFromDBRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\nexistsInDB\x12%.protos.dataservice.ExistsInDBRequest\x1a&.protos.dataservice.ExistsInDBResponse\"\x00\x12[\n\x1c\x63leanExecutionClassDirectory\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12M\n\x0e\x63loseDbHandler\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12S\n\x14\x64isconnectFromOthers\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12U\n\x16registerPendingObjects\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12J\n\x0b\x63leanCaches\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12]\n\x0f\x61\x63tivateTracing\x12*.protos.dataservice.ActivateTracingRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12P\n\x11\x64\x65\x61\x63tivateTracing\x12\x1b.protos.common.EmptyMessage\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12L\n\tgetTraces\x12\x1b.protos.common.EmptyMessage\x1a .protos.common.GetTracesResponse\"\x00\x12U\n\x0b\x64\x65leteAlias\x12&.protos.dataservice.DeleteAliasRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12m\n\x17\x64\x65tachObjectFromSession\x12\x32.protos.dataservice.DetachObjectFromSessionRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12_\n\x10\x63loseSessionInDS\x12+.protos.dataservice.CloseSessionInDSRequest\x1a\x1c.protos.common.ExceptionInfo\"\x00\x12i\n\x15getRetainedReferences\x12\x1b.protos.common.EmptyMessage\x1a\x31.protos.dataservice.GetRetainedReferencesResponse\"\x00\x12T\n\rgetNumObjects\x12\x1b.protos.common.EmptyMessage\x1a$.protos.common.GetNumObjectsResponse\"\x00\x12X\n\x11getNumObjectsInEE\x12\x1b.protos.common.EmptyMessage\x1a$.protos.common.GetNumObjectsResponse\"\x00\x12[\n\x0egetObjectGraph\x12\x1b.protos.common.EmptyMessage\x1a*.protos.dataservice.GetObjectGraphResponse\"\x00\x12U\n\x0eMakePersistent\x12).protos.dataservice.MakePersistentRequest\x1a\x16.google.protobuf.Empty\"\x00\x12o\n\x10\x43\x61llActiveMethod\x12+.protos.dataservice.CallActiveMethodRequest\x1a,.protos.dataservice.CallActiveMethodResponse\"\x00\x12~\n\x15\x43\x61llActiveMethodBatch\x12\x30.protos.dataservice.CallActiveMethodBatchRequest\x1a\x31.protos.dataservice.CallActiveMethodBatchResponse\"\x00\x12|\n\x16ReadActiveMethodStream\x12\x31.protos.dataservice.ReadActiveMethodStreamRequest\x1a+.protos.dataservice.ActiveMethodStreamChunk\"\x00\x30\x01\x12\\\n\x0fGetCopyOfObject\x12*.protos.dataservice.GetCopyOfObjectRequest\x1a\x1b.google.protobuf.BytesValue\"\x00\x12Q\n\x0cUpdateObject\x12\'.protos.dataservice.UpdateObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\nMoveObject\x12%.protos.dataservice.MoveObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\nSendObject\x12%.protos.dataservice.SendObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12<\n\x08\x46lushAll\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\nCheckpoint\x12\x16.google.protobuf.Empty\x1a&.protos.dataservice.CheckpointResponse\"\x00\x12R\n\x0cGetHeapStats\x12\x16.google.protobuf.Empty\x1a(.protos.dataservice.GetHeapStatsResponse\"\x00\x12<\n\x08Shutdown\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x42R\n8es.bsc.dataclay.communication.grpc.generated.dataserviceB\x16\x44\x61taServiceGrpcServiceb\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'protos.dataservice_pb2', globals())
@@ -31,14 +31,30 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _CALLACTIVEMETHODREQUEST._serialized_end=335
   _CALLACTIVEMETHODRESPONSE._serialized_start=337
   _CALLACTIVEMETHODRESPONSE._serialized_end=400
-  _GETCOPYOFOBJECTREQUEST._serialized_start=402
-  _GETCOPYOFOBJECTREQUEST._serialized_end=484
-  _UPDATEOBJECTREQUEST._serialized_start=486
-  _UPDATEOBJECTREQUEST._serialized_end=577
-  _MOVEOBJECTREQUEST._serialized_start=579
-  _MOVEOBJECTREQUEST._serialized_end=656
-  _SENDOBJECTREQUEST._serialized_start=658
-  _SENDOBJECTREQUEST._serialized_end=747
-  _DATASERVICE._serialized_start=750
-  _DATASERVICE._serialized_end=5521
+  _CALLACTIVEMETHODBATCHREQUEST._serialized_start=403
+  _CALLACTIVEMETHODBATCHREQUEST._serialized_end=531
+  _CALLACTIVEMETHODBATCHRESPONSE._serialized_start=533
+  _CALLACTIVEMETHODBATCHRESPONSE._serialized_end=636
+  _READACTIVEMETHODSTREAMREQUEST._serialized_start=638
+  _READACTIVEMETHODSTREAMREQUEST._serialized_end=729
+  _ACTIVEMETHODSTREAMCHUNK._serialized_start=731
+  _ACTIVEMETHODSTREAMCHUNK._serialized_end=828
+  _GETCOPYOFOBJECTREQUEST._serialized_start=830
+  _GETCOPYOFOBJECTREQUEST._serialized_end=912
+  _UPDATEOBJECTREQUEST._serialized_start=914
+  _UPDATEOBJECTREQUEST._serialized_end=1005
+  _MOVEOBJECTREQUEST._serialized_start=1007
+  _MOVEOBJECTREQUEST._serialized_end=1084
+  _SENDOBJECTREQUEST._serialized_start=1086
+  _SENDOBJECTREQUEST._serialized_end=1175
+  _HEAPCLASSSTATS._serialized_start=1177
+  _HEAPCLASSSTATS._serialized_end=1296
+  _LOCKCONTENTION._serialized_start=1298
+  _LOCKCONTENTION._serialized_end=1365
+  _GETHEAPSTATSRESPONSE._serialized_start=1368
+  _GETHEAPSTATSRESPONSE._serialized_end=1624
+  _CHECKPOINTRESPONSE._serialized_start=1626
+  _CHECKPOINTRESPONSE._serialized_end=1679
+  _DATASERVICE._serialized_start=1682
+  _DATASERVICE._serialized_end=6871
 # @@protoc_insertion_point(module_scope)
@@ -244,6 +244,16 @@ class DataServiceStub(object):
                 request_serializer=protos_dot_dataservice__pb2.CallActiveMethodRequest.SerializeToString,
                 response_deserializer=protos_dot_dataservice__pb2.CallActiveMethodResponse.FromString,
                 )
+        self.CallActiveMethodBatch = channel.unary_unary(
+                '/protos.dataservice.DataService/CallActiveMethodBatch',
+                request_serializer=protos_dot_dataservice__pb2.CallActiveMethodBatchRequest.SerializeToString,
+                response_deserializer=protos_dot_dataservice__pb2.CallActiveMethodBatchResponse.FromString,
+                )
+        self.ReadActiveMethodStream = channel.unary_stream(
+                '/protos.dataservice.DataService/ReadActiveMethodStream',
+                request_serializer=protos_dot_dataservice__pb2.ReadActiveMethodStreamRequest.SerializeToString,
+                response_deserializer=protos_dot_dataservice__pb2.ActiveMethodStreamChunk.FromString,
+                )
         self.GetCopyOfObject = channel.unary_unary(
                 '/protos.dataservice.DataService/GetCopyOfObject',
                 request_serializer=protos_dot_dataservice__pb2.GetCopyOfObjectRequest.SerializeToString,
@@ -269,6 +279,16 @@ class DataServiceStub(object):
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 )
+        self.Checkpoint = channel.unary_unary(
+                '/protos.dataservice.DataService/Checkpoint',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=protos_dot_dataservice__pb2.CheckpointResponse.FromString,
+                )
+        self.GetHeapStats = channel.unary_unary(
+                '/protos.dataservice.DataService/GetHeapStats',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=protos_dot_dataservice__pb2.GetHeapStatsResponse.FromString,
+                )
         self.Shutdown = channel.unary_unary(
                 '/protos.dataservice.DataService/Shutdown',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
@@ -557,6 +577,18 @@ class DataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CallActiveMethodBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReadActiveMethodStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetCopyOfObject(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -587,6 +619,18 @@ class DataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Checkpoint(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetHeapStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Shutdown(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -821,6 +865,16 @@ def add_DataServiceServicer_to_server(servicer, server):
                     request_deserializer=protos_dot_dataservice__pb2.CallActiveMethodRequest.FromString,
                     response_serializer=protos_dot_dataservice__pb2.CallActiveMethodResponse.SerializeToString,
             ),
+            'CallActiveMethodBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.CallActiveMethodBatch,
+                    request_deserializer=protos_dot_dataservice__pb2.CallActiveMethodBatchRequest.FromString,
+                    response_serializer=protos_dot_dataservice__pb2.CallActiveMethodBatchResponse.SerializeToString,
+            ),
+            'ReadActiveMethodStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ReadActiveMethodStream,
+                    request_deserializer=protos_dot_dataservice__pb2.ReadActiveMethodStreamRequest.FromString,
+                    response_serializer=protos_dot_dataservice__pb2.ActiveMethodStreamChunk.SerializeToString,
+            ),
             'GetCopyOfObject': grpc.unary_unary_rpc_method_handler(
                     servicer.GetCopyOfObject,
                     request_deserializer=protos_dot_dataservice__pb2.GetCopyOfObjectRequest.FromString,
@@ -846,6 +900,16 @@ def add_DataServiceServicer_to_server(servicer, server):
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'Checkpoint': grpc.unary_unary_rpc_method_handler(
+                    servicer.Checkpoint,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=protos_dot_dataservice__pb2.CheckpointResponse.SerializeToString,
+            ),
+            'GetHeapStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetHeapStats,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=protos_dot_dataservice__pb2.GetHeapStatsResponse.SerializeToString,
+            ),
             'Shutdown': grpc.unary_unary_rpc_method_handler(
                     servicer.Shutdown,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
@@ -1627,6 +1691,40 @@ class DataService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def CallActiveMethodBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/protos.dataservice.DataService/CallActiveMethodBatch',
+            protos_dot_dataservice__pb2.CallActiveMethodBatchRequest.SerializeToString,
+            protos_dot_dataservice__pb2.CallActiveMethodBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ReadActiveMethodStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/protos.dataservice.DataService/ReadActiveMethodStream',
+            protos_dot_dataservice__pb2.ReadActiveMethodStreamRequest.SerializeToString,
+            protos_dot_dataservice__pb2.ActiveMethodStreamChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def GetCopyOfObject(request,
             target,
@@ -1712,6 +1810,40 @@ class DataService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def Checkpoint(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/protos.dataservice.DataService/Checkpoint',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            protos_dot_dataservice__pb2.CheckpointResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetHeapStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/protos.dataservice.DataService/GetHeapStats',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            protos_dot_dataservice__pb2.GetHeapStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def Shutdown(request,
             target,
@@ -15,7 +15,7 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 from . import common_messages_pb2 as protos_dot_common__messages__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dprotos/metadata_service.proto\x12\x17protos.metadata_service\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cprotos/common_messages.proto\"7\n\x11NewAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"%\n\x11GetAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"\x14\n\x12GetAccountResponse\"M\n\x11NewSessionRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\"!\n\x13\x43loseSessionRequest\x12\n\n\x02id\x18\x01 \x01(\t\"H\n\x11NewDatasetRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x0f\n\x07\x64\x61taset\x18\x03 \x01(\t\"-\n\x15GetAllBackendsRequest\x12\x14\n\x0c\x66rom_backend\x18\x01 \x01(\x08\"\xb2\x01\n\x16GetAllBackendsResponse\x12O\n\x08\x62\x61\x63kends\x18\x01 \x03(\x0b\x32=.protos.metadata_service.GetAllBackendsResponse.BackendsEntry\x1aG\n\rBackendsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.protos.common.Backend:\x02\x38\x01\")\n\x12GetDataclayRequest\x12\x13\n\x0b\x64\x61taclay_id\x18\x01 \x01(\t\"]\n\x15RegisterObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x30\n\tobject_md\x18\x02 \x01(\x0b\x32\x1d.protos.common.ObjectMetadata\"?\n\x16GetObjectMDByIdRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tobject_id\x18\x02 \x01(\t\"Y\n\x19GetObjectMDByAliasRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nalias_name\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\"R\n\x12\x44\x65leteAliasRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nalias_name\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\"b\n\x0fNewAliasRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nalias_name\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\x12\x11\n\tobject_id\x18\x04 \x01(\t2\xec\x08\n\x0fMetadataService\x12R\n\nNewAccount\x12*.protos.metadata_service.NewAccountRequest\x1a\x16.google.protobuf.Empty\"\x00\x12g\n\nGetAccount\x12*.protos.metadata_service.GetAccountRequest\x1a+.protos.metadata_service.GetAccountResponse\"\x00\x12R\n\nNewSession\x12*.protos.metadata_service.NewSessionRequest\x1a\x16.protos.common.Session\"\x00\x12V\n\x0c\x43loseSession\x12,.protos.metadata_service.CloseSessionRequest\x1a\x16.google.protobuf.Empty\"\x00\x12R\n\nNewDataset\x12*.protos.metadata_service.NewDatasetRequest\x1a\x16.google.protobuf.Empty\"\x00\x12s\n\x0eGetAllBackends\x12..protos.metadata_service.GetAllBackendsRequest\x1a/.protos.metadata_service.GetAllBackendsResponse\"\x00\x12U\n\x0bGetDataclay\x12+.protos.metadata_service.GetDataclayRequest\x1a\x17.protos.common.Dataclay\"\x00\x12Z\n\x0eRegisterObject\x12..protos.metadata_service.RegisterObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x0fGetObjectMDById\x12/.protos.metadata_service.GetObjectMDByIdRequest\x1a\x1d.protos.common.ObjectMetadata\"\x00\x12i\n\x12GetObjectMDByAlias\x12\x32.protos.metadata_service.GetObjectMDByAliasRequest\x1a\x1d.protos.common.ObjectMetadata\"\x00\x12T\n\x0b\x44\x65leteAlias\x12+.protos.metadata_service.DeleteAliasRequest\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\x08NewAlias\x12(.protos.metadata_service.NewAliasRequest\x1a\x16.google.protobuf.Empty\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dprotos/metadata_service.proto\x12\x17protos.metadata_service\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cprotos/common_messages.proto\"7\n\x11NewAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"%\n\x11GetAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"\x14\n\x12GetAccountResponse\"M\n\x11NewSessionRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\"!\n\x13\x43loseSessionRequest\x12\n\n\x02id\x18\x01 \x01(\x0c\"H\n\x11NewDatasetRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x0f\n\x07\x64\x61taset\x18\x03 \x01(\t\"-\n\x15GetAllBackendsRequest\x12\x14\n\x0c\x66rom_backend\x18\x01 \x01(\x08\"\xb2\x01\n\x16GetAllBackendsResponse\x12O\n\x08\x62\x61\x63kends\x18\x01 \x03(\x0b\x32=.protos.metadata_service.GetAllBackendsResponse.BackendsEntry\x1aG\n\rBackendsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.protos.common.Backend:\x02\x38\x01\")\n\x12GetDataclayRequest\x12\x13\n\x0b\x64\x61taclay_id\x18\x01 \x01(\t\"]\n\x15RegisterObjectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x30\n\tobject_md\x18\x02 \x01(\x0b\x32\x1d.protos.common.ObjectMetadata\"?\n\x16GetObjectMDByIdRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x11\n\tobject_id\x18\x02 \x01(\x0c\"B\n\x18GetObjectMDsByIdsRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x12\n\nobject_ids\x18\x02 \x03(\x0c\"N\n\x19GetObjectMDsByIdsResponse\x12\x31\n\nobject_mds\x18\x01 \x03(\x0b\x32\x1d.protos.common.ObjectMetadata\"Y\n\x19GetObjectMDByAliasRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x12\n\nalias_name\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\"R\n\x12\x44\x65leteAliasRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x12\n\nalias_name\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\"b\n\x0fNewAliasRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x0c\x12\x12\n\nalias_name\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x03 \x01(\t\x12\x11\n\tobject_id\x18\x04 \x01(\x0c\x32\xe0\n\n\x0fMetadataService\x12R\n\nNewAccount\x12*.protos.metadata_service.NewAccountRequest\x1a\x16.google.protobuf.Empty\"\x00\x12g\n\nGetAccount\x12*.protos.metadata_service.GetAccountRequest\x1a+.protos.metadata_service.GetAccountResponse\"\x00\x12R\n\nNewSession\x12*.protos.metadata_service.NewSessionRequest\x1a\x16.protos.common.Session\"\x00\x12V\n\x0c\x43loseSession\x12,.protos.metadata_service.CloseSessionRequest\x1a\x16.google.protobuf.Empty\"\x00\x12R\n\nNewDataset\x12*.protos.metadata_service.NewDatasetRequest\x1a\x16.google.protobuf.Empty\"\x00\x12s\n\x0eGetAllBackends\x12..protos.metadata_service.GetAllBackendsRequest\x1a/.protos.metadata_service.GetAllBackendsResponse\"\x00\x12t\n\rWatchBackends\x12..protos.metadata_service.GetAllBackendsRequest\x1a/.protos.metadata_service.GetAllBackendsResponse\"\x00\x30\x01\x12U\n\x0bGetDataclay\x12+.protos.metadata_service.GetDataclayRequest\x1a\x17.protos.common.Dataclay\"\x00\x12Z\n\x0eRegisterObject\x12..protos.metadata_service.RegisterObjectRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x0fGetObjectMDById\x12/.protos.metadata_service.GetObjectMDByIdRequest\x1a\x1d.protos.common.ObjectMetadata\"\x00\x12|\n\x11GetObjectMDsByIds\x12\x31.protos.metadata_service.GetObjectMDsByIdsRequest\x1a\x32.protos.metadata_service.GetObjectMDsByIdsResponse\"\x00\x12i\n\x12GetObjectMDByAlias\x12\x32.protos.metadata_service.GetObjectMDByAliasRequest\x1a\x1d.protos.common.ObjectMetadata\"\x00\x12T\n\x0b\x44\x65leteAlias\x12+.protos.metadata_service.DeleteAliasRequest\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\x08NewAlias\x12(.protos.metadata_service.NewAliasRequest\x1a\x16.google.protobuf.Empty\"\x00\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'protos.metadata_service_pb2', globals())
@@ -48,12 +48,16 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _REGISTEROBJECTREQUEST._serialized_end=787
   _GETOBJECTMDBYIDREQUEST._serialized_start=789
   _GETOBJECTMDBYIDREQUEST._serialized_end=852
-  _GETOBJECTMDBYALIASREQUEST._serialized_start=854
-  _GETOBJECTMDBYALIASREQUEST._serialized_end=943
-  _DELETEALIASREQUEST._serialized_start=945
-  _DELETEALIASREQUEST._serialized_end=1027
-  _NEWALIASREQUEST._serialized_start=1029
-  _NEWALIASREQUEST._serialized_end=1127
-  _METADATASERVICE._serialized_start=1130
-  _METADATASERVICE._serialized_end=2262
+  _GETOBJECTMDSBYIDSREQUEST._serialized_start=854
+  _GETOBJECTMDSBYIDSREQUEST._serialized_end=920
+  _GETOBJECTMDSBYIDSRESPONSE._serialized_start=922
+  _GETOBJECTMDSBYIDSRESPONSE._serialized_end=1000
+  _GETOBJECTMDBYALIASREQUEST._serialized_start=1002
+  _GETOBJECTMDBYALIASREQUEST._serialized_end=1091
+  _DELETEALIASREQUEST._serialized_start=1093
+  _DELETEALIASREQUEST._serialized_end=1175
+  _NEWALIASREQUEST._serialized_start=1177
+  _NEWALIASREQUEST._serialized_end=1275
+  _METADATASERVICE._serialized_start=1278
+  _METADATASERVICE._serialized_end=2654
 # @@protoc_insertion_point(module_scope)
@@ -46,6 +46,11 @@ class MetadataServiceStub(object):
                 request_serializer=protos_dot_metadata__service__pb2.GetAllBackendsRequest.SerializeToString,
                 response_deserializer=protos_dot_metadata__service__pb2.GetAllBackendsResponse.FromString,
                 )
+        self.WatchBackends = channel.unary_stream(
+                '/protos.metadata_service.MetadataService/WatchBackends',
+                request_serializer=protos_dot_metadata__service__pb2.GetAllBackendsRequest.SerializeToString,
+                response_deserializer=protos_dot_metadata__service__pb2.GetAllBackendsResponse.FromString,
+                )
         self.GetDataclay = channel.unary_unary(
                 '/protos.metadata_service.MetadataService/GetDataclay',
                 request_serializer=protos_dot_metadata__service__pb2.GetDataclayRequest.SerializeToString,
@@ -61,6 +66,11 @@ class MetadataServiceStub(object):
                 request_serializer=protos_dot_metadata__service__pb2.GetObjectMDByIdRequest.SerializeToString,
                 response_deserializer=protos_dot_common__messages__pb2.ObjectMetadata.FromString,
                 )
+        self.GetObjectMDsByIds = channel.unary_unary(
+                '/protos.metadata_service.MetadataService/GetObjectMDsByIds',
+                request_serializer=protos_dot_metadata__service__pb2.GetObjectMDsByIdsRequest.SerializeToString,
+                response_deserializer=protos_dot_metadata__service__pb2.GetObjectMDsByIdsResponse.FromString,
+                )
         self.GetObjectMDByAlias = channel.unary_unary(
                 '/protos.metadata_service.MetadataService/GetObjectMDByAlias',
                 request_serializer=protos_dot_metadata__service__pb2.GetObjectMDByAliasRequest.SerializeToString,
@@ -121,6 +131,12 @@ class MetadataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchBackends(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDataclay(self, request, context):
         """Federation
         """
@@ -141,6 +157,12 @@ class MetadataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetObjectMDsByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetObjectMDByAlias(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -193,6 +215,11 @@ def add_MetadataServiceServicer_to_server(servicer, server):
                     request_deserializer=protos_dot_metadata__service__pb2.GetAllBackendsRequest.FromString,
                     response_serializer=protos_dot_metadata__service__pb2.GetAllBackendsResponse.SerializeToString,
             ),
+            'WatchBackends': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchBackends,
+                    request_deserializer=protos_dot_metadata__service__pb2.GetAllBackendsRequest.FromString,
+                    response_serializer=protos_dot_metadata__service__pb2.GetAllBackendsResponse.SerializeToString,
+            ),
             'GetDataclay': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDataclay,
                     request_deserializer=protos_dot_metadata__service__pb2.GetDataclayRequest.FromString,
@@ -208,6 +235,11 @@ def add_MetadataServiceServicer_to_server(servicer, server):
                     request_deserializer=protos_dot_metadata__service__pb2.GetObjectMDByIdRequest.FromString,
                     response_serializer=protos_dot_common__messages__pb2.ObjectMetadata.SerializeToString,
             ),
+            'GetObjectMDsByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetObjectMDsByIds,
+                    request_deserializer=protos_dot_metadata__service__pb2.GetObjectMDsByIdsRequest.FromString,
+                    response_serializer=protos_dot_metadata__service__pb2.GetObjectMDsByIdsResponse.SerializeToString,
+            ),
             'GetObjectMDByAlias': grpc.unary_unary_rpc_method_handler(
                     servicer.GetObjectMDByAlias,
                     request_deserializer=protos_dot_metadata__service__pb2.GetObjectMDByAliasRequest.FromString,
@@ -335,6 +367,23 @@ class MetadataService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def WatchBackends(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/protos.metadata_service.MetadataService/WatchBackends',
+            protos_dot_metadata__service__pb2.GetAllBackendsRequest.SerializeToString,
+            protos_dot_metadata__service__pb2.GetAllBackendsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def GetDataclay(request,
             target,
@@ -386,6 +435,23 @@ class MetadataService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def GetObjectMDsByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/protos.metadata_service.MetadataService/GetObjectMDsByIds',
+            protos_dot_metadata__service__pb2.GetObjectMDsByIdsRequest.SerializeToString,
+            protos_dot_metadata__service__pb2.GetObjectMDsByIdsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def GetObjectMDByAlias(request,
             target,
@@ -4,18 +4,23 @@ from __future__ import annotations
 import importlib
 import logging
 import pickle
+import threading
 from abc import ABC, abstractmethod
 from builtins import Exception
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from threading import Condition, Lock, RLock
 from typing import TYPE_CHECKING
-from uuid import UUID
+from uuid import UUID, uuid4
 from weakref import WeakValueDictionary
 
 from dataclay.backend.client import BackendClient
 from dataclay.conf import settings
 from dataclay.exceptions import *
 from dataclay.protos.common_messages_pb2 import LANG_PYTHON
+from dataclay.utils.compression import CompressionPolicy, decompress
+from dataclay.utils.streaming import StreamedResult
 
 if TYPE_CHECKING:
 
@@ -42,39 +47,102 @@ def set_runtime(new_runtime):
     current_runtime = new_runtime
 
 
+class LockEntry:
+    """Reentrant lock of an object id, with the number of threads holding or waiting for it"""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = RLock()
+        self.users = 0
+
+
 class UUIDLock(AbstractContextManager):
     """This class is used as a global lock for UUIDs
 
     Use it always with context manager:
         with UUIDLock(id):
             ...
+
+    Or with acquire and release, to try the lock or wait for it with a timeout:
+        lock = UUIDLock(id)
+        if lock.acquire(timeout=1):
+            try:
+                ...
+            finally:
+                lock.release()
+
+    The locks are reentrant. They are created when first acquired, and removed when no
+    thread holds or waits for them. The ids are spread among NUM_SHARDS dicts, each with
+    its own lock, so threads locking different objects rarely wait for each other.
     """
 
-    object_locks: dict[UUID, RLock] = dict()
-    class_lock = Lock()
+    NUM_SHARDS = 64
+    shards: list[tuple[Lock, dict[UUID, LockEntry]]] = [(Lock(), dict()) for _ in range(NUM_SHARDS)]
+
+    # Number of acquisitions that had to wait, per object id. When MAX_CONTENDED_IDS
+    # is exceeded, only the most contended half is kept.
+    MAX_CONTENDED_IDS = 1000
+    contention: Counter[UUID] = Counter()
+    contention_lock = Lock()
 
     def __init__(self, object_id):
         self.object_id = object_id
+        self.shard_lock, self.object_locks = self.shards[hash(object_id) % self.NUM_SHARDS]
 
-    def __enter__(self):
-        try:
-            self.object_locks[self.object_id].acquire()
-            # NOTE: This assert checks that cleanup thread don't remove
-            # lock while trying to acquire.
-            assert self.object_id in self.object_locks
-        except KeyError:
-            with self.class_lock:
-                try:
-                    self.object_locks[self.object_id].acquire()
-                except KeyError:
-                    self.object_locks[self.object_id] = RLock()
-                    self.object_locks[self.object_id].acquire()
+    def acquire(self, blocking=True, timeout=-1) -> bool:
+        with self.shard_lock:
+            entry = self.object_locks.get(self.object_id)
+            if entry is None:
+                entry = self.object_locks[self.object_id] = LockEntry()
+            entry.users += 1
+
+        if entry.lock.acquire(False):
+            return True
+
+        if blocking:
+            self.add_contention(self.object_id)
+            if entry.lock.acquire(timeout=timeout):
+                return True
+
+        self.remove_user(entry)
+        return False
+
+    def release(self):
+        entry = self.object_locks[self.object_id]
+        entry.lock.release()
+        self.remove_user(entry)
+
+    def remove_user(self, entry):
+        with self.shard_lock:
+            entry.users -= 1
+            if entry.users == 0:
+                del self.object_locks[self.object_id]
+
+    __enter__ = acquire
 
     def __exit__(self, exc_type, exc_value, traceback):
-        try:
-            self.object_locks[self.object_id].release()
-        except KeyError:
-            pass
+        self.release()
+
+    @classmethod
+    def add_contention(cls, object_id):
+        with cls.contention_lock:
+            cls.contention[object_id] += 1
+            if len(cls.contention) > cls.MAX_CONTENDED_IDS:
+                cls.contention = Counter(
+                    dict(cls.contention.most_common(cls.MAX_CONTENDED_IDS // 2))
+                )
+
+    @classmethod
+    def get_contention(cls, n=10) -> list[tuple[UUID, int]]:
+        """Returns the n most contended object ids, with the times a thread had to wait"""
+        with cls.contention_lock:
+            return cls.contention.most_common(n)
+
+    @classmethod
+    def num_locks(cls) -> int:
+        """Returns the number of object ids with a lock held or waited for"""
+        return sum(len(object_locks) for _, object_locks in cls.shards)
 
 
 # NOTE this lock is faster and don't require cleanup,
@@ -104,6 +172,185 @@ class UUIDLock_old(AbstractContextManager):
             self.cv.notify_all()
 
 
+# The batch of each thread, if any (see ActiveMethodBatch)
+batch_local = threading.local()
+
+
+class BatchedCall:
+    __slots__ = (
+        "instance",
+        "method_name",
+        "args",
+        "kwargs",
+        "serialized_args",
+        "serialized_kwargs",
+        "future",
+    )
+
+    def __init__(self, instance, method_name, args, kwargs):
+        from dataclay.utils import pickle as dcpickle
+
+        self.instance = instance
+        self.method_name = method_name
+        self.args = args
+        self.kwargs = kwargs
+        self.serialized_args = dcpickle.dumps(args)
+        self.serialized_kwargs = dcpickle.dumps(kwargs)
+        self.future = Future()
+
+
+class ActiveMethodBatch(AbstractContextManager):
+    """Queues the remote activemethod calls, and property gets and sets, of the thread,
+    and sends them in one request per backend when the block ends:
+
+        with dataclay.batch():
+            futures = [obj.method(x) for obj in objects]
+        results = [future.result() for future in futures]
+
+    Inside the block, the remote calls return a Future. The arguments are serialized
+    when the call is queued. The calls to each backend are executed in order, while
+    the calls to different backends are sent concurrently. The queued calls are also
+    sent when max_size (ACTIVEMETHOD_BATCH_SIZE) is reached, or with flush(). If the
+    block raises, the calls not sent yet are cancelled.
+    """
+
+    def __init__(self, runtime: DataClayRuntime, max_size=None):
+        self.runtime = runtime
+        self.max_size = settings.ACTIVEMETHOD_BATCH_SIZE if max_size is None else max_size
+        self.calls: defaultdict[UUID, list[BatchedCall]] = defaultdict(list)
+        self.size = 0
+        self.previous = None
+
+    def __enter__(self):
+        self.previous = getattr(batch_local, "batch", None)
+        batch_local.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        batch_local.batch = self.previous
+        if exc_type is None:
+            self.flush()
+        else:
+            self.cancel()
+
+    def add(self, instance, method_name, args, kwargs) -> Future:
+        call = BatchedCall(instance, method_name, args, kwargs)
+        self.calls[instance._dc_backend_id].append(call)
+        self.size += 1
+        if self.size >= self.max_size:
+            self.flush()
+        return call.future
+
+    def cancel(self):
+        for calls in self.calls.values():
+            for call in calls:
+                call.future.cancel()
+        self.calls.clear()
+        self.size = 0
+
+    def flush(self):
+        """Sends the queued calls, and waits for their results"""
+        calls_by_backend = self.calls
+        self.calls = defaultdict(list)
+        self.size = 0
+        if not calls_by_backend:
+            return
+
+        # NOTE: Calls retried while flushing must not be queued again
+        previous, batch_local.batch = getattr(batch_local, "batch", None), None
+        try:
+            if len(calls_by_backend) == 1:
+                self.send(*calls_by_backend.popitem())
+                return
+
+            executor = self.runtime.activemethod_executor
+            session = self.runtime.session
+            futures = [
+                executor.submit(self.runtime._call_in_session, session, self.send, item, {})
+                for item in calls_by_backend.items()
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            batch_local.batch = previous
+
+    def send(self, backend_id: UUID, calls: list[BatchedCall]):
+        from dataclay.utils import pickle as dcpickle
+
+        try:
+            backend_client = self.runtime.get_backend_client(backend_id)
+        except KeyError:
+            # NOTE: The backend hint of the objects may be stale, so they are called one by one
+            for call in calls:
+                self.retry(call)
+            return
+
+        while calls:
+            try:
+                results = backend_client.call_active_method_batch(
+                    self.runtime.session.id,
+                    [
+                        (
+                            call.instance._dc_id,
+                            call.method_name,
+                            call.serialized_args,
+                            call.serialized_kwargs,
+                        )
+                        for call in calls
+                    ],
+                )
+            except Exception as e:
+                for call in calls:
+                    if call.future.set_running_or_notify_cancel():
+                        call.future.set_exception(e)
+                return
+
+            # NOTE: The backend stops at the first call to an object that has been moved.
+            # That call is retried in its new backend, and then the following calls are
+            # sent again, so that the calls are still executed in order
+            remaining, calls = calls, []
+            for index, (call, (value, is_exception)) in enumerate(zip(remaining, results)):
+                try:
+                    response = dcpickle.loads(value) if value else None
+                    if isinstance(response, StreamedResult):
+                        response = self.runtime.read_streamed_result(backend_client, response)
+                except Exception as e:
+                    response, is_exception = e, True
+
+                if isinstance(response, ObjectWithWrongBackendId):
+                    self.runtime.invalidate_object_metadata(call.instance._dc_id)
+                    call.instance._dc_backend_id = response.backend_id
+                    self.retry(call)
+                    calls = remaining[index + 1 :]
+                    break
+                elif not call.future.set_running_or_notify_cancel():
+                    continue
+                elif is_exception:
+                    call.future.set_exception(response)
+                else:
+                    call.future.set_result(response)
+            else:
+                # NOTE: Calls without a result would never be done
+                for call in remaining[len(results) :]:
+                    if call.future.set_running_or_notify_cancel():
+                        call.future.set_exception(
+                            DataClayException(f"No result from backend {backend_id}")
+                        )
+
+    def retry(self, call: BatchedCall):
+        """Calls the activemethod on its own, updating its backend if needed"""
+        if not call.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.runtime.call_active_method(
+                call.instance, call.method_name, call.args, call.kwargs
+            )
+        except Exception as e:
+            call.future.set_exception(e)
+        else:
+            call.future.set_result(result)
+
+
 class DataClayRuntime(ABC):
     def __init__(self, metadata_service: MetadataAPI | MetadataClient):
 
@@ -111,9 +358,19 @@ class DataClayRuntime(ABC):
         self._dataclay_id = None
         self.metadata_service = metadata_service
 
+        # Event to stop the thread watching the backends
+        self.backends_watcher_stop = threading.Event()
+
         # Memory objects. This dictionary must contain all objects in runtime memory (client or server), as weakrefs.
         self.inmemory_objects = WeakValueDictionary()
 
+        # Compression of the object states sent to other backends (see TRANSFER_COMPRESSION)
+        self.transfer_compression = CompressionPolicy(settings.TRANSFER_COMPRESSION)
+
+        # Threads calling the submitted activemethods, started when first used
+        self._activemethod_executor = None
+        self.activemethod_executor_lock = Lock()
+
     ##############
     # Properties #
     ##############
@@ -140,6 +397,10 @@ class DataClayRuntime(ABC):
     def add_to_heap(self, instance: DataClayObject):
         pass
 
+    def touch(self, instance: DataClayObject, modified=False):
+        """Notifies an access to a local object (used by the eviction policy)"""
+        pass
+
     ##############
     # Get Object #
     ##############
@@ -164,7 +425,7 @@ class DataClayRuntime(ABC):
                     # object from it.
 
                     if object_md is None:
-                        object_md = self.metadata_service.get_object_md_by_id(object_id)
+                        object_md = self.get_object_md_by_id(object_id)
 
                     module_name, class_name = object_md.class_name.rsplit(".", 1)
                     m = importlib.import_module(module_name)
@@ -189,6 +450,86 @@ class DataClayRuntime(ABC):
                     self.inmemory_objects[proxy_object._dc_id] = proxy_object
                     return proxy_object
 
+    def get_objects_by_ids(self, object_ids: list[UUID]) -> list[DataClayObject]:
+        """Get dataclay objects from inmemory_objects. The metadata of all the objects
+        not present is obtained in a single call, and new proxy objects are created from it.
+        """
+        missing_ids = {
+            object_id for object_id in object_ids if object_id not in self.inmemory_objects
+        }
+        if missing_ids:
+            object_mds = self.get_object_mds_by_ids(list(missing_ids))
+            object_mds = {object_md.id: object_md for object_md in object_mds}
+        else:
+            object_mds = {}
+
+        return [
+            self.get_object_by_id(object_id, object_mds.get(object_id)) for object_id in object_ids
+        ]
+
+    def get_object_reference(
+        self,
+        object_id: UUID,
+        cls: type[DataClayObject],
+        backend_id: UUID = None,
+        dataset_name: str = None,
+    ) -> DataClayObject:
+        """Get dataclay object from inmemory_objects. If not present, create a new proxy
+        object from the location hint (backend_id and dataset_name).
+
+        Used during deserialization, to avoid getting the metadata of each reference.
+        Without a hint, the proxy object must be resolved with "resolve_objects". A stale
+        hint is corrected when the backend replies with ObjectWithWrongBackendId.
+        """
+        try:
+            return self.inmemory_objects[object_id]
+        except KeyError:
+            with UUIDLock(object_id):
+                try:
+                    return self.inmemory_objects[object_id]
+                except KeyError:
+                    proxy_object = cls.new_proxy_object(
+                        _dc_id=object_id,
+                        _dc_is_local=False,
+                        _dc_is_loaded=False,
+                        _dc_is_registered=True,
+                    )
+
+                    # NOTE: A hint to this backend is not trusted, since the object
+                    # could have been moved, and it would be wrongly considered local
+                    if not (self.is_backend and backend_id == settings.DATACLAY_BACKEND_ID):
+                        proxy_object._dc_dataset_name = dataset_name
+                        proxy_object._dc_backend_id = backend_id
+
+                    self.inmemory_objects[object_id] = proxy_object
+                    return proxy_object
+
+    def resolve_objects(self, instances: list[DataClayObject]):
+        """Set the metadata of the proxy objects created by "get_object_reference".
+
+        The metadata of all the unresolved objects is obtained in a single call.
+        """
+        unresolved = {
+            instance._dc_id: instance for instance in instances if instance._dc_backend_id is None
+        }
+        if not unresolved:
+            return
+
+        for object_md in self.get_object_mds_by_ids(list(unresolved)):
+            instance = unresolved[object_md.id]
+            # NOTE: _dc_is_local is set before the metadata, since a
+            # _dc_backend_id different than None means the object is resolved
+            instance._dc_is_local = (
+                self.is_backend and object_md.backend_id == settings.DATACLAY_BACKEND_ID
+            )
+            instance.metadata = object_md
+
+    def get_object_md_by_id(self, object_id: UUID) -> ObjectMetadata:
+        return self.metadata_service.get_object_md_by_id(object_id)
+
+    def get_object_mds_by_ids(self, object_ids: list[UUID]) -> list[ObjectMetadata]:
+        return self.metadata_service.get_object_mds_by_ids(object_ids)
+
     def get_object_by_alias(self, alias, dataset_name=None) -> DataClayObject:
         """Get object instance from alias"""
 
@@ -204,8 +545,21 @@ class DataClayRuntime(ABC):
     ##################
 
     def call_active_method(self, instance, method_name, args: tuple, kwargs: dict):
-        serialized_args = pickle.dumps(args)
-        serialized_kwargs = pickle.dumps(kwargs)
+        # NOTE: Proxy objects created during a deserialization are resolved
+        # here if they are accessed before the deserialization ends
+        if instance._dc_backend_id is None:
+            self.resolve_objects([instance])
+            if instance._dc_is_local:
+                return getattr(instance, method_name)(*args, **kwargs)
+
+        batch = getattr(batch_local, "batch", None)
+        if batch is not None:
+            return batch.add(instance, method_name, args, kwargs)
+
+        from dataclay.utils import pickle as dcpickle
+
+        serialized_args = dcpickle.dumps(args)
+        serialized_kwargs = dcpickle.dumps(kwargs)
         # TODO: Add serialized volatile objects to
         # self.volatile_parameters_being_send to avoid race conditon.
         # May be necessary a custom pickle.Pickler
@@ -214,19 +568,29 @@ class DataClayRuntime(ABC):
         # NOTE: Loop to update the backend_id when we have the wrong one, and call again
         # the active method
         while True:
-            backend_client = self.get_backend_client(instance._dc_backend_id)
+            try:
+                backend_client = self.get_backend_client(instance._dc_backend_id)
+            except KeyError:
+                # NOTE: The backend hint of the object may be stale
+                self.invalidate_object_metadata(instance._dc_id)
+                self.update_object_metadata(instance)
+                backend_client = self.get_backend_client(instance._dc_backend_id)
 
             serialized_response, is_exception = backend_client.call_active_method(
                 self.session.id, instance._dc_id, method_name, serialized_args, serialized_kwargs
             )
 
             if serialized_response:
-                response = pickle.loads(serialized_response)
+                response = dcpickle.loads(serialized_response)
 
                 if isinstance(response, ObjectWithWrongBackendId):
+                    self.invalidate_object_metadata(instance._dc_id)
                     instance._dc_backend_id = response.backend_id
                     continue
 
+                if isinstance(response, StreamedResult):
+                    return self.read_streamed_result(backend_client, response)
+
                 if is_exception:
                     raise response
 
@@ -235,6 +599,132 @@ class DataClayRuntime(ABC):
             else:
                 return None
 
+    def read_streamed_result(self, backend_client: BackendClient, result: StreamedResult):
+        """Returns the streamed value, or a lazy iterator of the items of a streamed generator"""
+        from dataclay.utils import pickle as dcpickle
+
+        chunks = backend_client.read_active_method_stream(self.session.id, result.stream_id)
+        if result.is_generator:
+            return self.iter_streamed_items(chunks)
+        return dcpickle.loads(b"".join(data for _, data, _ in chunks))
+
+    @staticmethod
+    def iter_streamed_items(chunks):
+        from dataclay.utils import pickle as dcpickle
+
+        for items, _, exception in chunks:
+            for item in items:
+                yield dcpickle.loads(item)
+            if exception:
+                raise dcpickle.loads(exception)
+
+    # NOTE: Runtimes without an async client execute the coroutines synchronously
+
+    async def a_call_active_method(self, instance, method_name, args: tuple, kwargs: dict):
+        return self.call_active_method(instance, method_name, args, kwargs)
+
+    async def a_make_persistent(self, instance, alias, backend_id, recursive):
+        return self.make_persistent(instance, alias, backend_id, recursive)
+
+    async def a_get_object_by_alias(self, alias, dataset_name=None):
+        return self.get_object_by_alias(alias, dataset_name)
+
+    ############################
+    # Concurrent activemethods #
+    ############################
+
+    @property
+    def activemethod_executor(self) -> ThreadPoolExecutor:
+        with self.activemethod_executor_lock:
+            if self._activemethod_executor is None:
+                self._activemethod_executor = ThreadPoolExecutor(
+                    settings.ACTIVEMETHOD_WORKERS, thread_name_prefix="activemethod"
+                )
+            return self._activemethod_executor
+
+    def stop_activemethod_executor(self):
+        with self.activemethod_executor_lock:
+            if self._activemethod_executor is not None:
+                self._activemethod_executor.shutdown()
+                self._activemethod_executor = None
+
+    def submit_active_method(self, instance, method_name, args: tuple, kwargs: dict) -> Future:
+        """Calls the activemethod in a thread of the activemethod_executor"""
+        return self.activemethod_executor.submit(
+            self._call_in_session, self.session, getattr(instance, method_name), args, kwargs
+        )
+
+    def _call_in_session(self, session, method, args, kwargs):
+        # NOTE: The session of a backend is thread local, so it is set in the worker thread
+        self.session = session
+        return method(*args, **kwargs)
+
+    def batch(self, max_size=None) -> ActiveMethodBatch:
+        return ActiveMethodBatch(self, max_size)
+
+    def map_active(
+        self,
+        objects,
+        method_name,
+        *args,
+        max_in_flight=None,
+        return_exceptions=False,
+        **kwargs,
+    ) -> list:
+        """Calls the activemethod of all the objects concurrently, and returns the results in order
+
+        The calls are grouped by the backend of the objects, with at most max_in_flight
+        (ACTIVEMETHOD_MAX_IN_FLIGHT) calls in flight to each backend. All the calls are done
+        even if some of them fail. Then, the exception of the first failed call is raised,
+        unless return_exceptions is True, in which case the exceptions are returned in place
+        of the results.
+
+        NOTE: It must not be called from the submitted activemethods, since it waits for
+        threads of the same executor.
+        """
+        if max_in_flight is None:
+            max_in_flight = settings.ACTIVEMETHOD_MAX_IN_FLIGHT
+        objects = list(objects)
+        futures = [Future() for _ in objects]
+
+        pending_by_backend = defaultdict(deque)
+        for index, instance in enumerate(objects):
+            pending_by_backend[instance._dc_backend_id].append(index)
+
+        def call_pending(session, pending: deque):
+            self.session = session
+            while True:
+                try:
+                    index = pending.popleft()
+                except IndexError:
+                    return
+                future = futures[index]
+                future.set_running_or_notify_cancel()
+                try:
+                    future.set_result(getattr(objects[index], method_name)(*args, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+
+        for pending in pending_by_backend.values():
+            num_workers = 0
+            max_workers = min(max_in_flight, len(pending))
+            try:
+                while num_workers < max_workers:
+                    self.activemethod_executor.submit(call_pending, self.session, pending)
+                    num_workers += 1
+            except Exception as e:
+                # NOTE: The calls of a backend without workers (e.g. the executor has been
+                # shut down) would never be done, so they fail with the exception
+                if num_workers == 0:
+                    for index in pending:
+                        futures[index].set_running_or_notify_cancel()
+                        futures[index].set_exception(e)
+                    pending.clear()
+
+        if return_exceptions:
+            return [future.exception() or future.result() for future in futures]
+        return [future.result() for future in futures]
+
     #########
     # Alias #
     #########
@@ -251,9 +741,14 @@ class DataClayRuntime(ABC):
         pass
 
     def update_object_metadata(self, instance: DataClayObject):
-        object_md = self.metadata_service.get_object_md_by_id(instance._dc_id)
+        object_md = self.get_object_md_by_id(instance._dc_id)
         instance.metadata = object_md
 
+    def invalidate_object_metadata(self, object_id: UUID):
+        """Called when the metadata of the object is known to be outdated
+        (e.g. the object has been moved). Only relevant for runtimes that cache it."""
+        pass
+
     ############
     # Backends #
     ############
@@ -265,40 +760,75 @@ class DataClayRuntime(ABC):
             self.update_backend_clients()
             return self.backend_clients[backend_id]
 
-    def update_backend_clients(self):
-        backend_infos = self.metadata_service.get_all_backends(from_backend=self.is_backend)
-        new_backend_clients = {}
+    def update_backend_clients(self, backend_infos=None):
+        """Updates backend_clients with the backend_infos (or all the backends registered)
 
-        # TODO: Update backend_clients using multithreading
-        for id, info in backend_infos.items():
-            if id in self.backend_clients:
-                if self.backend_clients[id].is_ready(settings.TIMEOUT_CHANNEL_READY):
-                    new_backend_clients[id] = self.backend_clients[id]
-                    continue
+        Clients of known backends are reused. Their readiness is not checked, since
+        the connection health is tracked in background by each BackendClient.
+        """
+        if backend_infos is None:
+            backend_infos = self.metadata_service.get_all_backends(from_backend=self.is_backend)
 
-            backend_client = BackendClient(info.hostname, info.port)
-            if backend_client.is_ready(settings.TIMEOUT_CHANNEL_READY):
-                new_backend_clients[id] = backend_client
-            else:
-                del backend_infos[id]
+        new_backend_clients = {}
+        for id, info in backend_infos.items():
+            try:
+                new_backend_clients[id] = self.backend_clients[id]
+            except KeyError:
+                new_backend_clients[id] = BackendClient(info.hostname, info.port)
 
+        old_backend_clients = self.backend_clients
         self.backend_clients = new_backend_clients
 
+        for id, backend_client in old_backend_clients.items():
+            if id not in new_backend_clients:
+                logger.debug("Closing client connection to removed backend %s", id)
+                backend_client.close()
+
+    def start_backends_watcher(self):
+        """Starts a thread that keeps backend_clients up to date
+
+        The metadata service pushes the backends every time a backend is
+        registered or deleted, so backend_clients don't need to be refreshed inline.
+        """
+        self.backends_watcher_stop.clear()
+        thread = threading.Thread(target=self.watch_backends, name="backends-watcher", daemon=True)
+        thread.start()
+
+    def watch_backends(self):
+        while not self.backends_watcher_stop.is_set():
+            try:
+                for backend_infos in self.metadata_service.watch_backends(
+                    self.is_backend, self.backends_watcher_stop
+                ):
+                    self.update_backend_clients(backend_infos)
+            except Exception as e:
+                if self.backends_watcher_stop.is_set():
+                    break
+                logger.warning(f"Lost backends watch ({e}). Retrying...")
+
+            self.backends_watcher_stop.wait(settings.BACKENDS_WATCH_RETRY_INTERVAL)
+
+    def stop_backends_watcher(self):
+        self.backends_watcher_stop.set()
+
     #################
     # Store Methods #
     #################
 
     # NOTE: Maybe it should be only in client runtime ¿?
     def get_copy_of_object(self, instance, recursive):
+        from dataclay.utils import pickle as dcpickle
+
         backend_id = instance._dc_backend_id
         backend_client = self.get_backend_client(backend_id)
 
         serialized_properties = backend_client.get_copy_of_object(
             self.session.id, instance._dc_id, recursive
         )
-        object_properties = pickle.loads(serialized_properties)
+        object_properties = dcpickle.loads(decompress(serialized_properties))
 
-        proxy_object = instance._dc_class.new_proxy_object()
+        # NOTE: The copy is a new object, with a new id
+        proxy_object = instance._dc_class.new_proxy_object(_dc_id=uuid4())
         vars(proxy_object).update(object_properties)
         self.add_to_heap(proxy_object)
 
@@ -308,10 +838,14 @@ class DataClayRuntime(ABC):
     # If can also be executed in active_method, then if the object is local,
     # don't call the gRPC client
     def update_object(self, instance, new_instance):
+        from dataclay.utils import pickle as dcpickle
+
         backend_id = instance._dc_backend_id
         backend_client = self.get_backend_client(backend_id)
 
-        serialized_properties = pickle.dumps(new_instance._dc_properties)
+        serialized_properties = self.transfer_compression.compress(
+            dcpickle.dumps(new_instance._dc_properties)
+        )
         backend_client.update_object(self.session.id, instance._dc_id, serialized_properties)
 
     #####################
@@ -29,7 +29,7 @@ class Configuration(object):
     MEMMGMT_PRESSURE_FRACTION = float(os.getenv("MEMMGMT_PRESSURE_FRACTION", default=0.75))
 
     # Percentage to stop flushing objects
-    MEMMGMT_EASE_FRACTION = float(os.getenv("MEMMGMT_PRESSURE_FRACTION", default=0.50))
+    MEMMGMT_EASE_FRACTION = float(os.getenv("MEMMGMT_EASE_FRACTION", default=0.50))
 
     # Number of milliseconds to check if Heap needs to be cleaned.
     MEMMGMT_CHECK_TIME_INTERVAL = int(os.getenv("MEMMGMT_CHECK_TIME_INTERVAL", default=5000))
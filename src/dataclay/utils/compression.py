@@ -0,0 +1,162 @@
+"""Compression of the serialized objects, stored or transferred
+
+Compressed data is framed with a magic byte and the id of the codec, so data compressed
+with any codec, or not compressed, can always be read. Data is only framed when it is
+compressed: uncompressed data are plain pickles, which never start with the magic byte.
+"""
+
+import struct
+import threading
+import zlib
+
+from dataclay.conf import settings
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FRAME_MAGIC = 0xDC
+FRAME_HEADER = struct.Struct("<BB")
+
+# Data is kept uncompressed if the compressed size is above this fraction of the original
+MAX_COMPRESSION_RATIO = 0.9
+
+# Bytes compressed in advance to detect incompressible data, in data of at least twice
+SAMPLE_SIZE = 64 * 1024
+
+
+class Codec:
+    id: int
+    name: str
+
+    def compress(self, data) -> bytes:
+        raise NotImplementedError
+
+    def decompress(self, data) -> bytes:
+        raise NotImplementedError
+
+
+class ZlibCodec(Codec):
+    id = 1
+    name = "zlib"
+
+    def compress(self, data):
+        return zlib.compress(data, 1)
+
+    def decompress(self, data):
+        return zlib.decompress(data)
+
+
+class LZ4Codec(Codec):
+    id = 2
+    name = "lz4"
+
+    def __init__(self):
+        if lz4 is None:
+            raise ImportError("The lz4 codec requires the lz4 package")
+
+    def compress(self, data):
+        return lz4.frame.compress(data)
+
+    def decompress(self, data):
+        return lz4.frame.decompress(data)
+
+
+class ZstdCodec(Codec):
+    id = 3
+    name = "zstd"
+
+    def __init__(self, level=3):
+        if zstandard is None:
+            raise ImportError("The zstd codec requires the zstandard package")
+        self.level = level
+
+        # NOTE: Compressors and decompressors cannot be shared by threads
+        self.local = threading.local()
+
+    def compress(self, data):
+        try:
+            compressor = self.local.compressor
+        except AttributeError:
+            compressor = self.local.compressor = zstandard.ZstdCompressor(level=self.level)
+        return compressor.compress(data)
+
+    def decompress(self, data):
+        try:
+            decompressor = self.local.decompressor
+        except AttributeError:
+            decompressor = self.local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(data)
+
+
+CODECS = {codec.name: codec for codec in (ZlibCodec, LZ4Codec, ZstdCodec)}
+CODECS_BY_ID = {codec.id: codec for codec in CODECS.values()}
+codec_instances: dict[type[Codec], Codec] = dict()
+
+
+def get_codec(name: str) -> Codec | None:
+    """Returns the codec with the name, or None for "none" """
+    name = name.lower()
+    if name == "none":
+        return None
+    try:
+        codec_class = CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown compression codec {name}. Choose one of none, {', '.join(CODECS)}"
+        ) from None
+
+    try:
+        return codec_instances[codec_class]
+    except KeyError:
+        return codec_instances.setdefault(codec_class, codec_class())
+
+
+def compress(data: bytes, codec: Codec | None) -> bytes:
+    """Compresses the data, unless it is small (COMPRESSION_THRESHOLD) or incompressible"""
+    if codec is None or len(data) < settings.COMPRESSION_THRESHOLD:
+        return data
+
+    if len(data) >= 2 * SAMPLE_SIZE:
+        sample = memoryview(data)[:SAMPLE_SIZE]
+        if len(codec.compress(sample)) > MAX_COMPRESSION_RATIO * SAMPLE_SIZE:
+            return data
+
+    compressed = codec.compress(data)
+    if FRAME_HEADER.size + len(compressed) > MAX_COMPRESSION_RATIO * len(data):
+        return data
+    return FRAME_HEADER.pack(FRAME_MAGIC, codec.id) + compressed
+
+
+def decompress(data: bytes) -> bytes:
+    """Returns the data decompressed with the codec of its frame, or as is if not compressed"""
+    if not data or data[0] != FRAME_MAGIC:
+        return data
+    _, codec_id = FRAME_HEADER.unpack_from(data)
+    codec = get_codec(CODECS_BY_ID[codec_id].name)
+    return codec.decompress(memoryview(data)[FRAME_HEADER.size :])
+
+
+class CompressionPolicy:
+    """Chooses the codec of the objects of each class
+
+    The codecs of the classes are given as "module.Class=codec,...". Other classes use
+    the default codec.
+    """
+
+    def __init__(self, default: str, classes: str = ""):
+        self.default = get_codec(default)
+        self.classes = dict()
+        for item in classes.split(","):
+            if item.strip():
+                class_name, codec_name = item.split("=")
+                self.classes[class_name.strip()] = get_codec(codec_name.strip())
+
+    def compress(self, data: bytes, class_name: str = None) -> bytes:
+        return compress(data, self.classes.get(class_name, self.default))
@@ -14,3 +14,16 @@ def grpc_error_handler(func):
             raise DataClayException(e.details()) from None
 
     return wrapper_grpc_error_handler
+
+
+def aio_grpc_error_handler(func):
+    """grpc_error_handler for coroutine functions (grpc.aio calls)"""
+
+    @functools.wraps(func)
+    async def wrapper_aio_grpc_error_handler(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except grpc.RpcError as e:
+            raise DataClayException(e.details()) from None
+
+    return wrapper_aio_grpc_error_handler
@@ -28,7 +28,7 @@ class RecursiveLocalPickler(pickle.Pickler):
                 if obj._dc_id not in self.visited_objects:
                     self.visited_objects[obj._dc_id] = obj
                     f = io.BytesIO()
-                    if not obj._dc_is_loaded:
+                    if not obj._dc_is_loaded or obj._xdc_stored_apart:
                         get_runtime().load_object_from_db(obj)
                     RecursiveLocalPickler(f, self.visited_objects, self.serialized).dump(
                         obj._dc_dict
@@ -37,26 +37,91 @@ class RecursiveLocalPickler(pickle.Pickler):
 
                 return ("local", obj._dc_id, obj.__class__)
             else:
-                return ("remote", obj._dc_id, obj.__class__)
+                return (
+                    "remote",
+                    obj._dc_id,
+                    obj.__class__,
+                    obj._dc_backend_id,
+                    obj._dc_dataset_name,
+                )
         else:
             return None
 
 
 class RecursiveLocalUnpickler(pickle.Unpickler):
-    def __init__(self, file, unserialized: dict[UUID, DataClayObject]):
-        super().__init__(file)
+    def __init__(
+        self,
+        file,
+        unserialized: dict[UUID, DataClayObject],
+        unresolved: list[DataClayObject] = None,
+        buffers=None,
+    ):
+        super().__init__(file, buffers=buffers)
         self.unserialized = unserialized
 
+        # NOTE: Remote references are not resolved one by one. Their metadata is obtained
+        # at once when the load ends. If unresolved is provided, the caller must resolve
+        # them calling "resolve_objects", once all the objects have been unpickled.
+        self.resolve_on_load = unresolved is None
+        self.unresolved = [] if unresolved is None else unresolved
+
+    def load(self):
+        result = super().load()
+        if self.resolve_on_load and self.unresolved:
+            get_runtime().resolve_objects(self.unresolved)
+        return result
+
     def persistent_load(self, pers_id):
-        tag, object_id, cls = pers_id
+        tag, object_id, cls, *hint = pers_id
         if tag == "remote":
-            return get_runtime().get_object_by_id(object_id)
+            dc_object = get_runtime().get_object_reference(object_id, cls, *hint)
+            if dc_object._dc_backend_id is None:
+                self.unresolved.append(dc_object)
+            return dc_object
         elif tag == "local":
             try:
                 return self.unserialized[object_id]
             except KeyError:
-                proxy_object = cls.new_proxy_object()
+                proxy_object = cls.new_proxy_object(_dc_id=object_id)
                 self.unserialized[object_id] = proxy_object
                 return proxy_object
 
         raise pickle.UnpicklingError("unsupported persistent object")
+
+
+class PersistentPickler(pickle.Pickler):
+    """Pickler that serializes dataclay objects as remote references.
+
+    Objects that are not registered are made persistent.
+    """
+
+    def persistent_id(self, obj):
+        if isinstance(obj, DataClayObject):
+            if not obj._dc_is_registered:
+                obj.make_persistent()
+            return ("remote", obj._dc_id, obj.__class__, obj._dc_backend_id, obj._dc_dataset_name)
+        else:
+            return None
+
+
+def dumps(obj, buffer_callback=None) -> bytes:
+    """If buffer_callback is given, pickle protocol 5 is used, and the buffers for which
+    it returns False are not serialized (they must be provided to loads)"""
+    f = io.BytesIO()
+    if buffer_callback is None:
+        PersistentPickler(f).dump(obj)
+    else:
+        PersistentPickler(f, protocol=5, buffer_callback=buffer_callback).dump(obj)
+    return f.getvalue()
+
+
+def dump(obj, file):
+    PersistentPickler(file).dump(obj)
+
+
+def loads(data: bytes, buffers=None):
+    return RecursiveLocalUnpickler(io.BytesIO(data), dict(), buffers=buffers).load()
+
+
+def load(file):
+    return RecursiveLocalUnpickler(file, dict()).load()
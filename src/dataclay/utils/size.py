@@ -0,0 +1,59 @@
+import sys
+from collections import deque
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from dataclay.dataclay_object import DataClayObject
+
+# Objects that are not owned by the object being measured, or do not reference others
+NOT_FOLLOWED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, DataClayObject)
+ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def estimate_size(obj, max_objects=100000) -> int:
+    """Approximate number of bytes used by the object and the objects it references
+
+    Objects shared by several references are counted once. Referenced DataClayObjects
+    are not counted, since they are loaded and unloaded on their own. The buffers of
+    numpy arrays and memoryviews are counted once, even if shared by several views.
+    At most max_objects objects are visited.
+    """
+    numpy = sys.modules.get("numpy")
+    visited = set()
+    pending = [obj]
+    size = 0
+
+    while pending and len(visited) < max_objects:
+        o = pending.pop()
+        if id(o) in visited or isinstance(o, NOT_FOLLOWED):
+            continue
+        visited.add(id(o))
+        size += sys.getsizeof(o)
+
+        if isinstance(o, ATOMIC):
+            continue
+
+        # NOTE: The size of a view doesn't include the buffer, which belongs to its base
+        if numpy is not None and isinstance(o, numpy.ndarray):
+            if o.base is not None:
+                pending.append(o.base)
+            if o.dtype.hasobject:
+                pending.extend(o.flat)
+            continue
+        if isinstance(o, memoryview):
+            pending.append(o.obj)
+            continue
+
+        if isinstance(o, dict):
+            pending.extend(o.keys())
+            pending.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset, deque)):
+            pending.extend(o)
+        else:
+            if hasattr(o, "__dict__"):
+                pending.append(vars(o))
+            slots = getattr(type(o), "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if hasattr(o, slot):
+                    pending.append(getattr(o, slot))
+
+    return size
@@ -0,0 +1,16 @@
+"""Results of activemethods sent in chunks, with the ReadActiveMethodStream RPC
+
+A backend replies with a StreamedResult, instead of the result, when an activemethod
+returns a generator or a value larger than ACTIVEMETHOD_STREAM_THRESHOLD. The client
+then reads the result from the stream: the items of a generator, in lists of serialized
+items, or the serialized value, in pieces. gRPC flow control stops the backend from
+producing chunks faster than the client reads them.
+"""
+
+from uuid import UUID
+
+
+class StreamedResult:
+    def __init__(self, stream_id: UUID, is_generator: bool):
+        self.stream_id = stream_id
+        self.is_generator = is_generator
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+
+def uuid_to_bytes(uuid: UUID | None) -> bytes:
+    """Binary (16 bytes) form of the UUID used in the gRPC messages"""
+    if uuid is None:
+        return b""
+    return uuid.bytes
+
+
+def uuid_from_bytes(value: bytes | str) -> UUID | None:
+    """Parse a UUID from a gRPC message
+
+    Besides the binary form, accepts the string form sent by older versions
+    (received as the UTF-8 bytes of the string).
+    """
+    if not value:
+        return None
+    if len(value) == 16:
+        return UUID(bytes=value)
+    if isinstance(value, bytes):
+        value = value.decode()
+    return UUID(value)
@@ -1,5 +1,6 @@
 """ Class description goes here. """
 
+import importlib
 import logging
 import os
 import uuid
@@ -32,10 +33,11 @@ def getByID(object_strid):
     :return: The (Persistent) DataClayObject
     """
     try:
-        object_id, hint, class_id = object_strid.split(":")
-        ret = get_runtime().get_object_by_id(
-            uuid.UUID(object_id), class_id=uuid.UUID(class_id), hint=uuid.UUID(hint)
-        )
+        object_id, hint, class_name = object_strid.split(":")
+        module_name, class_name = class_name.rsplit(".", 1)
+        cls = getattr(importlib.import_module(module_name), class_name)
+        ret = get_runtime().get_object_reference(uuid.UUID(object_id), cls, uuid.UUID(hint))
+        get_runtime().resolve_objects([ret])
     except ValueError:  # this can fail for both [not enough semicolons]|[invalid uuid]
         # Fallback behaviour: no extra fields, the whole string is the ObjectID UUID
         object_id = object_strid
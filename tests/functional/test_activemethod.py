@@ -1,6 +1,13 @@
+import gc
+import time
+
 import pytest
 
+import dataclay
+from dataclay.backend.client import BackendClient
 from dataclay.contrib.modeltest.family import Dog, Family, Person
+from dataclay.contrib.modeltest.matrix import Matrix
+from dataclay.exceptions import DataClayException
 
 
 def test_activemethod_argument_make_persistent(client):
@@ -66,3 +73,251 @@ def test_activemethod_inner_make_persistent(client):
     assert puppy == dog.puppies[0]
     assert puppy.name == "Rio"
     assert puppy.age == 0
+
+
+def test_activemethod_return_remote_references(client):
+    """
+    Remote references returned by an activemethod are resolved at once
+    """
+    family = Family()
+    family.make_persistent()
+    for i in range(20):
+        person = Person(f"Person {i}", i)
+        person.make_persistent()
+        family.add(person)
+
+    del person
+    gc.collect()
+
+    members = family.members
+    assert len(members) == 20
+    assert all(member.is_registered for member in members)
+    assert [member.age for member in members] == list(range(20))
+
+
+def test_activemethod_submit(client):
+    """
+    Submitted activemethods return futures with their results
+    """
+    person = Person("Marc", 24)
+    person.make_persistent()
+    assert person.add_year.submit().result() is None
+    futures = [person.get_age.submit() for _ in range(10)]
+    assert [future.result() for future in futures] == [25] * 10
+
+
+def test_map_active(client):
+    """
+    map_active returns the results in order, and the exception of each failed call
+    """
+    people = [Person(f"Person {i}", i) for i in range(20)]
+    for person in people:
+        person.make_persistent()
+    assert dataclay.map_active(people, "get_age", max_in_flight=4) == list(range(20))
+
+    objects = people[:2] + [Dog("Rex", 2)] + people[2:4]
+    objects[2].make_persistent()
+    results = dataclay.map_active(objects, "get_age", return_exceptions=True)
+    assert results[:2] + results[3:] == [0, 1, 2, 3]
+    assert isinstance(results[2], AttributeError)
+
+    with pytest.raises(AttributeError):
+        dataclay.map_active(objects, "get_age")
+
+
+def test_map_active_stopped_executor(client):
+    """
+    map_active fails the calls, instead of waiting forever, when the executor is stopped
+    """
+    people = [Person(f"Person {i}", i) for i in range(4)]
+    for person in people:
+        person.make_persistent()
+
+    runtime = dataclay.runtime.get_runtime()
+    runtime.activemethod_executor.shutdown()
+    try:
+        results = dataclay.map_active(people, "get_age", return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+    finally:
+        runtime.stop_activemethod_executor()
+    assert dataclay.map_active(people, "get_age") == list(range(4))
+
+
+def test_batch(client):
+    """
+    The remote calls and property accesses of a batch return futures, set when it ends
+    """
+    people = [Person(f"Person {i}", i) for i in range(10)]
+    for person in people:
+        person.make_persistent()
+
+    with dataclay.batch():
+        for person in people:
+            person.add_year()
+            person.name = "Batched"
+        ages = [person.get_age() for person in people]
+        names = [person.name for person in people]
+        assert not ages[0].done()
+
+    assert [age.result() for age in ages] == list(range(1, 11))
+    assert [name.result() for name in names] == ["Batched"] * 10
+    assert people[0].get_age() == 1
+
+
+def test_batch_exception(client):
+    """
+    A failed call of a batch sets the exception of its future, without stopping the others
+    """
+    person = Person("Marc", 24)
+    person.make_persistent()
+
+    with dataclay.batch():
+        error = person.get_age("unexpected")
+        age = person.get_age()
+
+    with pytest.raises(TypeError):
+        error.result()
+    assert age.result() == 24
+
+
+def test_batch_missing_results(client, monkeypatch):
+    """
+    The calls of a batch without a result fail, instead of waiting forever
+    """
+    person = Person("Marc", 24)
+    person.make_persistent()
+
+    call_active_method_batch = BackendClient.call_active_method_batch
+    monkeypatch.setattr(
+        BackendClient,
+        "call_active_method_batch",
+        lambda *args: call_active_method_batch(*args)[:1],
+    )
+    with dataclay.batch():
+        ages = [person.get_age() for _ in range(3)]
+
+    assert ages[0].result() == 24
+    for age in ages[1:]:
+        with pytest.raises(DataClayException):
+            age.result(timeout=10)
+
+
+def test_batch_wrong_backend_id(client):
+    """
+    A call to a moved object is retried in its backend before the following calls
+    """
+    backend_ids = list(client.get_backends())
+    person = Person("Marc", 24)
+    person.make_persistent(backend_id=backend_ids[0])
+    family = Family(person)
+    family.make_persistent(backend_id=backend_ids[1])
+
+    # The family is called after the person, in the same backend as the wrong backend_id
+    person._dc_backend_id = backend_ids[1]
+    with dataclay.batch():
+        person.add_year()
+        summary = family.__str__()
+        age = person.get_age()
+
+    assert summary.result() == "Members:\n - Name: Marc, age: 25"
+    assert age.result() == 25
+    assert person._dc_backend_id == backend_ids[0]
+
+
+def test_activemethod_generator(client):
+    """
+    A remote generator is iterated lazily, and raises where the backend generator raises
+    """
+    family = Family(Person("Marc", 24), Person("Alice", 21), Dog("Rex", 3))
+    family.make_persistent()
+    ages = family.iter_ages()
+    assert not isinstance(ages, list)
+    assert list(ages) == [24, 21, 3]
+
+    family.add("Not a member")
+    ages = family.iter_ages()
+    assert [next(ages) for _ in range(3)] == [24, 21, 3]
+    with pytest.raises(AttributeError):
+        next(ages)
+
+
+def stream_backend_id(client):
+    """Backend of port 6869, with a low ACTIVEMETHOD_STREAM_THRESHOLD and CHUNK_SIZE"""
+    return next(
+        backend_id
+        for backend_id, backend_client in client.get_backends().items()
+        if backend_client.address.endswith(":6869")
+    )
+
+
+def test_activemethod_large_result(client, monkeypatch):
+    """
+    Results above ACTIVEMETHOD_STREAM_THRESHOLD (64KiB in the backend of port 6869)
+    are received in chunks of ACTIVEMETHOD_STREAM_CHUNK_SIZE (16KiB)
+    """
+    chunks = []
+    read_active_method_stream = BackendClient.read_active_method_stream
+
+    def read_chunks(*args):
+        for chunk in read_active_method_stream(*args):
+            chunks.append(chunk)
+            yield chunk
+
+    monkeypatch.setattr(BackendClient, "read_active_method_stream", read_chunks)
+
+    matrix = Matrix()
+    matrix.make_persistent(backend_id=stream_backend_id(client))
+    matrix.init_zeros((200, 200))
+    mtx = matrix.mtx
+    assert mtx.shape == (200, 200) and not mtx.any()
+    assert len(chunks) > 1
+    assert all(len(data) <= 16384 for _, data, _ in chunks)
+
+    chunks.clear()
+    matrix.init_zeros((20, 20))
+    assert matrix.mtx.shape == (20, 20)
+    assert not chunks
+
+
+def test_activemethod_generator_stream(client):
+    """
+    The object of a generator is not flushed while its stream is read, and the objects
+    created by the generator are registered before the client reads them
+    """
+    family = Family()
+    family.make_persistent(backend_id=stream_backend_id(client))
+    runtime = dataclay.runtime.get_runtime()
+    backend_client = runtime.get_backend_client(family._dc_backend_id)
+
+    names = [f"Person {i}" for i in range(50)]
+    members = family.iter_new_members(names, padding=200 * 1024)
+    person, _ = next(members)
+    assert runtime.metadata_service.get_object_md_by_id(person._dc_id).id == person._dc_id
+    assert person.name == "Person 0"
+
+    backend_client.flush_all()
+    assert [person.name for person, _ in members] == names[1:]
+    backend_client.flush_all()
+    assert [person.name for person in family.members] == names
+
+
+def test_activemethod_idle_stream(client, monkeypatch):
+    """
+    A backend cancels a stream when the client does not read it for
+    ACTIVEMETHOD_STREAM_IDLE_TIMEOUT (2 seconds in the backend of port 6869)
+    """
+    matrix = Matrix()
+    matrix.make_persistent(backend_id=stream_backend_id(client))
+    matrix.init_zeros((1500, 1500))
+
+    runtime = dataclay.runtime.get_runtime()
+    streams = []
+    monkeypatch.setattr(runtime, "read_streamed_result", lambda *args: streams.append(args))
+    matrix.mtx
+    backend_client, result = streams[0]
+    chunks = backend_client.read_active_method_stream(runtime.session.id, result.stream_id)
+    next(chunks)
+    time.sleep(4)
+    with pytest.raises(DataClayException):
+        for _ in chunks:
+            pass
@@ -1,5 +1,6 @@
 import pytest
 
+import dataclay.runtime
 from dataclay.contrib.modeltest.family import Family, Person
 from dataclay.exceptions import *
 
@@ -32,3 +33,22 @@ def test_same_alias(client):
 
 def test_change_alias(client):
     pass
+
+
+def test_get_by_alias_cached(client):
+    """Hot alias lookups should be served from the client cache"""
+    person = Person("Marc", 24)
+    person.make_persistent(alias="test_get_by_alias_cached")
+    backend_id = person._dc_backend_id
+    del person
+
+    runtime = dataclay.runtime.get_runtime()
+    hits = runtime.alias_cache.hits
+    person = Person.get_by_alias("test_get_by_alias_cached")
+    assert runtime.alias_cache.hits == hits + 1
+    assert person._dc_backend_id == backend_id
+
+    Person.delete_alias("test_get_by_alias_cached")
+    with pytest.raises(DataClayException) as excinfo:
+        Person.get_by_alias("test_get_by_alias_cached")
+    assert "does not exist" in str(excinfo.value)
@@ -0,0 +1,61 @@
+import asyncio
+import uuid
+
+import dataclay
+from dataclay.backend.client import AsyncBackendClient
+from dataclay.contrib.modeltest.family import Person
+from dataclay.runtime import set_runtime
+
+
+def test_async_client(client, caplog):
+    """
+    Objects are made persistent, fetched and called with the asyncio API
+    """
+
+    async def main():
+        async with await dataclay.async_client(
+            host="127.0.0.1", username="testuser", password="s3cret", dataset="testuser"
+        ):
+            person = Person("Marc", 24)
+            await person.a_make_persistent("test_async_client")
+            assert person.is_registered
+
+            await person.add_year.aio()
+            ages = await asyncio.gather(*(person.get_age.aio() for _ in range(10)))
+            assert ages == [25] * 10
+
+            same_person = await Person.a_get_by_alias("test_async_client")
+            assert same_person == person
+
+    try:
+        asyncio.run(main())
+    finally:
+        set_runtime(client.runtime)
+    assert "Already initialized" not in caplog.text
+
+
+def test_async_client_removed_backend(client):
+    """
+    Calls to objects with the hint of a removed backend are sent to their current backend
+    """
+
+    async def main():
+        async with await dataclay.async_client(
+            host="127.0.0.1", username="testuser", password="s3cret", dataset="testuser"
+        ) as async_client:
+            person = Person("Marc", 24)
+            await person.a_make_persistent()
+
+            # A backend removed after its client was created
+            removed_backend_id = uuid.uuid4()
+            runtime = async_client.runtime
+            runtime.aio_backend_clients[removed_backend_id] = AsyncBackendClient("127.0.0.1", 1)
+            person._dc_backend_id = removed_backend_id
+
+            assert await person.get_age.aio() == 24
+            assert removed_backend_id not in runtime.aio_backend_clients
+
+    try:
+        asyncio.run(main())
+    finally:
+        set_runtime(client.runtime)
@@ -0,0 +1,80 @@
+import os
+import pickle
+
+import pytest
+
+from dataclay.conf import settings
+from dataclay.contrib.modeltest.family import Person
+from dataclay.utils.compression import (
+    CODECS,
+    FRAME_HEADER,
+    FRAME_MAGIC,
+    CompressionPolicy,
+    compress,
+    decompress,
+    get_codec,
+)
+
+COMPRESSIBLE = b"dataClay " * 10000
+
+
+@pytest.fixture(params=list(CODECS))
+def codec(request):
+    try:
+        return get_codec(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+
+
+def test_compress_roundtrip(codec):
+    """Compressible data is framed with the codec id, and decompressed back"""
+    compressed = compress(COMPRESSIBLE, codec)
+    assert len(compressed) < len(COMPRESSIBLE)
+    assert FRAME_HEADER.unpack_from(compressed) == (FRAME_MAGIC, codec.id)
+    assert decompress(compressed) == COMPRESSIBLE
+
+
+def test_small_data_is_not_compressed(codec):
+    data = COMPRESSIBLE[: settings.COMPRESSION_THRESHOLD - 1]
+    assert compress(data, codec) is data
+
+
+def test_incompressible_data_is_not_compressed(codec):
+    """Incompressible data is kept as is, both when sampled and when not"""
+    for size in (settings.COMPRESSION_THRESHOLD, 1024 * 1024):
+        data = os.urandom(size)
+        assert compress(data, codec) is data
+
+
+def test_unframed_data_is_read_as_is():
+    """Data stored or sent without compression (e.g. legacy pickles) is read unchanged"""
+    data = pickle.dumps(list(range(10000)))
+    assert decompress(data) is data
+    assert decompress(b"") == b""
+
+
+def test_compression_policy():
+    policy = CompressionPolicy("none", "module.Large=zlib")
+    assert policy.compress(COMPRESSIBLE) is COMPRESSIBLE
+    assert policy.compress(COMPRESSIBLE, "module.Other") is COMPRESSIBLE
+    assert decompress(policy.compress(COMPRESSIBLE, "module.Large")) == COMPRESSIBLE
+
+    with pytest.raises(ValueError):
+        get_codec("unknown")
+
+
+def test_objects_in_compressed_backend(client):
+    """Objects are stored, copied and moved between backends with and without compression
+    (see the STORAGE_COMPRESSION and TRANSFER_COMPRESSION of the test deployment)"""
+    backends = client.get_backends()
+    backend_ids = list(backends)
+    for backend_id, next_backend_id in zip(backend_ids, backend_ids[1:] + backend_ids[:1]):
+        person = Person("Marc" * 10000, 24)
+        person.make_persistent(backend_id=backend_id)
+        backends[backend_id].flush_all()
+        assert person.name == "Marc" * 10000
+
+        assert person.dc_clone().name == person.name
+        person.move(next_backend_id)
+        backends[next_backend_id].flush_all()
+        assert person.name == "Marc" * 10000
@@ -0,0 +1,67 @@
+import gc
+
+import pytest
+
+from dataclay.contrib.modeltest.family import Dog, Person
+
+
+def test_get_by_id(client):
+    person = Person("Marc", 24)
+    person.make_persistent()
+    object_id = person._dc_id
+
+    del person
+    gc.collect()
+
+    person = Person.get_by_id(object_id)
+    assert person._dc_id == object_id
+    assert person.name == "Marc"
+
+
+def test_proxy_is_compact(client):
+    """Proxies keep the metadata in slots, and have no lock until it is needed"""
+    person = Person("Marc", 24)
+    person.make_persistent()
+    object_id = person._dc_id
+
+    del person
+    gc.collect()
+
+    person = Person.get_by_id(object_id)
+    assert not vars(person)
+    assert person._xdc_counter is None
+    assert person._dc_class is Person
+
+
+def test_get_by_ids(client):
+    """
+    The metadata of all the objects not in memory is obtained in a single call
+    """
+    object_ids = []
+    for i in range(10):
+        person = Person(f"Person {i}", i)
+        person.make_persistent()
+        object_ids.append(person._dc_id)
+
+    # Keep one of the objects in memory
+    person_0 = Person.get_by_id(object_ids[0])
+    del person
+    gc.collect()
+
+    persons = Person.get_by_ids(object_ids)
+    assert persons[0] is person_0
+    assert [person._dc_id for person in persons] == object_ids
+    assert [person.age for person in persons] == list(range(10))
+
+
+def test_get_by_ids_created_in_backend(client):
+    """
+    Objects created in a backend are registered before the activemethod returns
+    """
+    dog = Dog("Rio", 5)
+    dog.make_persistent()
+    puppy_ids = [dog.new_puppy(f"Puppy {i}")._dc_id for i in range(10)]
+    gc.collect()
+
+    puppies = Dog.get_by_ids(puppy_ids)
+    assert [puppy.name for puppy in puppies] == [f"Puppy {i}" for i in range(10)]
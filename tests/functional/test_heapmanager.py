@@ -1,6 +1,7 @@
 import pytest
 
 from dataclay.contrib.modeltest.family import Dog, Family, Person
+from dataclay.contrib.modeltest.matrix import Matrix
 
 
 def test_self_is_not_unloaded(client):
@@ -15,3 +16,78 @@ def test_reference_is_unloaded(client):
     family = Family()
     family.make_persistent()
     family.test_reference_is_unloaded()
+
+
+def test_heap_stats(client):
+    """Loaded objects are reported per class, with their approximate size"""
+    from dataclay.runtime import get_runtime
+
+    person = Person("Marc", 24)
+    person.make_persistent()
+
+    backend_client = get_runtime().get_backend_client(person._dc_backend_id)
+    heap_stats = backend_client.get_heap_stats()
+    class_stats = heap_stats["classes"]["dataclay.contrib.modeltest.family.Person"]
+    assert class_stats["num_objects"] >= 1
+    assert class_stats["resident_bytes"] > 0
+    assert 0 < heap_stats["memory_rss"] <= heap_stats["memory_limit"]
+    assert heap_stats["num_locks"] >= 0
+    assert all(count > 0 for count in heap_stats["lock_contention"].values())
+
+
+def test_clean_object_is_not_stored(client):
+    family = Family()
+    family.make_persistent()
+    family.test_clean_object_is_not_stored()
+
+
+def test_large_buffers_are_memory_mapped(client):
+    matrix = Matrix()
+    matrix.make_persistent()
+    matrix.test_large_buffers_are_memory_mapped()
+
+
+def test_properties_are_loaded_lazily(client):
+    matrix = Matrix()
+    matrix.make_persistent()
+    matrix.test_properties_are_loaded_lazily()
+
+
+def test_failed_activemethod_is_unloaded(client):
+    family = Family()
+    family.make_persistent()
+    family.test_failed_activemethod_is_unloaded()
+
+
+def test_object_size_is_cached(client):
+    family = Family()
+    family.make_persistent()
+    family.test_object_size_is_cached()
+
+
+def test_checkpoint_does_not_unload(client):
+    family = Family()
+    family.make_persistent()
+    family.test_checkpoint_does_not_unload()
+
+
+def test_object_locks_are_reclaimed():
+    """Object locks are removed when released, and can be tried with a timeout"""
+    import threading
+    import uuid
+
+    from dataclay.runtime import UUIDLock
+
+    object_id = uuid.uuid4()
+    num_locks = UUIDLock.num_locks()
+    with UUIDLock(object_id):
+        with UUIDLock(object_id):
+            acquired = []
+            thread = threading.Thread(
+                target=lambda: acquired.append(UUIDLock(object_id).acquire(timeout=0.1))
+            )
+            thread.start()
+            thread.join()
+            assert acquired == [False]
+    assert UUIDLock.num_locks() == num_locks
+    assert object_id in dict(UUIDLock.get_contention(UUIDLock.MAX_CONTENDED_IDS))
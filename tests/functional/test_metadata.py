@@ -0,0 +1,80 @@
+import uuid
+
+import pytest
+
+from dataclay.contrib.modeltest.family import Person
+from dataclay.metadata.api import MetadataAPI
+from dataclay.metadata.client import MetadataClient
+from dataclay.metadata.kvdata import STR_MAX_LENGTH, ObjectMetadata
+from dataclay.protos import metadata_service_pb2
+
+
+def test_objects_index(client):
+    """The index sets of objects are updated when an object is moved"""
+    metadata_api = MetadataAPI("127.0.0.1", 6379)
+    backend_ids = list(client.get_backends())
+
+    person = Person("Marc", 24)
+    person.make_persistent(backend_id=backend_ids[0])
+    object_ids = {
+        object_md.id for object_md in metadata_api.iter_objects(backend_id=backend_ids[0])
+    }
+    assert person._dc_id in object_ids
+
+    count = metadata_api.count_objects(backend_id=backend_ids[1])
+    person.move(backend_ids[1])
+    assert metadata_api.count_objects(backend_id=backend_ids[1]) == count + 1
+    object_ids = {
+        object_md.id for object_md in metadata_api.iter_objects(backend_id=backend_ids[0])
+    }
+    assert person._dc_id not in object_ids
+
+    class_name = "dataclay.contrib.modeltest.family.Person"
+    cursor, object_mds = metadata_api.scan_objects(class_name=class_name)
+    while cursor:
+        cursor, page = metadata_api.scan_objects(cursor, class_name=class_name)
+        object_mds.extend(page)
+    assert person._dc_id in {object_md.id for object_md in object_mds}
+
+
+def test_object_metadata_long_strings():
+    """Strings up to STR_MAX_LENGTH bytes are encoded, longer ones raise a ValueError"""
+    object_md = ObjectMetadata(
+        uuid.uuid4(), class_name="a" * STR_MAX_LENGTH, replica_backend_ids=[]
+    )
+    assert ObjectMetadata.from_value(object_md.value) == object_md
+
+    object_md.alias_name = "a" * (STR_MAX_LENGTH + 1)
+    with pytest.raises(ValueError):
+        object_md.value
+
+
+def test_close_session(client):
+    metadata_api = MetadataAPI("127.0.0.1", 6379)
+    session = metadata_api.new_session("testuser", "s3cret", "testuser")
+    assert metadata_api.get_session(session.id).is_active
+
+    metadata_api.close_session(session.id)
+    assert not metadata_api.get_session(session.id).is_active
+
+    # Closing it again is a no-op
+    metadata_api.close_session(session.id)
+    assert not metadata_api.get_session(session.id).is_active
+
+
+def test_backends_watchers_do_not_block_requests(client):
+    """Watching the backends does not hold a worker thread of the metadata service,
+    so more watchers than worker threads can be connected"""
+    metadata_client = MetadataClient("127.0.0.1", 16587)
+    request = metadata_service_pb2.GetAllBackendsRequest()
+    watchers = [metadata_client.stub.WatchBackends(request, timeout=30) for _ in range(64)]
+    try:
+        for watcher in watchers:
+            assert next(watcher).backends
+
+        response = metadata_client.stub.GetAllBackends(request, timeout=10)
+        assert response.backends
+    finally:
+        for watcher in watchers:
+            watcher.cancel()
+        metadata_client.close()
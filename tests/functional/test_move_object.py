@@ -1,3 +1,5 @@
+import gc
+
 import pytest
 
 from dataclay.contrib.modeltest.family import Dog, Family, Person
@@ -96,3 +98,22 @@ def test_wrong_backend_id(client):
     assert person._dc_backend_id == backend_ids[1]
     assert person.name == "Marc"
     assert person._dc_backend_id == backend_ids[0]
+
+
+def test_stale_backend_hint(client):
+    """References carry the backend_id of the object. If the object was moved,
+    the stale backend_id should be updated after first wrong call."""
+    backend_ids = list(client.get_backends())
+
+    person = Person("Marc", 24)
+    person.make_persistent(backend_id=backend_ids[0])
+    family = Family(person)
+    family.make_persistent(backend_id=backend_ids[2])
+    person.move(backend_ids[1])
+
+    del person
+    gc.collect()
+
+    person = family.members[0]
+    assert person.name == "Marc"
+    assert person._dc_backend_id == backend_ids[1]
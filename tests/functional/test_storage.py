@@ -0,0 +1,248 @@
+import os
+import pickle
+import uuid
+
+import pytest
+
+from dataclay.backend.storage import DELETE, PUT, FileStorage, LogStorage
+from dataclay.conf import settings
+
+
+@pytest.fixture(params=[LogStorage, FileStorage])
+def storage_class(request):
+    return request.param
+
+
+def reopen(storage):
+    """Opens the storage path again, without syncing or closing the storage (as in a crash)"""
+    if isinstance(storage, LogStorage):
+        storage._finished.set()
+    return type(storage)(storage.path)
+
+
+def test_blob_is_replaced_when_durable(tmp_path, storage_class):
+    """A new blob file doesn't replace the previous one until the data referring to it is
+    synced, so the stored data always matches its buffers"""
+    storage = storage_class(str(tmp_path))
+    object_id = uuid.uuid4()
+    storage.put(object_id, b"v1", [pickle.PickleBuffer(b"a" * 10)])
+    storage.sync()
+
+    # Crash after writing the new blob file, but before storing the data
+    storage.put_buffers(object_id, [pickle.PickleBuffer(b"b" * 10), pickle.PickleBuffer(b"c")])
+    storage = reopen(storage)
+    data, buffers = storage.get_with_buffers(object_id)
+    assert data == b"v1"
+    assert [bytes(buffer) for buffer in buffers] == [b"a" * 10]
+
+    # The previous blob file is removed on sync
+    storage.put(object_id, b"v2", [pickle.PickleBuffer(b"b" * 10), pickle.PickleBuffer(b"c")])
+    data, buffers = storage.get_with_buffers(object_id)
+    assert data == b"v2"
+    assert [bytes(buffer) for buffer in buffers] == [b"b" * 10, b"c"]
+    assert len(list((tmp_path / "blobs").iterdir())) > 1
+    storage.sync()
+    assert len(list((tmp_path / "blobs").iterdir())) == 1
+
+    storage.put(object_id, b"v3")
+    storage.sync()
+    assert storage.get_with_buffers(object_id) == (b"v3", [])
+    assert not list((tmp_path / "blobs").iterdir())
+    storage.close()
+
+
+def test_legacy_blob_is_read(tmp_path):
+    """Data stored without a blob version uses the unversioned blob file of the object"""
+    storage = FileStorage(str(tmp_path))
+    object_id = uuid.uuid4()
+    storage.put(object_id, b"data", [pickle.PickleBuffer(b"a" * 10)])
+    data = storage.get(object_id)
+    version = storage.blob_versions[object_id].pop()
+    os.rename(storage.get_blob_path(object_id, version), storage.get_blob_path(object_id))
+    (tmp_path / str(object_id)).write_bytes(data)
+
+    storage = LogStorage(str(tmp_path))
+    data, buffers = storage.get_with_buffers(object_id)
+    assert data == b"data"
+    assert [bytes(buffer) for buffer in buffers] == [b"a" * 10]
+    storage.close()
+
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(settings, "STORAGE_SEGMENT_SIZE", 1024)
+
+
+def test_log_storage_reopen(tmp_path, small_segments):
+    """Objects are found after reopening, from the footers of the sealed segments
+    and the records of the active segment"""
+    storage = LogStorage(str(tmp_path))
+    object_ids = [uuid.uuid4() for _ in range(50)]
+    for i, object_id in enumerate(object_ids):
+        storage.put(object_id, b"%d" % i * 20)
+    storage.put(object_ids[0], b"new")
+    storage.delete(object_ids[1])
+    assert storage.active > 0
+    storage.close()
+
+    storage = LogStorage(str(tmp_path))
+    assert storage.get(object_ids[0]) == b"new"
+    with pytest.raises(KeyError):
+        storage.get(object_ids[1])
+    for i, object_id in enumerate(object_ids[2:], 2):
+        assert storage.get(object_id) == b"%d" % i * 20
+    storage.close()
+
+
+def test_log_storage_truncates_torn_tail(tmp_path):
+    """An incomplete record at the end of the active segment is truncated when reopened"""
+    storage = LogStorage(str(tmp_path))
+    first_id, torn_id = uuid.uuid4(), uuid.uuid4()
+    storage.put(first_id, b"first")
+    storage.put(torn_id, b"torn" * 10)
+    storage.close()
+
+    path = storage.get_segment_path(storage.active)
+    size = os.path.getsize(path)
+    os.truncate(path, size - 5)
+
+    storage = LogStorage(str(tmp_path))
+    assert storage.get(first_id) == b"first"
+    with pytest.raises(KeyError):
+        storage.get(torn_id)
+    assert os.path.getsize(path) < size - 5
+
+    # New records are appended after the truncated one
+    storage.put(torn_id, b"again")
+    storage.close()
+    storage = LogStorage(str(tmp_path))
+    assert storage.get(torn_id) == b"again"
+    storage.close()
+
+
+def test_log_storage_seals_unsealed_segment(tmp_path, small_segments):
+    """A segment left without footer (crash while sealing) is scanned and sealed"""
+    storage = LogStorage(str(tmp_path))
+    object_ids = [uuid.uuid4() for _ in range(50)]
+    for object_id in object_ids:
+        storage.put(object_id, object_id.bytes * 8)
+    storage.close()
+    assert storage.active > 1
+
+    path = storage.get_segment_path(0)
+    footer_offset = storage.segment_sizes[0]
+    os.truncate(path, footer_offset)
+
+    storage = LogStorage(str(tmp_path))
+    assert storage.read_footer(0) is not None
+    for object_id in object_ids:
+        assert storage.get(object_id) == object_id.bytes * 8
+    storage.close()
+
+
+def test_log_storage_compaction(tmp_path, small_segments, monkeypatch):
+    """Compaction rewrites the live objects of the segments with garbage, drops the
+    overwritten and deleted ones, and removes the compacted segments"""
+    monkeypatch.setattr(settings, "STORAGE_COMPACTION_THRESHOLD", 0.5)
+    storage = LogStorage(str(tmp_path))
+    object_ids = [uuid.uuid4() for _ in range(50)]
+    for object_id in object_ids:
+        storage.put(object_id, b"old" * 20)
+    for object_id in object_ids[:20]:
+        storage.put(object_id, b"new" * 20)
+    for object_id in object_ids[20:40]:
+        storage.delete(object_id)
+    garbage_segments = [
+        number
+        for number, size in storage.segment_sizes.items()
+        if number != storage.active and storage.garbage[number] >= size * 0.5
+    ]
+    assert garbage_segments
+
+    storage.compact()
+    for number in garbage_segments:
+        assert number not in storage.segment_sizes
+        assert not os.path.exists(storage.get_segment_path(number))
+    storage.close()
+
+    storage = LogStorage(str(tmp_path))
+    for object_id in object_ids[:20]:
+        assert storage.get(object_id) == b"new" * 20
+    for object_id in object_ids[20:40]:
+        with pytest.raises(KeyError):
+            storage.get(object_id)
+    for object_id in object_ids[40:]:
+        assert storage.get(object_id) == b"old" * 20
+    storage.close()
+
+
+def iter_records(storage):
+    """Yields the (object_id, kind) of the records of all the segments"""
+    for number in sorted(storage.segment_sizes):
+        if number == storage.active:
+            entries = storage.active_entries
+        else:
+            entries = storage.read_footer(number)
+        for object_id, kind, _, _ in entries:
+            yield object_id, kind
+
+
+def test_log_storage_compaction_drops_tombstones(tmp_path, small_segments, monkeypatch):
+    """Tombstones are rewritten while an older segment has a record of the object,
+    and dropped once the older segments are compacted"""
+    monkeypatch.setattr(settings, "STORAGE_COMPACTION_THRESHOLD", 0.5)
+    storage = LogStorage(str(tmp_path))
+    live_id, kept_id, deleted_id, temp_id = (uuid.uuid4() for _ in range(4))
+
+    # Segments: [live] [deleted, kept] [tombstone, temp] [temp]
+    storage.put(live_id, b"x" * 950)
+    storage.put(deleted_id, b"x" * 40)
+    storage.put(kept_id, b"x" * 900)
+    storage.delete(deleted_id)
+    storage.put(temp_id, b"x" * 900)
+    storage.put(temp_id, b"x" * 900)
+    assert len(storage.segment_sizes) == 4
+
+    # The segment of the tombstone is compacted, but not the one of the object
+    storage.compact()
+    assert len(storage.segment_sizes) == 3
+    assert (deleted_id, DELETE) in iter_records(storage)
+
+    # Once the segment of the object is compacted, the tombstone is dropped
+    storage.put(kept_id, b"y" * 900)
+    storage.put(temp_id, b"x" * 900)
+    storage.compact()
+    assert all(object_id != deleted_id for object_id, _ in iter_records(storage))
+    storage.close()
+
+    storage = LogStorage(str(tmp_path))
+    with pytest.raises(KeyError):
+        storage.get(deleted_id)
+    assert storage.get(kept_id) == b"y" * 900
+    assert storage.get(live_id) == b"x" * 950
+    storage.close()
+
+
+def test_log_storage_compaction_keeps_read_fds(tmp_path, small_segments, monkeypatch):
+    """The file descriptor of a compacted segment is closed when its last reader ends"""
+    monkeypatch.setattr(settings, "STORAGE_COMPACTION_THRESHOLD", 0.5)
+    storage = LogStorage(str(tmp_path))
+    object_id = uuid.uuid4()
+    storage.put(object_id, b"x" * 900)
+    storage.put(object_id, b"y" * 900)
+    storage.put(uuid.uuid4(), b"z" * 900)
+
+    # A reader is using the segment while it is compacted
+    number = storage.index[object_id][0] - 1
+    fd = storage.fds[number]
+    storage.fd_readers[fd] += 1
+    storage.compact()
+    assert number not in storage.fds
+    os.fstat(fd)
+
+    storage.release_fd(fd)
+    assert fd not in storage.retired_fds
+    with pytest.raises(OSError):
+        os.fstat(fd)
+    assert storage.get(object_id) == b"y" * 900
+    storage.close()
@@ -43,3 +43,14 @@ def test_dc_update_by_alias(client):
     Person.dc_update_by_alias("test_dc_update_by_alias", new_person)
     assert person.name == new_person.name
     assert person.age == new_person.age
+
+
+def test_dc_clone_and_update_large_object(client):
+    # NOTE: Large enough to be compressed with STORAGE_COMPRESSION or TRANSFER_COMPRESSION
+    person = Person("Marc" * 10000, 24)
+    person.dc_put("test_dc_clone_and_update_large_object")
+    copy = person.dc_clone()
+    assert copy.name == person.name
+    new_person = Person("Alice" * 10000, 32)
+    person.dc_update(new_person)
+    assert person.name == new_person.name